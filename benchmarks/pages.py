@@ -0,0 +1,214 @@
+"""Synthetic list pages shaped like the boards the sources parse.
+
+Every generator is deterministic: row ``i`` of board ``b`` always gets the same title,
+URL and date, so a page is identical across runs and machines. Rows are newest first,
+five per day, and every other title carries a recruitment keyword. ``first_row`` lets
+a caller cut one long board into list pages; ``board`` keeps notice URLs of different
+boards apart when they share a host.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from datetime import date, timedelta
+from html import escape
+
+NEWEST_DATE = date(2026, 2, 16)
+ROWS_PER_DAY = 5
+
+MATCHING_TITLE = "제안서 평가위원(후보자) 공개모집 공고"
+OTHER_TITLE = "도로명주소 고시"
+DEPARTMENTS: tuple[str, ...] = ("행정지원과", "도시정비과", "건축과", "토지정보과")
+
+PageBuilder = Callable[..., str]
+
+
+def row_date(index: int, *, newest: date = NEWEST_DATE) -> date:
+    return newest - timedelta(days=index // ROWS_PER_DAY)
+
+
+def oldest_date(rows: int, *, newest: date = NEWEST_DATE) -> date:
+    return row_date(max(rows - 1, 0), newest=newest)
+
+
+def matching_rows(rows: int) -> int:
+    return (rows + 1) // 2
+
+
+def row_title(index: int) -> str:
+    title = MATCHING_TITLE if index % 2 == 0 else OTHER_TITLE
+    return f"{title} 제{index}호"
+
+
+def egov_bbs_html(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """Table board like ``selectBbsNttList.do`` on eGovFrame sites."""
+    body = "".join(
+        "<tr>"
+        f"<td>{_row_id(index, board)}</td>"
+        '<td class="subject">'
+        f'<a href="/www/selectBbsNttView.do?bbsNo=18&amp;nttNo={_row_id(index, board)}">'
+        f"{escape(row_title(index))}</a></td>"
+        f"<td>{DEPARTMENTS[index % len(DEPARTMENTS)]}</td>"
+        f"<td>{row_date(index, newest=newest).isoformat()}</td>"
+        "</tr>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _html_page(f'<table class="board_list"><tbody>\n{body}</tbody></table>')
+
+
+def saeol_gosi_html(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """Saeol gosi board, whose rows open notices through a javascript handler."""
+    body = "".join(
+        "<tr>"
+        f"<td>{_row_id(index, board)}</td>"
+        f'<td><a href="#" onclick="fn_search_detail(\'{_row_id(index, board)}\');'
+        f' return false;">{escape(row_title(index))}</a></td>'
+        f"<td>{row_date(index, newest=newest).strftime('%Y.%m.%d')}</td>"
+        "</tr>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _html_page(f"<table><tbody>\n{body}</tbody></table>")
+
+
+def citynet_sapgosi_html(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """CityNet ``sapgosiBizProcess.do`` board."""
+    body = "".join(
+        "<tr>"
+        f"<td>{_row_id(index, board)}</td>"
+        '<td><a href="/sapgosiBizProcess.do?command=searchDetail&amp;'
+        f'sno={_row_id(index, board)}">{escape(row_title(index))}</a></td>'
+        f"<td>{row_date(index, newest=newest).strftime('%Y/%m/%d')}</td>"
+        "</tr>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _html_page(f"<table><tbody>\n{body}</tbody></table>")
+
+
+def eminwon_html(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """Eminwon ``selectEminwonList.do`` board, as served by Pocheon."""
+    body = "".join(
+        "<tr>"
+        f"<td>{_row_id(index, board)}</td>"
+        '<td style="text-align:left;">'
+        f"공고 제2026-{_row_id(index, board)}호<br />"
+        '<a href="./selectEminwonView.do?pageUnit=10'
+        f'&amp;notAncmtMgtNo={_row_id(index, board)}&amp;notAncmtSeCode=01">'
+        f"{escape(row_title(index))}</a></td>"
+        f"<td>{DEPARTMENTS[index % len(DEPARTMENTS)]}</td>"
+        f"<td>{row_date(index, newest=newest).isoformat()}</td>"
+        "</tr>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _html_page(f'<table class="bbs_default list"><tbody>\n{body}</tbody></table>')
+
+
+def json_list(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """JSON list API answering ``{"resultList": [...]}``."""
+    return json.dumps(
+        {
+            "resultList": [
+                {
+                    "nttSj": row_title(index),
+                    "bbsNo": "18",
+                    "nttNo": str(_row_id(index, board)),
+                    "frstRegisterPnttm": row_date(index, newest=newest).isoformat(),
+                    "deptNm": DEPARTMENTS[index % len(DEPARTMENTS)],
+                }
+                for index in range(first_row, first_row + rows)
+            ]
+        },
+        ensure_ascii=False,
+    )
+
+
+def municipal_rss(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """eGovFrame ``rssBbsNtt.do`` feed with ``pubDate``."""
+    items = "".join(
+        "<item>"
+        f"<title><![CDATA[{row_title(index)}]]></title>"
+        f"<link>/www/selectBbsNttView.do?bbsNo=31&amp;nttNo={_row_id(index, board)}</link>"
+        f"<pubDate>{row_date(index, newest=newest).isoformat()}</pubDate>"
+        "<description><![CDATA[상세 내용은 첨부파일을 참고하세요.]]></description>"
+        "</item>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _rss_feed(items)
+
+
+def seongbuk_rss(
+    rows: int,
+    *,
+    newest: date = NEWEST_DATE,
+    first_row: int = 0,
+    board: int = 1,
+) -> str:
+    """Seongbuk ``gosiToRss.do`` feed with ``regdate`` and ``writer``."""
+    items = "".join(
+        "<item>"
+        f"<no>{_row_id(index, board)}</no>"
+        f"<title>{escape(row_title(index))}</title>"
+        f"<writer>{DEPARTMENTS[index % len(DEPARTMENTS)]}</writer>"
+        f"<regdate>{row_date(index, newest=newest).isoformat()} 09:00:00</regdate>"
+        f"<link>/www/notice/{_row_id(index, board)}</link>"
+        "</item>\n"
+        for index in range(first_row, first_row + rows)
+    )
+    return _rss_feed(items)
+
+
+def _row_id(index: int, board: int) -> int:
+    return board * 1_000_000 + index
+
+
+def _html_page(content: str) -> str:
+    return (
+        '<!doctype html>\n<html lang="ko">\n<head><meta charset="utf-8" />'
+        "<title>고시공고</title>"
+        "<script>function fn_search_detail(no) { location.href = no; }</script>"
+        f"</head>\n<body>\n{content}\n</body>\n</html>\n"
+    )
+
+
+def _rss_feed(items: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">\n'
+        f"<channel><title>고시공고</title>\n{items}</channel>\n</rss>\n"
+    )
@@ -0,0 +1,329 @@
+"""Parser micro-benchmarks over synthetic list pages.
+
+Usage::
+
+    python -m benchmarks.parsers                       # compare with the stored baseline
+    python -m benchmarks.parsers --sizes 10,100        # quick run
+    python -m benchmarks.parsers --update-baseline     # record new reference numbers
+    python -m benchmarks.parsers --case generic_engine.saeol   # html.parser vs lxml
+
+Generic engine HTML cases pin the stdlib html.parser backend so the baseline does not
+depend on what is installed; their ``@lxml`` twins run when lxml is available.
+Throughput is the best of several timed runs; peak memory is measured in a separate
+traced run, because tracemalloc itself slows parsing down considerably.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from benchmarks import pages
+from judgefinder.adapters.sources.generic_engine.parser import parse_generic_engine_candidates
+from judgefinder.adapters.sources.html_backend import (
+    LXML_BACKEND,
+    STDLIB_BACKEND,
+    available_html_backends,
+)
+from judgefinder.adapters.sources.municipal_rss.parser import parse_municipal_rss_notices_between
+from judgefinder.adapters.sources.pocheon_eminwon.parser import extract_pocheon_eminwon_rows
+from judgefinder.adapters.sources.seongbuk.parser import parse_seongbuk_notices_between
+from judgefinder.domain.entities import SourceType
+from judgefinder.domain.source_profiles import EngineType
+
+DEFAULT_SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000)
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "parsers.json"
+DEFAULT_TOLERANCE = 0.25
+
+FETCHED_AT = datetime(2026, 2, 16, 12, 0, tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+@dataclass(frozen=True, slots=True)
+class ParserCase:
+    """One parser fed one page shape; ``parse`` returns how many rows it extracted.
+
+    RSS parsers apply the recruitment keywords themselves, so they only keep the rows
+    whose title matches (every other row of a synthetic page).
+    """
+
+    name: str
+    build_page: Callable[[int], str]
+    parse: Callable[[str, int], int]
+    keyword_filtered: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    case: str
+    rows: int
+    parsed_rows: int
+    seconds_per_page: float
+    peak_bytes: int
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds_per_page if self.seconds_per_page > 0 else 0.0
+
+
+def _generic_case(
+    name: str,
+    build_page: Callable[..., str],
+    engine_type: EngineType,
+    list_url: str,
+    html_backend: str = STDLIB_BACKEND,
+) -> ParserCase:
+    def parse(page: str, rows: int) -> int:
+        return len(
+            parse_generic_engine_candidates(
+                page,
+                list_url=list_url,
+                engine_type=engine_type,
+                html_backend=html_backend,
+            )
+        )
+
+    return ParserCase(name=name, build_page=build_page, parse=parse)
+
+
+def _generic_html_cases(
+    name: str, build_page: Callable[..., str], engine_type: EngineType, list_url: str
+) -> tuple[ParserCase, ...]:
+    cases = [_generic_case(name, build_page, engine_type, list_url)]
+    if LXML_BACKEND in available_html_backends():
+        cases.append(_generic_case(f"{name}@lxml", build_page, engine_type, list_url, LXML_BACKEND))
+    return tuple(cases)
+
+
+def _parse_municipal_rss(page: str, rows: int) -> int:
+    return len(
+        parse_municipal_rss_notices_between(
+            page,
+            municipality="하남시",
+            list_url="https://www.hanam.go.kr/www/selectBbsNttList.do?bbsNo=31",
+            start_date=pages.oldest_date(rows),
+            end_date=pages.NEWEST_DATE,
+            fetched_at=FETCHED_AT,
+            source_type=SourceType.API,
+        )
+    )
+
+
+def _parse_seongbuk(page: str, rows: int) -> int:
+    return len(
+        parse_seongbuk_notices_between(
+            page,
+            municipality="성북구",
+            list_url="https://www.sb.go.kr/www/gosiToRss.do",
+            start_date=pages.oldest_date(rows),
+            end_date=pages.NEWEST_DATE,
+            fetched_at=FETCHED_AT,
+            source_type=SourceType.API,
+        )
+    )
+
+
+def _parse_pocheon_eminwon(page: str, rows: int) -> int:
+    return len(
+        extract_pocheon_eminwon_rows(
+            page,
+            list_url="https://www.pocheon.go.kr/www/selectEminwonList.do?key=12563",
+        )
+    )
+
+
+CASES: tuple[ParserCase, ...] = (
+    *_generic_html_cases(
+        "generic_engine.egov_bbs",
+        pages.egov_bbs_html,
+        EngineType.GENERIC_EGOV_BBS,
+        "https://www.city.go.kr/www/selectBbsNttList.do?bbsNo=18&key=1",
+    ),
+    *_generic_html_cases(
+        "generic_engine.saeol_gosi",
+        pages.saeol_gosi_html,
+        EngineType.SAEOL_GOSI,
+        "https://www.city.go.kr/portal/saeol/gosiList.do?mId=0301",
+    ),
+    *_generic_html_cases(
+        "generic_engine.citynet_sapgosi",
+        pages.citynet_sapgosi_html,
+        EngineType.CITYNET_SAPGOSI,
+        "https://www.city.go.kr/sapgosiBizProcess.do?command=searchList",
+    ),
+    _generic_case(
+        "generic_engine.json_list",
+        pages.json_list,
+        EngineType.JSON_LIST_API,
+        "https://www.city.go.kr/api/gosiList.json",
+    ),
+    ParserCase("municipal_rss", pages.municipal_rss, _parse_municipal_rss, keyword_filtered=True),
+    ParserCase("seongbuk", pages.seongbuk_rss, _parse_seongbuk, keyword_filtered=True),
+    ParserCase("pocheon_eminwon", pages.eminwon_html, _parse_pocheon_eminwon),
+)
+
+
+def measure(case: ParserCase, rows: int, *, repeat: int = 3) -> Measurement:
+    page = case.build_page(rows)
+    parsed_rows = case.parse(page, rows)
+
+    timer = timeit.Timer(lambda: case.parse(page, rows))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        case.parse(page, rows)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        case=case.name,
+        rows=rows,
+        parsed_rows=parsed_rows,
+        seconds_per_page=best,
+        peak_bytes=max(peak - before, 0),
+    )
+
+
+def compare(
+    measurements: Sequence[Measurement],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Describe every measurement that is slower or heavier than the baseline allows."""
+    regressions: list[str] = []
+    for measurement in measurements:
+        reference = baseline.get(measurement.case, {}).get(str(measurement.rows))
+        if reference is None:
+            continue
+        label = f"{measurement.case} @ {measurement.rows} rows"
+        expected_rate = reference["rows_per_second"]
+        if measurement.rows_per_second < expected_rate * (1 - tolerance):
+            regressions.append(
+                f"{label}: {measurement.rows_per_second:,.0f} rows/s "
+                f"(baseline {expected_rate:,.0f})"
+            )
+        expected_peak = reference["peak_bytes"]
+        if measurement.peak_bytes > expected_peak * (1 + tolerance):
+            regressions.append(
+                f"{label}: peak {measurement.peak_bytes:,} bytes (baseline {expected_peak:,.0f})"
+            )
+        if measurement.parsed_rows != reference.get("parsed_rows", measurement.parsed_rows):
+            regressions.append(
+                f"{label}: parsed {measurement.parsed_rows} rows "
+                f"(baseline {reference['parsed_rows']:.0f})"
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, dict[str, float]]]:
+    if not path.exists():
+        return {}
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    results = raw.get("results", {}) if isinstance(raw, dict) else {}
+    return results if isinstance(results, dict) else {}
+
+
+def save_baseline(path: Path, measurements: Sequence[Measurement]) -> None:
+    results = load_baseline(path)
+    for measurement in measurements:
+        results.setdefault(measurement.case, {})[str(measurement.rows)] = {
+            "rows_per_second": round(measurement.rows_per_second, 1),
+            "peak_bytes": measurement.peak_bytes,
+            "parsed_rows": measurement.parsed_rows,
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.parsers", description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma separated row counts per synthetic page.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="Only run cases whose name starts with this prefix (repeatable).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative slowdown or memory growth before a run counts as a regression.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing.",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    cases = [
+        case
+        for case in CASES
+        if not args.case or any(case.name.startswith(prefix) for prefix in args.case)
+    ]
+    baseline = load_baseline(args.baseline)
+
+    measurements: list[Measurement] = []
+    print(f"{'case':<36} {'rows':>7} {'rows/s':>12} {'peak KiB':>10} {'vs base':>8}")
+    for case in cases:
+        for rows in sizes:
+            measurement = measure(case, rows, repeat=args.repeat)
+            measurements.append(measurement)
+            reference = baseline.get(case.name, {}).get(str(rows))
+            change = (
+                f"{measurement.rows_per_second / reference['rows_per_second'] - 1:+.0%}"
+                if reference
+                else "-"
+            )
+            print(
+                f"{case.name:<36} {rows:>7} {measurement.rows_per_second:>12,.0f} "
+                f"{measurement.peak_bytes / 1024:>10,.0f} {change:>8}"
+            )
+
+    if args.update_baseline:
+        save_baseline(args.baseline, measurements)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(measurements, baseline, tolerance=args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,707 @@
+"""Local web farm of synthetic municipality boards for end-to-end load tests.
+
+One asyncio process listens on ``--hosts`` loopback ports and serves ``--municipalities``
+virtual boards spread over them, using the page shapes in ``benchmarks.pages``. Every
+engine the collector understands is represented: the generic engines (saeol, eminwon,
+citynet, eGov bbs, JSON list) and the dedicated Seongbuk, Pocheon and RSS sources, which
+take their real slugs. Responses can be slowed down by a latency distribution, fail at
+a given rate, and be throttled with 429 per host.
+
+Usage::
+
+    # Serve 245 boards and write a collector config pointing at them
+    python -m benchmarks.webfarm serve --municipalities 245 --config-out farm/config.toml
+    judgefinder --config-path farm/config.toml collect --workers 16
+
+    # Run cold and warm collects against a fresh farm for several worker counts
+    python -m benchmarks.webfarm bench --municipalities 2000 --hosts 200 --workers 8,32,64
+
+``GET /_farm/stats`` on any farm port answers request counters as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import math
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import SplitResult, parse_qs, urlsplit
+from zoneinfo import ZoneInfo
+
+from benchmarks import pages
+from judgefinder.adapters.source_registry import MUNICIPAL_RSS_SLUGS
+
+LOGGER = logging.getLogger(__name__)
+
+LOOPBACK = "127.0.0.1"
+STATS_PATH = "/_farm/stats"
+PAGE_PARAMS: tuple[str, ...] = ("pageIndex", "pageNo", "page", "nowPage")
+FARM_TIMEZONE = "Asia/Seoul"
+
+
+@dataclass(frozen=True, slots=True)
+class BoardKind:
+    """How one engine lays out its list: page shape, list path and collector config."""
+
+    name: str
+    build_page: pages.PageBuilder
+    list_path: str
+    content_type: str
+    source_type: str = "html"
+    engine_type: str = ""
+    paged: bool = True
+
+
+GENERIC_KINDS: tuple[BoardKind, ...] = (
+    BoardKind(
+        "generic_egov_bbs",
+        pages.egov_bbs_html,
+        "www/selectBbsNttList.do?bbsNo=18&key=1",
+        "text/html; charset=utf-8",
+        engine_type="generic_egov_bbs",
+    ),
+    BoardKind(
+        "saeol_gosi",
+        pages.saeol_gosi_html,
+        "portal/saeol/gosiList.do?mId=0301",
+        "text/html; charset=utf-8",
+        engine_type="saeol_gosi",
+    ),
+    BoardKind(
+        "citynet_sapgosi",
+        pages.citynet_sapgosi_html,
+        "sapgosiBizProcess.do?command=searchList",
+        "text/html; charset=utf-8",
+        engine_type="citynet_sapgosi",
+    ),
+    BoardKind(
+        "eminwon_ofr",
+        pages.eminwon_html,
+        "emwp/gov/mogaha/ntis/web/ofr/action/OfrAction.do",
+        "text/html; charset=utf-8",
+        engine_type="eminwon_ofr",
+    ),
+    BoardKind(
+        "json_list_api",
+        pages.json_list,
+        "api/gosiList.json",
+        "application/json; charset=utf-8",
+        source_type="api",
+        engine_type="json_list_api",
+    ),
+)
+SEONGBUK_KIND = BoardKind(
+    "seongbuk",
+    pages.seongbuk_rss,
+    "www/gosiToRss.do",
+    "application/xml; charset=utf-8",
+    source_type="api",
+)
+POCHEON_KIND = BoardKind(
+    "pocheon",
+    pages.eminwon_html,
+    "www/selectEminwonList.do?key=12563&notAncmtSeCode=01",
+    "text/html; charset=utf-8",
+    source_type="api",
+)
+RSS_KIND = BoardKind(
+    "municipal_rss",
+    pages.municipal_rss,
+    "rssBbsNtt.do?bbsNo=31",
+    "application/xml; charset=utf-8",
+    source_type="api",
+    # These feeds list the whole board in one document.
+    paged=False,
+)
+# Sources with their own adapter are only built for these slugs, so the first boards
+# of every farm take them; the remaining boards cycle through the generic engines.
+DEDICATED_BOARDS: tuple[tuple[str, BoardKind], ...] = (
+    ("seongbuk", SEONGBUK_KIND),
+    ("pocheon", POCHEON_KIND),
+    *((slug, RSS_KIND) for slug in sorted(MUNICIPAL_RSS_SLUGS)),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyModel:
+    """Response delay in seconds; ``fixed:MS``, ``uniform:LOW_MS,HIGH_MS`` or
+    ``lognormal:MEDIAN_MS,SIGMA`` (a long right tail, like slow municipal servers)."""
+
+    kind: str
+    first: float
+    second: float = 0.0
+
+    @classmethod
+    def parse(cls, raw: str) -> LatencyModel:
+        kind, _, values = raw.partition(":")
+        try:
+            numbers = [float(value) for value in values.split(",") if value.strip()]
+        except ValueError as exc:
+            raise ValueError(f"Invalid latency '{raw}'.") from exc
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}.get(kind)
+        if expected is None or len(numbers) != expected or any(n < 0 for n in numbers):
+            raise ValueError(
+                f"Invalid latency '{raw}'; "
+                "use fixed:MS, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA."
+            )
+        return cls(kind, *numbers)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.first, self.second) / 1000
+        if self.kind == "lognormal":
+            if self.first == 0:
+                return 0.0
+            return rng.lognormvariate(math.log(self.first), self.second) / 1000
+        return self.first / 1000
+
+
+@dataclass(frozen=True, slots=True)
+class FarmSettings:
+    municipalities: int = 245
+    hosts: int = 0
+    list_pages: int = 5
+    rows_per_page: int = 10
+    latency: LatencyModel = field(default_factory=lambda: LatencyModel("fixed", 0.0))
+    error_rate: float = 0.0
+    throttle_rps: float = 0.0
+    throttle_burst: int = 5
+    seed: int = 0
+    newest: date = pages.NEWEST_DATE
+
+    def __post_init__(self) -> None:
+        if self.municipalities < 1 or self.list_pages < 1 or self.rows_per_page < 1:
+            raise ValueError("municipalities, list_pages and rows_per_page must be at least 1.")
+        if not 0 <= self.error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+    @property
+    def host_count(self) -> int:
+        """One port per municipality unless ``hosts`` packs several boards on a port."""
+        hosts = self.hosts or self.municipalities
+        return max(1, min(hosts, self.municipalities))
+
+
+@dataclass(frozen=True, slots=True)
+class Board:
+    slug: str
+    municipality: str
+    kind: BoardKind
+    host: int
+    number: int
+
+
+def plan_boards(settings: FarmSettings) -> list[Board]:
+    boards: list[Board] = []
+    for number in range(settings.municipalities):
+        if number < len(DEDICATED_BOARDS):
+            slug, kind = DEDICATED_BOARDS[number]
+        else:
+            slug = f"farm{number:04d}"
+            kind = GENERIC_KINDS[number % len(GENERIC_KINDS)]
+        boards.append(
+            Board(
+                slug=slug,
+                municipality=f"가상시{number:04d}",
+                kind=kind,
+                host=number % settings.host_count,
+                number=number + 1,
+            )
+        )
+    return boards
+
+
+def list_url(board: Board, ports: Sequence[int]) -> str:
+    return f"http://{LOOPBACK}:{ports[board.host]}/{board.slug}/{board.kind.list_path}"
+
+
+def render_config(
+    boards: Sequence[Board],
+    ports: Sequence[int],
+    *,
+    db_path: Path,
+    collection: dict[str, object] | None = None,
+) -> str:
+    """Collector config that enables every board of the farm."""
+    lines = [
+        f'timezone = "{FARM_TIMEZONE}"',
+        f"db_path = {json.dumps(db_path.as_posix())}",
+        f"enabled_sources = {json.dumps([board.slug for board in boards])}",
+        "",
+        "[collection]",
+    ]
+    for key, value in (collection or {}).items():
+        lines.append(f"{key} = {json.dumps(value)}")
+    for board in boards:
+        lines.extend(
+            [
+                "",
+                f"[sources.{board.slug}]",
+                f'municipality = "{board.municipality}"',
+                f'source_type = "{board.kind.source_type}"',
+                f"list_url = {json.dumps(list_url(board, ports))}",
+            ]
+        )
+        if board.kind.engine_type:
+            lines.append(f'engine_type = "{board.kind.engine_type}"')
+    return "\n".join(lines) + "\n"
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._capacity = float(max(burst, 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+@dataclass(slots=True)
+class FarmStats:
+    requests: int = 0
+    bytes_sent: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+        }
+
+
+class WebFarm:
+    """Serve every board of ``settings`` from one event loop."""
+
+    def __init__(self, settings: FarmSettings) -> None:
+        self.settings = settings
+        self.boards = plan_boards(settings)
+        self.stats = FarmStats()
+        self.ports: list[int] = []
+        self._boards_by_slug = {board.slug: board for board in self.boards}
+        self._rng = random.Random(settings.seed)
+        self._buckets = (
+            [
+                _TokenBucket(settings.throttle_rps, settings.throttle_burst)
+                for _ in range(settings.host_count)
+            ]
+            if settings.throttle_rps > 0
+            else []
+        )
+        self._servers: list[asyncio.Server] = []
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    def list_url(self, board: Board) -> str:
+        return list_url(board, self.ports)
+
+    def render_config(self, *, db_path: Path, collection: dict[str, object] | None = None) -> str:
+        return render_config(self.boards, self.ports, db_path=db_path, collection=collection)
+
+    async def start(self, *, base_port: int = 0) -> None:
+        for host in range(self.settings.host_count):
+            server = await asyncio.start_server(
+                functools.partial(self._serve_connection, host=host),
+                host=LOOPBACK,
+                port=base_port + host if base_port else 0,
+            )
+            self._servers.append(server)
+            self.ports.append(server.sockets[0].getsockname()[1])
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+        # Kept-alive client connections would otherwise outlive the servers.
+        for writer in list(self._connections.values()):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+    async def _serve_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        *,
+        host: int,
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections[task] = writer
+            task.add_done_callback(lambda done: self._connections.pop(done, None))
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                method, target, _ = (request_line.split(" ", 2) + ["", ""])[:3]
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (line.partition(":") for line in header_lines)
+                }
+                status, extra_headers, body = await self._respond(host, method, target, headers)
+                writer.write(_encode_response(status, extra_headers, body))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(
+        self,
+        host: int,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+    ) -> tuple[int, dict[str, str], bytes]:
+        parsed = urlsplit(target)
+        if parsed.path == STATS_PATH:
+            return 200, {"Content-Type": "application/json"}, _json_bytes(self.stats.as_dict())
+
+        self.stats.requests += 1
+        status, extra_headers, body = self._build_response(host, method, parsed, headers)
+        delay = self.settings.latency.sample(self._rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.stats.statuses[status] += 1
+        self.stats.bytes_sent += len(body)
+        return status, extra_headers, body
+
+    def _build_response(
+        self,
+        host: int,
+        method: str,
+        parsed: SplitResult,
+        headers: dict[str, str],
+    ) -> tuple[int, dict[str, str], bytes]:
+        if method != "GET":
+            return 405, {"Allow": "GET"}, b""
+        if self._buckets and not self._buckets[host].take():
+            return 429, {"Retry-After": "1"}, b""
+        if self.settings.error_rate and self._rng.random() < self.settings.error_rate:
+            return self._rng.choice((500, 502, 503)), {}, b""
+
+        slug = parsed.path.strip("/").split("/", 1)[0]
+        board = self._boards_by_slug.get(slug)
+        if board is None or board.host != host:
+            return 404, {}, b""
+        page_index = _page_index(parsed.query)
+        rows_per_page = self.settings.rows_per_page
+        rows = rows_per_page if page_index <= self.settings.list_pages else 0
+        if not board.kind.paged:
+            page_index, rows = 1, rows_per_page * self.settings.list_pages
+        body = board.kind.build_page(
+            rows,
+            newest=self.settings.newest,
+            first_row=(page_index - 1) * rows_per_page,
+            board=board.number,
+        ).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"Content-Type": board.kind.content_type, "ETag": etag}, body
+
+
+@contextlib.contextmanager
+def running_farm(settings: FarmSettings) -> Iterator[WebFarm]:
+    """Run a farm on a background event loop for the duration of the block."""
+    loop = asyncio.new_event_loop()
+    farm = WebFarm(settings)
+    thread = threading.Thread(target=loop.run_forever, name="webfarm", daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(farm.start(), loop).result()
+        yield farm
+    finally:
+        asyncio.run_coroutine_threadsafe(farm.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _page_index(query: str) -> int:
+    params = parse_qs(query)
+    for name in PAGE_PARAMS:
+        values = params.get(name)
+        if values and values[0].isdigit():
+            return max(int(values[0]), 1)
+    return 1
+
+
+def _encode_response(status: int, headers: dict[str, str], body: bytes) -> bytes:
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _json_bytes(value: object) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+def _raise_open_file_limit() -> None:
+    # Every port and every kept-alive connection is a file descriptor.
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def _serve(settings: FarmSettings, *, base_port: int, config_out: Path | None) -> None:
+    farm = WebFarm(settings)
+    await farm.start(base_port=base_port)
+    if config_out is not None:
+        config_out.parent.mkdir(parents=True, exist_ok=True)
+        config_out.write_text(
+            farm.render_config(db_path=config_out.parent / "data" / "farm.db"),
+            encoding="utf-8",
+        )
+    # The first stdout line tells a parent process where every board lives.
+    print(
+        json.dumps({"ports": farm.ports, "boards": [farm.list_url(b) for b in farm.boards]}),
+        flush=True,
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(json.dumps(farm.stats.as_dict()), file=sys.stderr, flush=True)
+        await farm.close()
+
+
+def _fetch_stats(port: int) -> dict[str, object]:
+    with urllib.request.urlopen(f"http://{LOOPBACK}:{port}{STATS_PATH}", timeout=10) as response:
+        result: dict[str, object] = json.loads(response.read())
+    return result
+
+
+def _bench(args: argparse.Namespace, settings: FarmSettings) -> int:
+    from judgefinder.bootstrap import create_app
+
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.webfarm",
+        "serve",
+        *_settings_argv(args, settings),
+    ]
+    with subprocess.Popen(command, stdout=subprocess.PIPE, text=True) as server:
+        try:
+            assert server.stdout is not None
+            ready = json.loads(server.stdout.readline())
+            ports: list[int] = ready["ports"]
+            boards = plan_boards(settings)
+            start_date = settings.newest
+            print(
+                f"{'workers':>7} {'run':>5} {'seconds':>8} {'sources/s':>9} "
+                f"{'requests':>8} {'304':>6} {'429':>6} {'5xx':>6} {'notices':>8}"
+            )
+            for workers in args.workers:
+                with tempfile.TemporaryDirectory(prefix="webfarm-") as work_dir:
+                    config_path = Path(work_dir) / "config.toml"
+                    config_path.write_text(
+                        render_config(
+                            boards,
+                            ports,
+                            db_path=Path(work_dir) / "farm.db",
+                            collection={
+                                "workers": workers,
+                                "per_host_limit": args.per_host_limit,
+                                "runner": args.runner,
+                                "http_cache": not args.no_http_cache,
+                                "incremental": not args.no_incremental,
+                            },
+                        ),
+                        encoding="utf-8",
+                    )
+                    for run in ("cold", "warm"):
+                        before = _fetch_stats(ports[0])
+                        container = create_app(config_path)
+                        try:
+                            started = time.perf_counter()
+                            use_case = container.collect_use_case
+                            if args.runner == "asyncio":
+                                notices = asyncio.run(
+                                    use_case.execute_range_async(start_date, start_date)
+                                )
+                            else:
+                                notices = use_case.execute_range(start_date, start_date)
+                            elapsed = time.perf_counter() - started
+                        finally:
+                            container.close()
+                        after = _fetch_stats(ports[0])
+                        delta = _stats_delta(before, after)
+                        print(
+                            f"{workers:>7} {run:>5} {elapsed:>8.2f} "
+                            f"{len(boards) / elapsed:>9.1f} {delta['requests']:>8} "
+                            f"{delta['304']:>6} {delta['429']:>6} {delta['5xx']:>6} "
+                            f"{len(notices):>8}"
+                        )
+        finally:
+            server.terminate()
+    return 0
+
+
+def _stats_delta(before: dict[str, object], after: dict[str, object]) -> dict[str, int]:
+    def statuses(stats: dict[str, object]) -> Counter[str]:
+        raw = stats.get("statuses", {})
+        return Counter({str(k): int(v) for k, v in raw.items()} if isinstance(raw, dict) else {})
+
+    changed = statuses(after) - statuses(before)
+    return {
+        "requests": int(str(after["requests"])) - int(str(before["requests"])),
+        "304": changed["304"],
+        "429": changed["429"],
+        "5xx": sum(count for status, count in changed.items() if status.startswith("5")),
+    }
+
+
+def _settings_argv(args: argparse.Namespace, settings: FarmSettings) -> list[str]:
+    return [
+        "--municipalities",
+        str(args.municipalities),
+        "--hosts",
+        str(args.hosts),
+        "--pages",
+        str(args.pages),
+        "--rows-per-page",
+        str(args.rows_per_page),
+        "--latency",
+        args.latency,
+        "--error-rate",
+        str(args.error_rate),
+        "--throttle-rps",
+        str(args.throttle_rps),
+        "--throttle-burst",
+        str(args.throttle_burst),
+        "--seed",
+        str(args.seed),
+        "--newest",
+        settings.newest.isoformat(),
+    ]
+
+
+def _settings_from_args(args: argparse.Namespace) -> FarmSettings:
+    newest = (
+        datetime.now(tz=ZoneInfo(FARM_TIMEZONE)).date()
+        if args.newest == "today"
+        else date.fromisoformat(args.newest)
+    )
+    return FarmSettings(
+        municipalities=args.municipalities,
+        hosts=args.hosts,
+        list_pages=args.pages,
+        rows_per_page=args.rows_per_page,
+        latency=LatencyModel.parse(args.latency),
+        error_rate=args.error_rate,
+        throttle_rps=args.throttle_rps,
+        throttle_burst=args.throttle_burst,
+        seed=args.seed,
+        newest=newest,
+    )
+
+
+def _add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--municipalities", type=int, default=245)
+    parser.add_argument(
+        "--hosts",
+        type=int,
+        default=0,
+        help="Loopback ports to spread the boards over (default: one per municipality).",
+    )
+    parser.add_argument("--pages", type=int, default=5, help="List pages per board.")
+    parser.add_argument("--rows-per-page", type=int, default=10)
+    parser.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="fixed:MS, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA (milliseconds).",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 5xx answers.")
+    parser.add_argument(
+        "--throttle-rps",
+        type=float,
+        default=0.0,
+        help="Requests per second each host accepts before answering 429 (0 = no limit).",
+    )
+    parser.add_argument("--throttle-burst", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--newest",
+        default="today",
+        help="Date of the newest row on every board: 'today' or YYYY-MM-DD.",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.webfarm",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Serve the farm until interrupted.")
+    _add_settings_arguments(serve)
+    serve.add_argument("--base-port", type=int, default=0, help="First port (default: any).")
+    serve.add_argument("--config-out", type=Path, default=None)
+
+    bench = commands.add_parser("bench", help="Time cold and warm collects against a farm.")
+    _add_settings_arguments(bench)
+    bench.add_argument(
+        "--workers",
+        type=lambda raw: [int(value) for value in raw.split(",")],
+        default=[1, 8, 32],
+        help="Comma separated worker counts to compare.",
+    )
+    bench.add_argument("--per-host-limit", type=int, default=2)
+    bench.add_argument("--runner", choices=("threads", "asyncio"), default="threads")
+    bench.add_argument("--no-http-cache", action="store_true")
+    bench.add_argument("--no-incremental", action="store_true")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s %(name)s: %(message)s")
+    settings = _settings_from_args(args)
+    _raise_open_file_limit()
+    if args.command == "bench":
+        return _bench(args, settings)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(settings, base_port=args.base_port, config_out=args.config_out))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
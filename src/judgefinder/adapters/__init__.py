@@ -1,4 +1,4 @@
-from judgefinder.adapters.config import AppConfig, SourceConfig, load_config
+from judgefinder.adapters.config import AppConfig, CollectionConfig, SourceConfig, load_config
 from judgefinder.adapters.source_registry import SourceRegistry
 
-__all__ = ["AppConfig", "SourceConfig", "SourceRegistry", "load_config"]
+__all__ = ["AppConfig", "CollectionConfig", "SourceConfig", "SourceRegistry", "load_config"]
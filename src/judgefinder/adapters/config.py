@@ -21,6 +21,8 @@ from judgefinder.domain.source_profiles import (
 
 EnumT = TypeVar("EnumT", bound=Enum)
 
+COLLECTION_RUNNERS: tuple[str, ...] = ("threads", "asyncio")
+
 
 @dataclass(slots=True)
 class SourceConfig:
@@ -35,12 +37,58 @@ class SourceConfig:
     fallback_strategy: FallbackStrategy = FallbackStrategy.NONE
 
 
+@dataclass(slots=True)
+class CollectionConfig:
+    workers: int = 1
+    per_host_limit: int = 2
+    runner: str = "threads"
+    parse_processes: int = 0
+    state_dir: Path | None = None
+    adaptive_concurrency: bool = False
+    adaptive_max_per_host: int = 16
+    page_cache_mb: int = 32
+    http_cache: bool = False
+    http_cache_max_age_days: int = 14
+    http_pool_hosts: int = 32
+    http_pool_size: int = 10
+    retry_base_seconds: float = 0.5
+    retry_max_seconds: float = 8.0
+    retry_budget: int = 200
+    breaker_threshold: int = 0
+    breaker_cooldown_seconds: float = 3600.0
+    run_budget_seconds: float = 0.0
+    connect_timeout_seconds: float = 5.0
+    hedge_requests: bool = False
+    hedge_percentile: float = 0.9
+    hedge_max_ratio: float = 0.1
+    poll_interval_seconds: float = 900.0
+    incremental: bool = False
+    job_lease_seconds: float = 900.0
+    job_max_attempts: int = 3
+    job_retry_seconds: float = 60.0
+    run_log_retention_days: int = 30
+
+
 @dataclass(slots=True)
 class AppConfig:
     timezone: str
     db_path: Path
     enabled_sources: list[str]
     sources: dict[str, SourceConfig]
+    collection: CollectionConfig = field(default_factory=CollectionConfig)
+
+    def poll_intervals(self) -> dict[str, float]:
+        """Seconds between polls of each enabled source for ``serve-collector``."""
+        intervals: dict[str, float] = {}
+        for slug in self.enabled_sources:
+            source_config = self.sources.get(slug)
+            interval = (
+                source_config.request_strategy.poll_interval_seconds
+                if source_config is not None
+                else 0.0
+            )
+            intervals[slug] = interval if interval > 0 else self.collection.poll_interval_seconds
+        return intervals
 
 
 def load_config(config_path: Path, base_dir: Path | None = None) -> AppConfig:
@@ -106,6 +154,7 @@ def load_config(config_path: Path, base_dir: Path | None = None) -> AppConfig:
         db_path=db_path,
         enabled_sources=enabled_sources,
         sources=sources,
+        collection=_read_collection_config(raw.get("collection"), base_dir=resolved_base_dir),
     )
 
 
@@ -176,12 +225,233 @@ def _read_request_strategy(
         default=default_strategy.throttle_seconds,
         min_value=0.0,
     )
+    burst = _read_optional_int(value, "burst", default=default_strategy.burst, min_value=1)
+    daily_quota = _read_optional_int(
+        value,
+        "daily_quota",
+        default=default_strategy.daily_quota,
+        min_value=0,
+    )
+    prefetch = _read_optional_bool(value, "prefetch", default=default_strategy.prefetch)
+    budget_seconds = _read_optional_float(
+        value,
+        "budget_seconds",
+        default=default_strategy.budget_seconds,
+        min_value=0.0,
+    )
+    cache_ttl_seconds = _read_optional_float(
+        value,
+        "cache_ttl_seconds",
+        default=default_strategy.cache_ttl_seconds,
+        min_value=0.0,
+    )
+    poll_interval_seconds = _read_optional_float(
+        value,
+        "poll_interval_seconds",
+        default=default_strategy.poll_interval_seconds,
+        min_value=0.0,
+    )
     return RequestStrategy(
         session=session,
         referer=referer,
         retries=retries,
         timeout_seconds=timeout_seconds,
         throttle_seconds=throttle_seconds,
+        burst=burst,
+        daily_quota=daily_quota,
+        prefetch=prefetch,
+        cache_ttl_seconds=cache_ttl_seconds,
+        budget_seconds=budget_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+    )
+
+
+def _read_collection_config(value: Any, *, base_dir: Path) -> CollectionConfig:
+    default_config = CollectionConfig()
+    if value is None:
+        return default_config
+    if not isinstance(value, dict):
+        raise ValueError("collection must be a table.")
+
+    workers = _read_optional_int(value, "workers", default=default_config.workers, min_value=1)
+    per_host_limit = _read_optional_int(
+        value,
+        "per_host_limit",
+        default=default_config.per_host_limit,
+        min_value=1,
+    )
+    runner = value.get("runner", default_config.runner)
+    if runner not in COLLECTION_RUNNERS:
+        raise ValueError(f"Invalid value for 'runner': {runner}")
+    parse_processes = _read_optional_int(
+        value,
+        "parse_processes",
+        default=default_config.parse_processes,
+        min_value=0,
+    )
+    adaptive_concurrency = _read_optional_bool(
+        value,
+        "adaptive_concurrency",
+        default=default_config.adaptive_concurrency,
+    )
+    adaptive_max_per_host = _read_optional_int(
+        value,
+        "adaptive_max_per_host",
+        default=default_config.adaptive_max_per_host,
+        min_value=1,
+    )
+    page_cache_mb = _read_optional_int(
+        value,
+        "page_cache_mb",
+        default=default_config.page_cache_mb,
+        min_value=0,
+    )
+    http_cache = _read_optional_bool(value, "http_cache", default=default_config.http_cache)
+    http_cache_max_age_days = _read_optional_int(
+        value,
+        "http_cache_max_age_days",
+        default=default_config.http_cache_max_age_days,
+        min_value=0,
+    )
+    http_pool_hosts = _read_optional_int(
+        value,
+        "http_pool_hosts",
+        default=default_config.http_pool_hosts,
+        min_value=1,
+    )
+    http_pool_size = _read_optional_int(
+        value,
+        "http_pool_size",
+        default=default_config.http_pool_size,
+        min_value=1,
+    )
+    retry_base_seconds = _read_optional_float(
+        value,
+        "retry_base_seconds",
+        default=default_config.retry_base_seconds,
+        min_value=0.0,
+    )
+    retry_max_seconds = _read_optional_float(
+        value,
+        "retry_max_seconds",
+        default=default_config.retry_max_seconds,
+        min_value=0.0,
+    )
+    retry_budget = _read_optional_int(
+        value,
+        "retry_budget",
+        default=default_config.retry_budget,
+        min_value=0,
+    )
+    breaker_threshold = _read_optional_int(
+        value,
+        "breaker_threshold",
+        default=default_config.breaker_threshold,
+        min_value=0,
+    )
+    breaker_cooldown_seconds = _read_optional_float(
+        value,
+        "breaker_cooldown_seconds",
+        default=default_config.breaker_cooldown_seconds,
+        min_value=0.0,
+    )
+    run_budget_seconds = _read_optional_float(
+        value,
+        "run_budget_seconds",
+        default=default_config.run_budget_seconds,
+        min_value=0.0,
+    )
+    connect_timeout_seconds = _read_optional_float(
+        value,
+        "connect_timeout_seconds",
+        default=default_config.connect_timeout_seconds,
+        min_value=0.1,
+    )
+    hedge_requests = _read_optional_bool(
+        value,
+        "hedge_requests",
+        default=default_config.hedge_requests,
+    )
+    hedge_percentile = _read_optional_float(
+        value,
+        "hedge_percentile",
+        default=default_config.hedge_percentile,
+        min_value=0.5,
+    )
+    if hedge_percentile >= 1.0:
+        raise ValueError("Invalid float value for 'hedge_percentile'.")
+    hedge_max_ratio = _read_optional_float(
+        value,
+        "hedge_max_ratio",
+        default=default_config.hedge_max_ratio,
+        min_value=0.0,
+    )
+    poll_interval_seconds = _read_optional_float(
+        value,
+        "poll_interval_seconds",
+        default=default_config.poll_interval_seconds,
+        min_value=1.0,
+    )
+    incremental = _read_optional_bool(value, "incremental", default=default_config.incremental)
+    job_lease_seconds = _read_optional_float(
+        value,
+        "job_lease_seconds",
+        default=default_config.job_lease_seconds,
+        min_value=1.0,
+    )
+    job_max_attempts = _read_optional_int(
+        value,
+        "job_max_attempts",
+        default=default_config.job_max_attempts,
+        min_value=1,
+    )
+    job_retry_seconds = _read_optional_float(
+        value,
+        "job_retry_seconds",
+        default=default_config.job_retry_seconds,
+        min_value=0.0,
+    )
+    run_log_retention_days = _read_optional_int(
+        value,
+        "run_log_retention_days",
+        default=default_config.run_log_retention_days,
+        min_value=0,
+    )
+    state_dir_raw = value.get("state_dir")
+    state_dir = (
+        _resolve_path(state_dir_raw, base_dir)
+        if isinstance(state_dir_raw, str) and state_dir_raw
+        else None
+    )
+    return CollectionConfig(
+        workers=workers,
+        per_host_limit=per_host_limit,
+        runner=runner,
+        parse_processes=parse_processes,
+        state_dir=state_dir,
+        adaptive_concurrency=adaptive_concurrency,
+        adaptive_max_per_host=adaptive_max_per_host,
+        page_cache_mb=page_cache_mb,
+        http_cache=http_cache,
+        http_cache_max_age_days=http_cache_max_age_days,
+        http_pool_hosts=http_pool_hosts,
+        http_pool_size=http_pool_size,
+        retry_base_seconds=retry_base_seconds,
+        retry_max_seconds=retry_max_seconds,
+        retry_budget=retry_budget,
+        breaker_threshold=breaker_threshold,
+        breaker_cooldown_seconds=breaker_cooldown_seconds,
+        run_budget_seconds=run_budget_seconds,
+        connect_timeout_seconds=connect_timeout_seconds,
+        hedge_requests=hedge_requests,
+        hedge_percentile=hedge_percentile,
+        hedge_max_ratio=hedge_max_ratio,
+        poll_interval_seconds=poll_interval_seconds,
+        incremental=incremental,
+        job_lease_seconds=job_lease_seconds,
+        job_max_attempts=job_max_attempts,
+        job_retry_seconds=job_retry_seconds,
+        run_log_retention_days=run_log_retention_days,
     )
 
 
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 from judgefinder.adapters.config import AppConfig, SourceConfig
+from judgefinder.adapters.sources.generic_engine.parse_pool import GenericEngineParsePool
 from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
 from judgefinder.adapters.sources.municipal_rss.source import MunicipalRssSource
 from judgefinder.adapters.sources.noop.source import NoopSource
+from judgefinder.adapters.sources.page_cache import PageCache
 from judgefinder.adapters.sources.pocheon_eminwon.source import PocheonEminwonSource
 from judgefinder.adapters.sources.sample_city.source import SampleCitySource
 from judgefinder.adapters.sources.seongbuk.source import SeongbukSource
 from judgefinder.domain.ports import NoticeSource
+from judgefinder.domain.sharding import ShardSpec
 from judgefinder.domain.source_profiles import AccessProfile, EngineType
-from judgefinder.infrastructure.http.client import HttpClient
+from judgefinder.infrastructure.http.adaptive import AimdController
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient
+from judgefinder.infrastructure.http.rate_limit import HostRateLimit, HostRateLimiter
+from judgefinder.infrastructure.http.retry import RetryPolicy
 
 MUNICIPAL_RSS_SLUGS: set[str] = {
     "hanam",
@@ -36,14 +44,36 @@ GENERIC_ENGINE_TYPES: set[EngineType] = {
 
 
 class SourceRegistry:
-    def __init__(self, config: AppConfig, http_client: HttpClient, timezone: ZoneInfo) -> None:
+    def __init__(
+        self,
+        config: AppConfig,
+        http_client: HttpClient,
+        timezone: ZoneInfo,
+        async_http_client: AsyncHttpClient | None = None,
+        parse_pool: GenericEngineParsePool | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        concurrency_controller: AimdController | None = None,
+        page_cache: PageCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        shard: ShardSpec | None = None,
+        shard_costs: Mapping[str, float] | None = None,
+    ) -> None:
         self._config = config
         self._http_client = http_client
         self._timezone = timezone
+        self._async_http_client = async_http_client
+        self._parse_pool = parse_pool
+        self._rate_limiter = rate_limiter
+        self._concurrency_controller = concurrency_controller
+        self._page_cache = page_cache or PageCache()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._shard = shard
+        self._shard_costs = shard_costs
 
     def build_enabled_sources(self) -> list[NoticeSource]:
         sources: list[NoticeSource] = []
-        for slug in self._config.enabled_sources:
+        host_limits: dict[str, HostRateLimit] = {}
+        for slug in self.list_enabled_source_slugs():
             source_config = self._config.sources.get(slug)
             if source_config is None:
                 raise ValueError(f"Source '{slug}' is enabled but not configured.")
@@ -61,6 +91,8 @@ class SourceRegistry:
                 )
                 continue
 
+            self._configure_host_limits(source_config, host_limits)
+
             if slug == "sample_city":
                 sources.append(
                     SampleCitySource(
@@ -106,10 +138,41 @@ class SourceRegistry:
 
             raise ValueError(f"Unknown source slug: {slug}")
 
+        if self._rate_limiter is not None:
+            # Replace rather than merge, so a reload can loosen a limit as well as tighten it.
+            self._rate_limiter.replace_all(host_limits)
         return sources
 
     def list_enabled_source_slugs(self) -> list[str]:
-        return list(self._config.enabled_sources)
+        """Enabled slugs owned by this node's shard, or all of them when unsharded."""
+        if self._shard is None:
+            return list(self._config.enabled_sources)
+        return self._shard.select(self._config.enabled_sources, costs=self._shard_costs)
+
+    def _configure_host_limits(
+        self,
+        source_config: SourceConfig,
+        host_limits: dict[str, HostRateLimit],
+    ) -> None:
+        host = urlparse(source_config.list_url).netloc.lower()
+        if not host:
+            return
+        strategy = source_config.request_strategy
+        limit = HostRateLimit.from_throttle(
+            strategy.throttle_seconds,
+            burst=strategy.burst,
+            daily_quota=strategy.daily_quota,
+        )
+        if limit is not None:
+            # Sources sharing a host get the strictest of their limits.
+            previous = host_limits.get(host)
+            host_limits[host] = limit if previous is None else previous.merge(limit)
+        if (
+            self._concurrency_controller is not None
+            and source_config.access_profile is AccessProfile.THROTTLED
+        ):
+            # Hosts known to push back start from a single connection and earn more.
+            self._concurrency_controller.seed(host, initial_limit=1.0)
 
     def _build_seongbuk_source(self, source_config: SourceConfig) -> SeongbukSource:
         strategy = source_config.request_strategy
@@ -125,6 +188,12 @@ class SourceRegistry:
             max_retries=strategy.retries,
             use_session=strategy.session,
             include_referer=_should_include_referer(source_config),
+            prefetch_pages=strategy.prefetch,
+            async_http_client=self._async_http_client,
+            page_cache=self._page_cache,
+            cache_ttl_seconds=strategy.cache_ttl_seconds,
+            retry_policy=self._retry_policy,
+            budget_seconds=strategy.effective_budget_seconds(),
         )
 
     def _build_pocheon_source(self, source_config: SourceConfig) -> PocheonEminwonSource:
@@ -141,6 +210,12 @@ class SourceRegistry:
             max_retries=strategy.retries,
             use_session=strategy.session,
             include_referer=_should_include_referer(source_config),
+            prefetch_pages=strategy.prefetch,
+            async_http_client=self._async_http_client,
+            page_cache=self._page_cache,
+            cache_ttl_seconds=strategy.cache_ttl_seconds,
+            retry_policy=self._retry_policy,
+            budget_seconds=strategy.effective_budget_seconds(),
         )
 
     def _build_municipal_rss_source(self, source_config: SourceConfig) -> MunicipalRssSource:
@@ -157,6 +232,11 @@ class SourceRegistry:
             max_retries=strategy.retries,
             use_session=strategy.session,
             include_referer=_should_include_referer(source_config),
+            async_http_client=self._async_http_client,
+            page_cache=self._page_cache,
+            cache_ttl_seconds=strategy.cache_ttl_seconds,
+            retry_policy=self._retry_policy,
+            budget_seconds=strategy.effective_budget_seconds(),
         )
 
     def _build_generic_engine_source(self, source_config: SourceConfig) -> GenericEngineSource:
@@ -174,7 +254,13 @@ class SourceRegistry:
             max_retries=strategy.retries,
             use_session=strategy.session,
             include_referer=_should_include_referer(source_config),
-            throttle_seconds=strategy.throttle_seconds,
+            prefetch_pages=strategy.prefetch,
+            async_http_client=self._async_http_client,
+            page_cache=self._page_cache,
+            cache_ttl_seconds=strategy.cache_ttl_seconds,
+            retry_policy=self._retry_policy,
+            budget_seconds=strategy.effective_budget_seconds(),
+            parse_pool=self._parse_pool,
         )
 
 
@@ -1,3 +1,4 @@
+from judgefinder.adapters.sources.generic_engine.parse_pool import GenericEngineParsePool
 from judgefinder.adapters.sources.generic_engine.parser import (
     GenericNoticeCandidate,
     parse_generic_engine_candidates,
@@ -5,6 +6,7 @@ from judgefinder.adapters.sources.generic_engine.parser import (
 from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
 
 __all__ = [
+    "GenericEngineParsePool",
     "GenericEngineSource",
     "GenericNoticeCandidate",
     "parse_generic_engine_candidates",
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
+
+from judgefinder.adapters.sources.generic_engine.parser import (
+    GenericNoticeCandidate,
+    parse_generic_engine_candidates,
+)
+from judgefinder.domain.source_profiles import EngineType
+
+
+class GenericEngineParsePool:
+    """Parse generic engine list pages on worker processes.
+
+    Only the raw payload goes to the worker and only the compact candidate list comes
+    back, so parser state never crosses the process boundary.
+
+    Workers start lazily on the first page, while fetch, hedge and prefetch threads are
+    running, so they are never forked from this process: a fork would copy locks those
+    threads hold and could deadlock. They start from a fork server, or are spawned where
+    there is none.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_worker_context(),
+        )
+
+    def parse(
+        self,
+        payload: str,
+        *,
+        list_url: str,
+        engine_type: EngineType,
+    ) -> list[GenericNoticeCandidate]:
+        future = self._executor.submit(
+            parse_generic_engine_candidates,
+            payload,
+            list_url=list_url,
+            engine_type=engine_type,
+        )
+        return future.result()
+
+    async def parse_async(
+        self,
+        payload: str,
+        *,
+        list_url: str,
+        engine_type: EngineType,
+    ) -> list[GenericNoticeCandidate]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(
+                parse_generic_engine_candidates,
+                payload,
+                list_url=list_url,
+                engine_type=engine_type,
+            ),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _worker_context() -> BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
-from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import ParseResult, parse_qs, urlencode, urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
+from judgefinder.adapters.sources.html_backend import (
+    AUTO_HTML_BACKEND,
+    HtmlParseError,
+    feed_html,
+    make_soup,
+)
 from judgefinder.domain.source_profiles import EngineType
 
+LOGGER = logging.getLogger(__name__)
+
 TITLE_KEYS: tuple[str, ...] = (
     "title",
     "sj",
@@ -50,11 +62,35 @@ NOTICE_URL_HINTS: tuple[str, ...] = (
     "notancmtmgtno=",
 )
 
-DATE_FRAGMENT_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"\d{4}[./-]\d{1,2}[./-]\d{1,2}"),
-    re.compile(r"\d{4}년\s*\d{1,2}월\s*\d{1,2}일"),
-    re.compile(r"\b\d{8}\b"),
+# Elements whose text is an anchor's row context, nearest first.
+ROW_TAGS: tuple[str, ...] = ("tr", "li", "article", "div")
+# Text BeautifulSoup leaves out of get_text().
+SKIPPED_TEXT_TAGS: frozenset[str] = frozenset({"script", "style", "template", "rt", "rp"})
+VOID_TAGS: frozenset[str] = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Year, month and day groups; whatever these match can only mean that calendar date.
+YMD_DATE_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})"),
+    re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일"),
 )
+COMPACT_DATE_PATTERN = re.compile(r"\b\d{8}\b")
 
 JAVASCRIPT_ID_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"(?:nttNo|ntt_no|nttno)\D{0,5}(\d+)", re.IGNORECASE),
@@ -84,13 +120,19 @@ def parse_generic_engine_candidates(
     *,
     list_url: str,
     engine_type: EngineType,
+    html_backend: str = AUTO_HTML_BACKEND,
 ) -> list[GenericNoticeCandidate]:
     if engine_type is EngineType.JSON_LIST_API or _looks_like_json_payload(payload):
         parsed = _parse_json_candidates(payload, list_url=list_url, engine_type=engine_type)
         if parsed:
             return _dedupe_candidates(parsed)
     return _dedupe_candidates(
-        _parse_html_candidates(payload, list_url=list_url, engine_type=engine_type)
+        _parse_html_candidates(
+            payload,
+            list_url=list_url,
+            engine_type=engine_type,
+            html_backend=html_backend,
+        )
     )
 
 
@@ -99,39 +141,185 @@ def _parse_html_candidates(
     *,
     list_url: str,
     engine_type: EngineType,
+    html_backend: str = AUTO_HTML_BACKEND,
+) -> list[GenericNoticeCandidate]:
+    parser = _GenericListParser(list_url=list_url, engine_type=engine_type)
+    try:
+        feed_html(payload, parser, backend=html_backend)
+    except HtmlParseError:
+        # The tokenizer gave up (html.parser on some malformed declarations); the
+        # BeautifulSoup tree builder copes with those.
+        LOGGER.debug("Streaming parse failed for %s; falling back to BeautifulSoup", list_url)
+        return _parse_html_candidates_with_soup(
+            payload,
+            list_url=list_url,
+            engine_type=engine_type,
+            html_backend=html_backend,
+        )
+    parser.close()
+    candidates: list[GenericNoticeCandidate] = []
+    for anchor in parser.anchors:
+        candidate = _build_html_candidate(anchor.url, anchor.title, anchor.context_text)
+        if candidate is not None:
+            candidates.append(candidate)
+    return candidates
+
+
+def _parse_html_candidates_with_soup(
+    payload: str,
+    *,
+    list_url: str,
+    engine_type: EngineType,
+    html_backend: str = AUTO_HTML_BACKEND,
 ) -> list[GenericNoticeCandidate]:
-    soup = BeautifulSoup(payload, "html.parser")
+    soup = make_soup(payload, backend=html_backend)
     candidates: list[GenericNoticeCandidate] = []
 
     for anchor in soup.select("a[href]"):
         href_value = anchor.get("href")
         if not isinstance(href_value, str) or not href_value.strip():
             continue
-        url = _normalize_candidate_url(anchor, href_value.strip(), list_url=list_url)
+        onclick_value = anchor.get("onclick")
+        onclick = onclick_value if isinstance(onclick_value, str) else ""
+        url = _normalize_candidate_url(href_value.strip(), onclick, list_url=list_url)
         if not url:
             continue
         if not _is_probable_notice_url(url, engine_type=engine_type):
             continue
 
         title = _normalize_whitespace(anchor.get_text(" ", strip=True))
-        if not title:
-            continue
+        candidate = _build_html_candidate(url, title, _extract_context_text(anchor))
+        if candidate is not None:
+            candidates.append(candidate)
 
-        context_text = _extract_context_text(anchor)
-        published_date = _extract_date_from_text(context_text)
-        if published_date is None:
-            continue
+    return candidates
 
-        candidates.append(
-            GenericNoticeCandidate(
-                title=title,
-                url=url,
-                published_date=published_date,
-                searchable_text=_normalize_whitespace(f"{title} {context_text}"),
-            )
-        )
 
-    return candidates
+def _build_html_candidate(url: str, title: str, context_text: str) -> GenericNoticeCandidate | None:
+    if not title:
+        return None
+    published_date = _extract_date_from_text(context_text)
+    if published_date is None:
+        return None
+    return GenericNoticeCandidate(
+        title=title,
+        url=url,
+        published_date=published_date,
+        searchable_text=_normalize_whitespace(f"{title} {context_text}"),
+    )
+
+
+@dataclass(slots=True)
+class _ListAnchor:
+    url: str
+    text_start: int
+    in_row: bool
+    title: str = ""
+    context_text: str = ""
+
+
+@dataclass(slots=True)
+class _OpenElement:
+    tag: str
+    text_start: int
+    anchor: _ListAnchor | None = None
+    row_anchors: list[_ListAnchor] | None = None
+
+
+class _GenericListParser:
+    """Single-pass twin of ``_parse_html_candidates_with_soup``, fed by ``feed_html``.
+
+    Only notice-looking anchors are tracked. Each one waits on its nearest open row
+    element (see ``ROW_TAGS``) and takes that row's text as context when the row
+    closes, so no tree is built. Text is kept only while a row is open. Unclosed and
+    stray tags are handled the way BeautifulSoup's tree builder handles them, which
+    keeps both paths' output identical for the same backend.
+    """
+
+    def __init__(self, *, list_url: str, engine_type: EngineType) -> None:
+        self._list_url = list_url
+        self._engine_type = engine_type
+        self.anchors: list[_ListAnchor] = []
+
+        self._open: list[_OpenElement] = []
+        self._open_rows = 0
+        self._open_anchors = 0
+        self._skip_text_depth = 0
+        self._texts: list[str] = []
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> None:
+        self._texts.append(" ")
+        if tag in VOID_TAGS:
+            return
+        element = _OpenElement(tag, len(self._texts))
+        if tag in ROW_TAGS:
+            element.row_anchors = []
+            self._open_rows += 1
+        elif tag in SKIPPED_TEXT_TAGS:
+            self._skip_text_depth += 1
+        elif tag == "a":
+            element.anchor = self._start_anchor(attrs, text_start=element.text_start)
+            if element.anchor is not None:
+                self._open_anchors += 1
+        self._open.append(element)
+
+    def end(self, tag: str) -> None:
+        self._texts.append(" ")
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index].tag == tag:
+                break
+        else:
+            return
+        while len(self._open) > index:
+            self._close(self._open.pop())
+
+    def data(self, text: str) -> None:
+        if self._skip_text_depth == 0:
+            self._texts.append(text)
+
+    def comment(self) -> None:
+        self._texts.append(" ")
+
+    def close(self) -> None:
+        while self._open:
+            self._close(self._open.pop())
+
+    def _start_anchor(self, attrs: Mapping[str, str], *, text_start: int) -> _ListAnchor | None:
+        href = attrs.get("href", "").strip()
+        if not href:
+            return None
+        url = _normalize_candidate_url(href, attrs.get("onclick", ""), list_url=self._list_url)
+        if not url or not _is_probable_notice_url(url, engine_type=self._engine_type):
+            return None
+        row = next(
+            (element for element in reversed(self._open) if element.row_anchors is not None),
+            None,
+        )
+        anchor = _ListAnchor(url=url, text_start=text_start, in_row=row is not None)
+        if row is not None and row.row_anchors is not None:
+            row.row_anchors.append(anchor)
+        self.anchors.append(anchor)
+        return anchor
+
+    def _close(self, element: _OpenElement) -> None:
+        if element.anchor is not None:
+            self._open_anchors -= 1
+            element.anchor.title = self._text_since(element.text_start)
+            if not element.anchor.in_row:
+                element.anchor.context_text = element.anchor.title
+        elif element.row_anchors is not None:
+            self._open_rows -= 1
+            if element.row_anchors:
+                context_text = self._text_since(element.text_start)
+                for anchor in element.row_anchors:
+                    anchor.context_text = context_text
+        elif element.tag in SKIPPED_TEXT_TAGS:
+            self._skip_text_depth -= 1
+        if not self._open_rows and not self._open_anchors:
+            self._texts.clear()
+
+    def _text_since(self, start: int) -> str:
+        return _normalize_whitespace("".join(self._texts[start:]))
 
 
 def _parse_json_candidates(
@@ -174,9 +362,7 @@ def _parse_json_candidates(
     return candidates
 
 
-def _normalize_candidate_url(anchor: Tag, href: str, *, list_url: str) -> str:
-    onclick_raw = anchor.get("onclick")
-    onclick = onclick_raw if isinstance(onclick_raw, str) else ""
+def _normalize_candidate_url(href: str, onclick: str, *, list_url: str) -> str:
     normalized_href = href.strip().lower()
     if normalized_href.startswith("javascript:") or (
         onclick and normalized_href in {"", "#", "javascript:;", "javascript:void(0);"}
@@ -202,9 +388,8 @@ def _build_url_from_javascript(source: str, *, list_url: str) -> str:
     if not not_ancmt_no:
         not_ancmt_no = _extract_identifier(source, FN_SEARCH_DETAIL_PATTERN)
 
-    parsed = urlparse(list_url)
-    list_query = parse_qs(parsed.query, keep_blank_values=True)
-    key = list_query.get("key", [""])[0]
+    parsed, list_query = _split_list_url(list_url)
+    key = list_query.get("key", ("",))[0]
     if ntt_no and bbs_no:
         query: dict[str, str] = {"bbsNo": bbs_no, "nttNo": ntt_no}
         if key:
@@ -220,7 +405,7 @@ def _build_url_from_javascript(source: str, *, list_url: str) -> str:
 
     if not_ancmt_no and "/portal/saeol/gosilist.do" in parsed.path.lower():
         query = {"notAncmtMgtNo": not_ancmt_no}
-        menu_id = list_query.get("mId", [""])[0]
+        menu_id = list_query.get("mId", ("",))[0]
         if menu_id:
             query["mId"] = menu_id
         return urlunparse(
@@ -235,7 +420,7 @@ def _build_url_from_javascript(source: str, *, list_url: str) -> str:
     if not_ancmt_no and "/prog/saeolgosi/" in parsed.path.lower():
         view_path = parsed.path
         if view_path.lower().endswith("/list.do"):
-            view_path = view_path[:-len("/list.do")] + "/view.do"
+            view_path = view_path[: -len("/list.do")] + "/view.do"
         query = {"notAncmtMgtNo": not_ancmt_no}
         return urlunparse(
             parsed._replace(
@@ -247,7 +432,7 @@ def _build_url_from_javascript(source: str, *, list_url: str) -> str:
         )
 
     if not_ancmt_no and key:
-        notice_type = list_query.get("notAncmtSeCode", [""])[0]
+        notice_type = list_query.get("notAncmtSeCode", ("",))[0]
         query = {"key": key, "notAncmtMgtNo": not_ancmt_no}
         if notice_type:
             query["notAncmtSeCode"] = notice_type
@@ -262,8 +447,17 @@ def _build_url_from_javascript(source: str, *, list_url: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=256)
+def _split_list_url(list_url: str) -> tuple[ParseResult, Mapping[str, tuple[str, ...]]]:
+    # Every javascript anchor on a page resolves against the same list URL. The result is
+    # shared by every caller, so the query comes back read-only.
+    parsed = urlparse(list_url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    return parsed, MappingProxyType({name: tuple(values) for name, values in query.items()})
+
+
 def _extract_context_text(anchor: Tag) -> str:
-    row = anchor.find_parent(["tr", "li", "article", "div"])
+    row = anchor.find_parent(list(ROW_TAGS))
     if row is not None:
         return _normalize_whitespace(row.get_text(" ", strip=True))
     return _normalize_whitespace(anchor.get_text(" ", strip=True))
@@ -364,11 +558,19 @@ def _extract_date_from_text(value: str) -> date | None:
     if not normalized:
         return None
 
-    for pattern in DATE_FRAGMENT_PATTERNS:
-        for match in pattern.findall(normalized):
-            parsed = _parse_date_fragment(match)
+    for pattern in YMD_DATE_PATTERNS:
+        for match in pattern.finditer(normalized):
+            parsed = _build_date(
+                year=int(match.group(1)),
+                month=int(match.group(2)),
+                day=int(match.group(3)),
+            )
             if parsed is not None:
                 return parsed
+    for fragment in COMPACT_DATE_PATTERN.findall(normalized):
+        parsed = _parse_date_fragment(fragment)
+        if parsed is not None:
+            return parsed
 
     return _parse_date_fragment(normalized)
 
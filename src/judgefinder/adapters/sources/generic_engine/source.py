@@ -2,17 +2,38 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from zoneinfo import ZoneInfo
 
-from judgefinder.adapters.sources.generic_engine.parser import parse_generic_engine_candidates
+from judgefinder.adapters.sources.generic_engine.parse_pool import GenericEngineParsePool
+from judgefinder.adapters.sources.generic_engine.parser import (
+    GenericNoticeCandidate,
+    parse_generic_engine_candidates,
+)
 from judgefinder.adapters.sources.municipal_rss.parser import DEFAULT_KEYWORDS
+from judgefinder.adapters.sources.page_cache import DEFAULT_PAGE_TTL_SECONDS, PageCache
+from judgefinder.adapters.sources.paging import (
+    aiter_pages,
+    budgeted_walk,
+    iter_pages,
+    load_text_with_retries,
+    load_text_with_retries_async,
+)
+from judgefinder.domain.crawl_cursor import CrawlProgress, current_crawl_progress
 from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.run_metrics import record_cache_hit, record_parse
 from judgefinder.domain.source_profiles import EngineType
-from judgefinder.infrastructure.http.client import HttpClient
+from judgefinder.domain.tracing import trace_span
+from judgefinder.infrastructure.http.client import (
+    AsyncHttpClient,
+    HttpClient,
+    ThreadedAsyncHttpClient,
+)
+from judgefinder.infrastructure.http.retry import RetryPolicy
 
 LOGGER = logging.getLogger(__name__)
 
@@ -31,10 +52,15 @@ class GenericEngineSource:
     max_retries: int = 3
     use_session: bool = False
     include_referer: bool = False
-    throttle_seconds: float = 0.0
     max_pages: int = 8
     keywords: tuple[str, ...] = DEFAULT_KEYWORDS
-    page_cache: dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    prefetch_pages: bool = False
+    async_http_client: AsyncHttpClient | None = None
+    parse_pool: GenericEngineParsePool | None = None
+    page_cache: PageCache = field(default_factory=PageCache, repr=False)
+    cache_ttl_seconds: float = DEFAULT_PAGE_TTL_SECONDS
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy, repr=False)
+    budget_seconds: float = 0.0
     request_headers: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     page_param: str = field(default="", init=False, repr=False)
     search_keyword: str = field(default="", init=False, repr=False)
@@ -49,8 +75,7 @@ class GenericEngineSource:
                 "Chrome/122.0.0.0 Safari/537.36"
             ),
             "Accept": (
-                "application/json,text/html,application/xhtml+xml,"
-                "application/xml;q=0.9,*/*;q=0.8"
+                "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
             ),
         }
         if self.include_referer and referer:
@@ -63,98 +88,133 @@ class GenericEngineSource:
         )
 
     def fetch(self, target_date: date) -> list[Notice]:
-        fetched_at = datetime.now(tz=self.timezone)
-        normalized_keywords = tuple(
-            _normalize_text(keyword) for keyword in self.keywords if keyword.strip()
-        )
-
-        notices: list[Notice] = []
-        seen_urls: set[str] = set()
-        seen_target_page = False
-
-        for page_index in range(1, self.max_pages + 1):
-            payload = self._load_page(page_index=page_index)
-            candidates = parse_generic_engine_candidates(
-                payload,
-                list_url=self.list_url,
-                engine_type=self.engine_type,
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            for payload in iter_pages(
+                lambda page: self._load_page(page_index=page),
+                max_pages=self.max_pages,
+                prefetch=self._prefetch_enabled(),
+            ):
+                if not walk.consume(self._parse_page(payload)):
+                    break
+        return walk.notices
+
+    async def fetch_async(self, target_date: date) -> list[Notice]:
+        return await self.fetch_range_async(target_date, target_date)
+
+    async def fetch_range_async(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            pages = aiter_pages(
+                lambda page: self._load_page_async(page_index=page),
+                max_pages=self.max_pages,
+                prefetch=self._prefetch_enabled(),
             )
-            if not candidates:
-                break
-
-            page_dates = [candidate.published_date for candidate in candidates]
-            page_has_target = False
-            for candidate in candidates:
-                if candidate.published_date != target_date:
-                    continue
-
-                page_has_target = True
-                seen_target_page = True
-                searchable = _normalize_text(candidate.searchable_text)
-                if normalized_keywords and not _contains_keyword(searchable, normalized_keywords):
-                    continue
-                if candidate.url in seen_urls:
-                    continue
+            async with aclosing(pages):
+                async for payload in pages:
+                    if not walk.consume(await self._parse_page_async(payload)):
+                        break
+        return walk.notices
+
+    def _prefetch_enabled(self) -> bool:
+        return self.prefetch_pages and self.fixture_path is None
+
+    def _start_walk(self, start_date: date, end_date: date) -> _GenericEngineWalk:
+        return _GenericEngineWalk(
+            source=self,
+            start_date=start_date,
+            end_date=end_date,
+            fetched_at=datetime.now(tz=self.timezone),
+            normalized_keywords=tuple(
+                _normalize_text(keyword) for keyword in self.keywords if keyword.strip()
+            ),
+            progress=current_crawl_progress(),
+        )
 
-                seen_urls.add(candidate.url)
-                notices.append(
-                    Notice(
-                        id=None,
-                        municipality=self.municipality,
-                        title=candidate.title,
-                        url=candidate.url,
-                        published_date=candidate.published_date,
-                        fetched_at=fetched_at,
-                        source_type=self.source_type,
-                    )
+    def _parse_page(self, payload: str) -> list[GenericNoticeCandidate]:
+        started = time.perf_counter()
+        with trace_span("parse", category="parse", engine=self.engine_type.value):
+            if self.parse_pool is not None:
+                candidates = self.parse_pool.parse(
+                    payload,
+                    list_url=self.list_url,
+                    engine_type=self.engine_type,
                 )
-
-            max_date = max(page_dates)
-            if max_date < target_date and not page_has_target and seen_target_page:
-                break
-            if max_date < target_date and not seen_target_page:
-                break
-            if self.fixture_path is not None:
-                break
-
-        return notices
+            else:
+                candidates = parse_generic_engine_candidates(
+                    payload,
+                    list_url=self.list_url,
+                    engine_type=self.engine_type,
+                )
+        record_parse(seconds=time.perf_counter() - started, candidates=len(candidates))
+        return candidates
+
+    async def _parse_page_async(self, payload: str) -> list[GenericNoticeCandidate]:
+        started = time.perf_counter()
+        with trace_span("parse", category="parse", engine=self.engine_type.value):
+            if self.parse_pool is not None:
+                candidates = await self.parse_pool.parse_async(
+                    payload,
+                    list_url=self.list_url,
+                    engine_type=self.engine_type,
+                )
+            else:
+                candidates = parse_generic_engine_candidates(
+                    payload,
+                    list_url=self.list_url,
+                    engine_type=self.engine_type,
+                )
+        record_parse(seconds=time.perf_counter() - started, candidates=len(candidates))
+        return candidates
 
     def _load_page(self, *, page_index: int) -> str:
         if self.fixture_path is not None:
             return self.fixture_path.read_text(encoding="utf-8")
 
-        cached = self.page_cache.get(page_index)
+        request_url = self._build_request_url(page_index=page_index)
+        cached = self.page_cache.get(request_url)
         if cached is not None:
+            record_cache_hit()
             return cached
 
+        payload = load_text_with_retries(
+            self.http_client,
+            request_url,
+            description=f"{self.slug} generic engine",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
+
+    async def _load_page_async(self, *, page_index: int) -> str:
+        if self.fixture_path is not None:
+            return self.fixture_path.read_text(encoding="utf-8")
+
         request_url = self._build_request_url(page_index=page_index)
-        last_error: Exception | None = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                payload = self.http_client.get_text(
-                    request_url,
-                    timeout_seconds=self.timeout_seconds,
-                    headers=self.request_headers,
-                    use_session=self.use_session,
-                )
-                self.page_cache[page_index] = payload
-                if self.throttle_seconds > 0:
-                    time.sleep(self.throttle_seconds)
-                return payload
-            except Exception as exc:  # pragma: no cover - retry branch
-                last_error = exc
-                if attempt < self.max_retries:
-                    LOGGER.warning(
-                        "%s generic engine fetch failed (attempt %s/%s): %s",
-                        self.slug,
-                        attempt,
-                        self.max_retries,
-                        exc,
-                    )
+        cached = self.page_cache.get(request_url)
+        if cached is not None:
+            record_cache_hit()
+            return cached
 
-        if last_error is None:
-            raise RuntimeError(f"{self.slug} generic engine fetch failed without exception.")
-        raise last_error
+        payload = await load_text_with_retries_async(
+            self.async_http_client or ThreadedAsyncHttpClient(self.http_client),
+            request_url,
+            description=f"{self.slug} generic engine",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
 
     def _build_request_url(self, *, page_index: int) -> str:
         parsed = urlparse(self.list_url)
@@ -170,6 +230,60 @@ class GenericEngineSource:
         return urlunparse(parsed._replace(query=urlencode(query_params, doseq=True)))
 
 
+@dataclass(slots=True)
+class _GenericEngineWalk:
+    source: GenericEngineSource
+    start_date: date
+    end_date: date
+    fetched_at: datetime
+    normalized_keywords: tuple[str, ...]
+    progress: CrawlProgress | None = None
+    notices: list[Notice] = field(default_factory=list)
+    seen_urls: set[str] = field(default_factory=set)
+
+    def consume(self, candidates: list[GenericNoticeCandidate]) -> bool:
+        """Collect matching notices from one parsed page and report whether to keep paging."""
+        source = self.source
+        if not candidates:
+            return False
+
+        page_dates = [candidate.published_date for candidate in candidates]
+        with trace_span("filter", category="filter", candidates=len(candidates)):
+            for candidate in candidates:
+                if not self.start_date <= candidate.published_date <= self.end_date:
+                    continue
+
+                searchable = _normalize_text(candidate.searchable_text)
+                if self.normalized_keywords and not _contains_keyword(
+                    searchable, self.normalized_keywords
+                ):
+                    continue
+                if candidate.url in self.seen_urls:
+                    continue
+
+                self.seen_urls.add(candidate.url)
+                self.notices.append(
+                    Notice(
+                        id=None,
+                        municipality=source.municipality,
+                        title=candidate.title,
+                        url=candidate.url,
+                        published_date=candidate.published_date,
+                        fetched_at=self.fetched_at,
+                        source_type=source.source_type,
+                    )
+                )
+
+        # Lists are newest first, so a page entirely older than the window ends the walk.
+        if max(page_dates) < self.start_date:
+            return False
+        if self.progress is not None and self.progress.observe_page(
+            [(candidate.url, candidate.published_date) for candidate in candidates]
+        ):
+            return False
+        return source.fixture_path is None
+
+
 def _apply_search_params(
     query_params: dict[str, list[str]],
     *,
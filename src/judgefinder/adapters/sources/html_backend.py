@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Mapping
+from functools import cache
+from html.parser import HTMLParser
+from typing import Any, Protocol
+
+from bs4 import BeautifulSoup
+
+AUTO_HTML_BACKEND = "auto"
+LXML_BACKEND = "lxml"
+STDLIB_BACKEND = "html.parser"
+# Preferred first; "auto" picks the first one that is installed.
+HTML_BACKENDS: tuple[str, ...] = (LXML_BACKEND, STDLIB_BACKEND)
+
+
+class HtmlEvents(Protocol):
+    """Receiver of the tokens ``feed_html`` reads from a page, in document order."""
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> None: ...
+
+    def end(self, tag: str) -> None: ...
+
+    def data(self, text: str) -> None: ...
+
+    def comment(self) -> None: ...
+
+
+class HtmlParseError(ValueError):
+    """The backend could not tokenize the markup."""
+
+
+@cache
+def available_html_backends() -> tuple[str, ...]:
+    return tuple(
+        backend
+        for backend in HTML_BACKENDS
+        if backend == STDLIB_BACKEND or importlib.util.find_spec(backend) is not None
+    )
+
+
+def resolve_html_backend(backend: str = AUTO_HTML_BACKEND) -> str:
+    available = available_html_backends()
+    if backend == AUTO_HTML_BACKEND:
+        return available[0]
+    if backend not in HTML_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML backend {backend!r}; expected one of "
+            f"{', '.join((AUTO_HTML_BACKEND, *HTML_BACKENDS))}."
+        )
+    if backend not in available:
+        raise ValueError(f"HTML backend {backend!r} is not installed.")
+    return backend
+
+
+def make_soup(markup: str, *, backend: str = AUTO_HTML_BACKEND) -> BeautifulSoup:
+    """Build a BeautifulSoup tree with the fastest installed (or the given) backend."""
+    return BeautifulSoup(markup, resolve_html_backend(backend))
+
+
+def feed_html(markup: str, events: HtmlEvents, *, backend: str = AUTO_HTML_BACKEND) -> None:
+    """Stream the tokens of ``markup`` to ``events`` without building a tree.
+
+    lxml tokenizes in C and repairs markup the way libxml2 does (an unclosed ``<li>``
+    ends at the next one, for example). html.parser reports tags exactly as written.
+    """
+    if resolve_html_backend(backend) == LXML_BACKEND:
+        _feed_lxml(markup, events)
+        return
+    parser = _StdlibEventParser(events)
+    try:
+        parser.feed(markup)
+        parser.close()
+    except AssertionError as exc:
+        raise HtmlParseError(str(exc)) from exc
+
+
+def _feed_lxml(markup: str, events: HtmlEvents) -> None:
+    from lxml import etree
+
+    if not markup.strip():
+        return
+    parser = etree.HTMLParser(target=_LxmlTarget(events))
+    try:
+        parser.feed(markup)
+        parser.close()
+    except etree.Error as exc:
+        raise HtmlParseError(str(exc)) from exc
+
+
+class _StdlibEventParser(HTMLParser):
+    def __init__(self, events: HtmlEvents) -> None:
+        super().__init__(convert_charrefs=True)
+        self._events = events
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._events.start(tag, {name: value or "" for name, value in attrs})
+
+    def handle_endtag(self, tag: str) -> None:
+        self._events.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self._events.data(data)
+
+    def handle_comment(self, data: str) -> None:
+        _ = data
+        self._events.comment()
+
+
+class _LxmlTarget:
+    def __init__(self, events: HtmlEvents) -> None:
+        self._events = events
+
+    def start(self, tag: str, attrib: Mapping[str, str], nsmap: Any = None) -> None:
+        _ = nsmap
+        self._events.start(tag, attrib)
+
+    def end(self, tag: str) -> None:
+        self._events.end(tag)
+
+    def data(self, data: str) -> None:
+        self._events.data(data)
+
+    def comment(self, text: str) -> None:
+        _ = text
+        self._events.comment()
+
+    def close(self) -> None:
+        return None
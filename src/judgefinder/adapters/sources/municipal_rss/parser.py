@@ -26,27 +26,47 @@ def parse_municipal_rss_notices(
     source_type: SourceType,
     keywords: Iterable[str] = DEFAULT_KEYWORDS,
 ) -> list[Notice]:
+    return parse_municipal_rss_notices_between(
+        rss_xml,
+        municipality=municipality,
+        list_url=list_url,
+        start_date=target_date,
+        end_date=target_date,
+        fetched_at=fetched_at,
+        source_type=source_type,
+        keywords=keywords,
+    )
+
+
+def parse_municipal_rss_notices_between(
+    rss_xml: str,
+    *,
+    municipality: str,
+    list_url: str,
+    start_date: date,
+    end_date: date,
+    fetched_at: datetime,
+    source_type: SourceType,
+    keywords: Iterable[str] = DEFAULT_KEYWORDS,
+) -> list[Notice]:
+    """Parse feed items published between ``start_date`` and ``end_date`` inclusive."""
     try:
         root = ET.fromstring(rss_xml)
     except ET.ParseError:
         LOGGER.warning("Failed to parse municipal RSS payload.")
         return []
 
-    normalized_keywords = tuple(
-        _normalize_text(keyword) for keyword in keywords if keyword.strip()
-    )
+    normalized_keywords = tuple(_normalize_text(keyword) for keyword in keywords if keyword.strip())
     notices: list[Notice] = []
 
     for item in root.findall(".//item"):
         title = _extract_text(item, "title")
         link = _extract_text(item, "link")
         description = _extract_text(item, "description")
-        content_encoded = _extract_text(
-            item, "{http://purl.org/rss/1.0/modules/content/}encoded"
-        )
+        content_encoded = _extract_text(item, "{http://purl.org/rss/1.0/modules/content/}encoded")
         published_date = _extract_item_date(item)
 
-        if published_date is None or published_date != target_date:
+        if published_date is None or not start_date <= published_date <= end_date:
             continue
         if not title or not link:
             continue
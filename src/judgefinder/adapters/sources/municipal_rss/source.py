@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
@@ -10,10 +11,24 @@ from zoneinfo import ZoneInfo
 
 from judgefinder.adapters.sources.municipal_rss.parser import (
     DEFAULT_KEYWORDS,
-    parse_municipal_rss_notices,
+    parse_municipal_rss_notices_between,
 )
+from judgefinder.adapters.sources.page_cache import DEFAULT_PAGE_TTL_SECONDS, PageCache
+from judgefinder.adapters.sources.paging import (
+    budgeted_walk,
+    load_text_with_retries,
+    load_text_with_retries_async,
+)
+from judgefinder.domain.crawl_cursor import CrawlProgress, current_crawl_progress
 from judgefinder.domain.entities import Notice, SourceType
-from judgefinder.infrastructure.http.client import HttpClient
+from judgefinder.domain.run_metrics import record_cache_hit, record_parse
+from judgefinder.domain.tracing import trace_span
+from judgefinder.infrastructure.http.client import (
+    AsyncHttpClient,
+    HttpClient,
+    ThreadedAsyncHttpClient,
+)
+from judgefinder.infrastructure.http.retry import RetryPolicy
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +49,11 @@ class MunicipalRssSource:
     max_pages: int = 1
     page_param: str | None = None
     keywords: tuple[str, ...] = DEFAULT_KEYWORDS
-    page_cache: dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    async_http_client: AsyncHttpClient | None = None
+    page_cache: PageCache = field(default_factory=PageCache, repr=False)
+    cache_ttl_seconds: float = DEFAULT_PAGE_TTL_SECONDS
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy, repr=False)
+    budget_seconds: float = 0.0
     request_headers: dict[str, str] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -52,71 +71,83 @@ class MunicipalRssSource:
             self.request_headers["Referer"] = referer
 
     def fetch(self, target_date: date) -> list[Notice]:
-        fetched_at = datetime.now(tz=self.timezone)
-        notices: list[Notice] = []
-        seen_urls: set[str] = set()
-
-        for page_no in range(1, self.max_pages + 1):
-            rss_xml = self._load_rss(page_no=page_no)
-            page_notices = parse_municipal_rss_notices(
-                rss_xml,
-                municipality=self.municipality,
-                list_url=self.list_url,
-                target_date=target_date,
-                fetched_at=fetched_at,
-                source_type=self.source_type,
-                keywords=self.keywords,
-            )
-            for notice in page_notices:
-                if notice.url in seen_urls:
-                    continue
-                seen_urls.add(notice.url)
-                notices.append(notice)
-
-            if not _has_items(rss_xml):
-                break
-            if self.fixture_path is not None:
-                break
-            if self.page_param is None:
-                break
-
-        return notices
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            for page_no in range(1, self.max_pages + 1):
+                rss_xml = self._load_rss(page_no=page_no)
+                if not walk.consume(rss_xml):
+                    break
+        return walk.notices
+
+    async def fetch_async(self, target_date: date) -> list[Notice]:
+        return await self.fetch_range_async(target_date, target_date)
+
+    async def fetch_range_async(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            for page_no in range(1, self.max_pages + 1):
+                rss_xml = await self._load_rss_async(page_no=page_no)
+                if not walk.consume(rss_xml):
+                    break
+        return walk.notices
+
+    def _start_walk(self, start_date: date, end_date: date) -> _MunicipalRssWalk:
+        return _MunicipalRssWalk(
+            source=self,
+            start_date=start_date,
+            end_date=end_date,
+            fetched_at=datetime.now(tz=self.timezone),
+            progress=current_crawl_progress(),
+        )
 
     def _load_rss(self, page_no: int) -> str:
         if self.fixture_path is not None:
             return self.fixture_path.read_text(encoding="utf-8")
 
-        cached = self.page_cache.get(page_no)
+        request_url = self._build_request_url(page_no=page_no)
+        cached = self.page_cache.get(request_url)
         if cached is not None:
+            record_cache_hit()
             return cached
 
+        payload = load_text_with_retries(
+            self.http_client,
+            request_url,
+            description=f"{self.slug} RSS",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
+
+    async def _load_rss_async(self, page_no: int) -> str:
+        if self.fixture_path is not None:
+            return self.fixture_path.read_text(encoding="utf-8")
+
         request_url = self._build_request_url(page_no=page_no)
-        last_error: Exception | None = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                payload = self.http_client.get_text(
-                    request_url,
-                    timeout_seconds=self.timeout_seconds,
-                    headers=self.request_headers,
-                    use_session=self.use_session,
-                )
-                self.page_cache[page_no] = payload
-                return payload
-            except Exception as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    LOGGER.warning(
-                        "%s RSS fetch failed (attempt %s/%s): %s",
-                        self.slug,
-                        attempt,
-                        self.max_retries,
-                        exc,
-                    )
-
-        if last_error is None:
-            raise RuntimeError(f"{self.slug} RSS fetch failed without an exception.")
-        raise last_error
+        cached = self.page_cache.get(request_url)
+        if cached is not None:
+            record_cache_hit()
+            return cached
+
+        payload = await load_text_with_retries_async(
+            self.async_http_client or ThreadedAsyncHttpClient(self.http_client),
+            request_url,
+            description=f"{self.slug} RSS",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
 
     def _build_request_url(self, page_no: int) -> str:
         if self.page_param is None:
@@ -129,9 +160,57 @@ class MunicipalRssSource:
         return urlunparse(parsed_url._replace(query=new_query))
 
 
-def _has_items(rss_xml: str) -> bool:
+@dataclass(slots=True)
+class _MunicipalRssWalk:
+    source: MunicipalRssSource
+    start_date: date
+    end_date: date
+    fetched_at: datetime
+    progress: CrawlProgress | None = None
+    notices: list[Notice] = field(default_factory=list)
+    seen_urls: set[str] = field(default_factory=set)
+
+    def consume(self, rss_xml: str) -> bool:
+        """Collect matching notices from one feed page and report whether to keep paging."""
+        source = self.source
+        started = time.perf_counter()
+        with trace_span("parse", category="parse"):
+            page_notices = parse_municipal_rss_notices_between(
+                rss_xml,
+                municipality=source.municipality,
+                list_url=source.list_url,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                fetched_at=self.fetched_at,
+                source_type=source.source_type,
+                keywords=source.keywords,
+            )
+        with trace_span("filter", category="filter", candidates=len(page_notices)):
+            for notice in page_notices:
+                if notice.url in self.seen_urls:
+                    continue
+                self.seen_urls.add(notice.url)
+                self.notices.append(notice)
+
+        with trace_span("count items", category="parse"):
+            item_count = _count_items(rss_xml)
+        # The parser drops items outside the window, so candidates are the feed's items.
+        record_parse(seconds=time.perf_counter() - started, candidates=item_count)
+        if not item_count:
+            return False
+        # Only in-window items are parsed, which is a conservative view of the page.
+        if self.progress is not None and self.progress.observe_page(
+            [(notice.url, notice.published_date) for notice in page_notices]
+        ):
+            return False
+        if source.fixture_path is not None:
+            return False
+        return source.page_param is not None
+
+
+def _count_items(rss_xml: str) -> int:
     try:
         root = ET.fromstring(rss_xml)
     except ET.ParseError:
-        return False
-    return bool(root.findall(".//item"))
+        return 0
+    return len(root.findall(".//item"))
@@ -16,11 +16,20 @@ class NoopSource:
     reason: str
 
     def fetch(self, target_date: date) -> list[Notice]:
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
         LOGGER.warning(
             "Skipping source '%s' (%s) for %s: %s",
             self.slug,
             self.municipality,
-            target_date.isoformat(),
+            _format_range(start_date, end_date),
             self.reason,
         )
         return []
+
+
+def _format_range(start_date: date, end_date: date) -> str:
+    if start_date == end_date:
+        return start_date.isoformat()
+    return f"{start_date.isoformat()}..{end_date.isoformat()}"
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+DEFAULT_PAGE_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_PAGE_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class PageCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    payload: str
+    size_bytes: int
+    expires_at: float
+
+
+class PageCache:
+    """LRU cache of fetched list pages keyed by request URL.
+
+    The cache is bounded by the encoded size of the stored payloads and every entry
+    carries the TTL of the source that stored it, so a long-lived process never serves
+    a page older than that source allows. One instance is shared by all sources.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_PAGE_CACHE_BYTES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, url: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(url)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self._hits += 1
+            return entry.payload
+
+    def put(self, url: str, payload: str, *, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        size_bytes = len(payload.encode("utf-8"))
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            if size_bytes > self._max_bytes:
+                return
+            while self._size_bytes + size_bytes > self._max_bytes:
+                oldest_url = next(iter(self._entries))
+                self._remove(oldest_url)
+                self._evictions += 1
+            self._entries[url] = _CacheEntry(
+                payload=payload,
+                size_bytes=size_bytes,
+                expires_at=self._clock() + ttl_seconds,
+            )
+            self._size_bytes += size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> PageCacheStats:
+        with self._lock:
+            return PageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _remove(self, url: str) -> None:
+        entry = self._entries.pop(url)
+        self._size_bytes -= entry.size_bytes
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from judgefinder.domain.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    PartialFetchError,
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+)
+from judgefinder.domain.entities import Notice
+from judgefinder.domain.run_metrics import record_failed_fetch, record_page
+from judgefinder.domain.tracing import trace_lane, trace_span
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient
+from judgefinder.infrastructure.http.retry import RetryPolicy
+
+LOGGER = logging.getLogger(__name__)
+
+
+def iter_pages(
+    load_page: Callable[[int], str],
+    *,
+    max_pages: int,
+    prefetch: bool = False,
+) -> Iterator[str]:
+    """Yield list pages 1..max_pages in order.
+
+    With ``prefetch`` the next page is requested in the background while the caller
+    parses the current one. Stopping the iteration early discards that speculative page.
+    """
+    if not prefetch or max_pages <= 1:
+        for page_index in range(1, max_pages + 1):
+            with trace_lane(_page_lane(page_index)):
+                payload = load_page(page_index)
+            yield payload
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+    try:
+        # Run speculative loads in the caller's context so its deadline applies to them.
+        pending = executor.submit(_page_context(1).run, load_page, 1)
+        for page_index in range(1, max_pages + 1):
+            payload = pending.result()
+            if page_index < max_pages:
+                pending = executor.submit(
+                    _page_context(page_index + 1).run,
+                    load_page,
+                    page_index + 1,
+                )
+            yield payload
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    load_page: Callable[[int], Awaitable[str]],
+    *,
+    max_pages: int,
+    prefetch: bool = False,
+) -> AsyncGenerator[str, None]:
+    """Async counterpart of iter_pages; wrap it in contextlib.aclosing when breaking early."""
+    if not prefetch or max_pages <= 1:
+        for page_index in range(1, max_pages + 1):
+            with trace_lane(_page_lane(page_index)):
+                payload = await load_page(page_index)
+            yield payload
+        return
+
+    pending: asyncio.Future[str] = _start_page(load_page, 1)
+    try:
+        for page_index in range(1, max_pages + 1):
+            payload = await pending
+            if page_index < max_pages:
+                pending = _start_page(load_page, page_index + 1)
+            yield payload
+    finally:
+        _discard_future(pending)
+
+
+def load_text_with_retries(
+    http_client: HttpClient,
+    url: str,
+    *,
+    description: str,
+    max_retries: int,
+    timeout_seconds: float,
+    headers: Mapping[str, str] | None,
+    use_session: bool,
+    retry_policy: RetryPolicy,
+) -> str:
+    attempt = 1
+    started = time.perf_counter()
+    while True:
+        try:
+            with trace_span("GET", category="http", url=url, attempt=attempt):
+                payload = http_client.get_text(
+                    url,
+                    timeout_seconds=clamp_timeout(timeout_seconds),
+                    headers=headers,
+                    use_session=use_session,
+                )
+        except DeadlineExceededError:
+            raise
+        except Exception as exc:
+            delay = retry_policy.next_delay(exc, attempt=attempt, max_attempts=max_retries)
+            if delay is None:
+                record_failed_fetch(seconds=time.perf_counter() - started, retries=attempt - 1)
+                raise
+            _log_failed_attempt(description, attempt, max_retries, exc)
+            with trace_span("backoff", category="http", attempt=attempt):
+                time.sleep(_backoff_within_deadline(delay))
+            attempt += 1
+        else:
+            _record_page(payload, started=started, attempt=attempt)
+            return payload
+
+
+async def load_text_with_retries_async(
+    http_client: AsyncHttpClient,
+    url: str,
+    *,
+    description: str,
+    max_retries: int,
+    timeout_seconds: float,
+    headers: Mapping[str, str] | None,
+    use_session: bool,
+    retry_policy: RetryPolicy,
+) -> str:
+    attempt = 1
+    started = time.perf_counter()
+    while True:
+        try:
+            with trace_span("GET", category="http", url=url, attempt=attempt):
+                payload = await http_client.get_text(
+                    url,
+                    timeout_seconds=clamp_timeout(timeout_seconds),
+                    headers=headers,
+                    use_session=use_session,
+                )
+        except DeadlineExceededError:
+            raise
+        except Exception as exc:
+            delay = retry_policy.next_delay(exc, attempt=attempt, max_attempts=max_retries)
+            if delay is None:
+                record_failed_fetch(seconds=time.perf_counter() - started, retries=attempt - 1)
+                raise
+            _log_failed_attempt(description, attempt, max_retries, exc)
+            with trace_span("backoff", category="http", attempt=attempt):
+                await asyncio.sleep(_backoff_within_deadline(delay))
+            attempt += 1
+        else:
+            _record_page(payload, started=started, attempt=attempt)
+            return payload
+
+
+@contextmanager
+def budgeted_walk(notices: list[Notice], *, budget_seconds: float) -> Iterator[None]:
+    """Run a page walk under the source's time budget.
+
+    When the budget (or the enclosing run deadline) runs out the walk stops and the
+    notices gathered so far are handed to the caller through PartialFetchError.
+    """
+    deadline = Deadline.after(budget_seconds) if budget_seconds > 0 else None
+    with deadline_scope(deadline):
+        try:
+            yield
+        except DeadlineExceededError as exc:
+            raise PartialFetchError(list(notices), str(exc)) from exc
+
+
+def _page_lane(page_index: int) -> str:
+    return f"page {page_index}"
+
+
+def _page_context(page_index: int) -> contextvars.Context:
+    with trace_lane(_page_lane(page_index)):
+        return contextvars.copy_context()
+
+
+def _start_page(
+    load_page: Callable[[int], Awaitable[str]],
+    page_index: int,
+) -> asyncio.Future[str]:
+    # The task copies the current context, so it keeps the page lane after this returns.
+    with trace_lane(_page_lane(page_index)):
+        return asyncio.ensure_future(load_page(page_index))
+
+
+def _record_page(payload: str, *, started: float, attempt: int) -> None:
+    # Time spent in failed attempts and their backoff counts towards the fetch.
+    record_page(
+        size_bytes=len(payload.encode("utf-8")),
+        seconds=time.perf_counter() - started,
+        retries=attempt - 1,
+    )
+
+
+def _backoff_within_deadline(delay: float) -> float:
+    deadline = current_deadline()
+    if deadline is not None and deadline.remaining() <= delay:
+        raise DeadlineExceededError("Time budget exhausted while backing off.")
+    return delay
+
+
+def _log_failed_attempt(description: str, attempt: int, max_retries: int, exc: Exception) -> None:
+    LOGGER.warning(
+        "%s fetch failed (attempt %s/%s): %s",
+        description,
+        attempt,
+        max_retries,
+        exc,
+    )
+
+
+def _discard_future(future: asyncio.Future[str]) -> None:
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        # Mark a failed speculative page as retrieved so asyncio does not log it.
+        future.exception()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
@@ -8,9 +10,25 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from zoneinfo import ZoneInfo
 
 from judgefinder.adapters.sources.municipal_rss.parser import DEFAULT_KEYWORDS
+from judgefinder.adapters.sources.page_cache import DEFAULT_PAGE_TTL_SECONDS, PageCache
+from judgefinder.adapters.sources.paging import (
+    aiter_pages,
+    budgeted_walk,
+    iter_pages,
+    load_text_with_retries,
+    load_text_with_retries_async,
+)
 from judgefinder.adapters.sources.pocheon_eminwon.parser import extract_pocheon_eminwon_rows
+from judgefinder.domain.crawl_cursor import CrawlProgress, current_crawl_progress
 from judgefinder.domain.entities import Notice, SourceType
-from judgefinder.infrastructure.http.client import HttpClient
+from judgefinder.domain.run_metrics import record_cache_hit, record_parse
+from judgefinder.domain.tracing import trace_span
+from judgefinder.infrastructure.http.client import (
+    AsyncHttpClient,
+    HttpClient,
+    ThreadedAsyncHttpClient,
+)
+from judgefinder.infrastructure.http.retry import RetryPolicy
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +53,12 @@ class PocheonEminwonSource:
     max_pages: int = 200
     page_unit: int = 10
     keywords: tuple[str, ...] = DEFAULT_KEYWORDS
-    page_cache: dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    prefetch_pages: bool = False
+    async_http_client: AsyncHttpClient | None = None
+    page_cache: PageCache = field(default_factory=PageCache, repr=False)
+    cache_ttl_seconds: float = DEFAULT_PAGE_TTL_SECONDS
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy, repr=False)
+    budget_seconds: float = 0.0
     request_headers: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     effective_list_url: str = field(default="", init=False, repr=False)
     search_keyword: str = field(default="", init=False, repr=False)
@@ -57,95 +80,97 @@ class PocheonEminwonSource:
             self.request_headers["Referer"] = referer
 
     def fetch(self, target_date: date) -> list[Notice]:
-        fetched_at = datetime.now(tz=self.timezone)
-        notices: list[Notice] = []
-        seen_urls: set[str] = set()
-        normalized_keywords = tuple(
-            _normalize_text(keyword) for keyword in self.keywords if keyword.strip()
-        )
-        seen_target_page = False
+        return self.fetch_range(target_date, target_date)
 
-        for page_index in range(1, self.max_pages + 1):
-            page_html = self._load_page(page_index=page_index)
-            rows = extract_pocheon_eminwon_rows(
-                page_html, list_url=self.effective_list_url
-            )
-            if not rows:
-                break
-
-            page_dates = [row.published_date for row in rows]
-            page_has_target = False
-
-            for row in rows:
-                if row.published_date != target_date:
-                    continue
-                page_has_target = True
-                seen_target_page = True
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            for page_html in iter_pages(
+                lambda page: self._load_page(page_index=page),
+                max_pages=self.max_pages,
+                prefetch=self._prefetch_enabled(),
+            ):
+                if not walk.consume(page_html):
+                    break
+        return walk.notices
 
-                searchable = _normalize_text(row.searchable_text)
-                if normalized_keywords and not _contains_keyword(
-                    searchable, normalized_keywords
-                ):
-                    continue
+    async def fetch_async(self, target_date: date) -> list[Notice]:
+        return await self.fetch_range_async(target_date, target_date)
 
-                if row.url in seen_urls:
-                    continue
-                seen_urls.add(row.url)
-                notices.append(
-                    Notice(
-                        id=None,
-                        municipality=self.municipality,
-                        title=row.title,
-                        url=row.url,
-                        published_date=row.published_date,
-                        fetched_at=fetched_at,
-                        source_type=self.source_type,
-                    )
-                )
+    async def fetch_range_async(self, start_date: date, end_date: date) -> list[Notice]:
+        walk = self._start_walk(start_date, end_date)
+        with budgeted_walk(walk.notices, budget_seconds=self.budget_seconds):
+            pages = aiter_pages(
+                lambda page: self._load_page_async(page_index=page),
+                max_pages=self.max_pages,
+                prefetch=self._prefetch_enabled(),
+            )
+            async with aclosing(pages):
+                async for page_html in pages:
+                    if not walk.consume(page_html):
+                        break
+        return walk.notices
 
-            max_date = max(page_dates)
-            if seen_target_page and not page_has_target and max_date < target_date:
-                break
-            if self.fixture_path is not None:
-                break
+    def _prefetch_enabled(self) -> bool:
+        return self.prefetch_pages and self.fixture_path is None
 
-        return notices
+    def _start_walk(self, start_date: date, end_date: date) -> _PocheonEminwonWalk:
+        return _PocheonEminwonWalk(
+            source=self,
+            start_date=start_date,
+            end_date=end_date,
+            fetched_at=datetime.now(tz=self.timezone),
+            normalized_keywords=tuple(
+                _normalize_text(keyword) for keyword in self.keywords if keyword.strip()
+            ),
+            progress=current_crawl_progress(),
+        )
 
     def _load_page(self, *, page_index: int) -> str:
         if self.fixture_path is not None:
             return self.fixture_path.read_text(encoding="utf-8")
 
-        cached = self.page_cache.get(page_index)
+        request_url = self._build_request_url(page_index=page_index)
+        cached = self.page_cache.get(request_url)
         if cached is not None:
+            record_cache_hit()
             return cached
 
+        payload = load_text_with_retries(
+            self.http_client,
+            request_url,
+            description=f"{self.slug} eminwon",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
+
+    async def _load_page_async(self, *, page_index: int) -> str:
+        if self.fixture_path is not None:
+            return self.fixture_path.read_text(encoding="utf-8")
+
         request_url = self._build_request_url(page_index=page_index)
-        last_error: Exception | None = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                payload = self.http_client.get_text(
-                    request_url,
-                    timeout_seconds=self.timeout_seconds,
-                    headers=self.request_headers,
-                    use_session=self.use_session,
-                )
-                self.page_cache[page_index] = payload
-                return payload
-            except Exception as exc:  # pragma: no cover - retry branch
-                last_error = exc
-                if attempt < self.max_retries:
-                    LOGGER.warning(
-                        "%s eminwon fetch failed (attempt %s/%s): %s",
-                        self.slug,
-                        attempt,
-                        self.max_retries,
-                        exc,
-                    )
+        cached = self.page_cache.get(request_url)
+        if cached is not None:
+            record_cache_hit()
+            return cached
 
-        if last_error is None:
-            raise RuntimeError(f"{self.slug} eminwon fetch failed without an exception.")
-        raise last_error
+        payload = await load_text_with_retries_async(
+            self.async_http_client or ThreadedAsyncHttpClient(self.http_client),
+            request_url,
+            description=f"{self.slug} eminwon",
+            max_retries=self.max_retries,
+            timeout_seconds=self.timeout_seconds,
+            headers=self.request_headers,
+            use_session=self.use_session,
+            retry_policy=self.retry_policy,
+        )
+        self.page_cache.put(request_url, payload, ttl_seconds=self.cache_ttl_seconds)
+        return payload
 
     def _build_request_url(self, *, page_index: int) -> str:
         parsed_url = urlparse(self.effective_list_url)
@@ -158,14 +183,72 @@ class PocheonEminwonSource:
         return urlunparse(parsed_url._replace(query=urlencode(query_params, doseq=True)))
 
 
+@dataclass(slots=True)
+class _PocheonEminwonWalk:
+    source: PocheonEminwonSource
+    start_date: date
+    end_date: date
+    fetched_at: datetime
+    normalized_keywords: tuple[str, ...]
+    progress: CrawlProgress | None = None
+    notices: list[Notice] = field(default_factory=list)
+    seen_urls: set[str] = field(default_factory=set)
+
+    def consume(self, page_html: str) -> bool:
+        """Collect matching notices from one list page and report whether to keep paging."""
+        source = self.source
+        started = time.perf_counter()
+        with trace_span("parse", category="parse"):
+            rows = extract_pocheon_eminwon_rows(page_html, list_url=source.effective_list_url)
+        record_parse(seconds=time.perf_counter() - started, candidates=len(rows))
+        if not rows:
+            return False
+
+        page_dates = [row.published_date for row in rows]
+
+        with trace_span("filter", category="filter", candidates=len(rows)):
+            for row in rows:
+                if not self.start_date <= row.published_date <= self.end_date:
+                    continue
+
+                searchable = _normalize_text(row.searchable_text)
+                if self.normalized_keywords and not _contains_keyword(
+                    searchable, self.normalized_keywords
+                ):
+                    continue
+
+                if row.url in self.seen_urls:
+                    continue
+                self.seen_urls.add(row.url)
+                self.notices.append(
+                    Notice(
+                        id=None,
+                        municipality=source.municipality,
+                        title=row.title,
+                        url=row.url,
+                        published_date=row.published_date,
+                        fetched_at=self.fetched_at,
+                        source_type=source.source_type,
+                    )
+                )
+
+        # Newest first, so a page entirely older than the range ends the walk.
+        if max(page_dates) < self.start_date:
+            return False
+        if self.progress is not None and self.progress.observe_page(
+            [(row.url, row.published_date) for row in rows]
+        ):
+            return False
+        return source.fixture_path is None
+
+
 def _resolve_pocheon_list_url(list_url: str) -> str:
     parsed_url = urlparse(list_url)
     if "selectEminwonList.do" in parsed_url.path:
         return list_url
     if "rssBbsNtt.do" in parsed_url.path:
         LOGGER.info(
-            "Pocheon list_url points to legacy RSS. "
-            "Using selectEminwon list instead: %s",
+            "Pocheon list_url points to legacy RSS. Using selectEminwon list instead: %s",
             DEFAULT_POCHEON_EMINWON_LIST_URL,
         )
         return DEFAULT_POCHEON_EMINWON_LIST_URL
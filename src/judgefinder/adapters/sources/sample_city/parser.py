@@ -3,8 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
+from judgefinder.adapters.sources.html_backend import AUTO_HTML_BACKEND, make_soup
 from judgefinder.domain.entities import Notice, SourceType
 
 
@@ -17,7 +16,29 @@ def parse_sample_city_notices(
     fetched_at: datetime,
     source_type: SourceType,
 ) -> list[Notice]:
-    soup = BeautifulSoup(html, "html.parser")
+    return parse_sample_city_notices_between(
+        html,
+        municipality=municipality,
+        list_url=list_url,
+        start_date=target_date,
+        end_date=target_date,
+        fetched_at=fetched_at,
+        source_type=source_type,
+    )
+
+
+def parse_sample_city_notices_between(
+    html: str,
+    *,
+    municipality: str,
+    list_url: str,
+    start_date: date,
+    end_date: date,
+    fetched_at: datetime,
+    source_type: SourceType,
+    html_backend: str = AUTO_HTML_BACKEND,
+) -> list[Notice]:
+    soup = make_soup(html, backend=html_backend)
     notices: list[Notice] = []
 
     for item in soup.select("#notices .notice-item"):
@@ -36,7 +57,7 @@ def parse_sample_city_notices(
         except ValueError:
             continue
 
-        if published_date != target_date:
+        if not start_date <= published_date <= end_date:
             continue
 
         title = link.get_text(strip=True)
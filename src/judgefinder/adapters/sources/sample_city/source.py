@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from judgefinder.adapters.sources.sample_city.parser import parse_sample_city_notices
+from judgefinder.adapters.sources.sample_city.parser import parse_sample_city_notices_between
 from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.run_metrics import record_page, record_parse
 from judgefinder.infrastructure.http.client import HttpClient
 
 
@@ -21,18 +23,32 @@ class SampleCitySource:
     fixture_path: Path | None = None
 
     def fetch(self, target_date: date) -> list[Notice]:
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
         html = self._load_html()
         fetched_at = datetime.now(tz=self.timezone)
-        return parse_sample_city_notices(
+        started = time.perf_counter()
+        notices = parse_sample_city_notices_between(
             html,
             municipality=self.municipality,
             list_url=self.list_url,
-            target_date=target_date,
+            start_date=start_date,
+            end_date=end_date,
             fetched_at=fetched_at,
             source_type=self.source_type,
         )
+        record_parse(seconds=time.perf_counter() - started, candidates=len(notices))
+        return notices
 
     def _load_html(self) -> str:
         if self.fixture_path is not None:
             return self.fixture_path.read_text(encoding="utf-8")
-        return self.http_client.get_text(self.list_url)
+        started = time.perf_counter()
+        html = self.http_client.get_text(self.list_url)
+        record_page(
+            size_bytes=len(html.encode("utf-8")),
+            seconds=time.perf_counter() - started,
+            retries=0,
+        )
+        return html
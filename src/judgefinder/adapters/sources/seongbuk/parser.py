@@ -27,6 +27,30 @@ def parse_seongbuk_notices(
     source_type: SourceType,
     keywords: Iterable[str] = DEFAULT_KEYWORDS,
 ) -> list[Notice]:
+    return parse_seongbuk_notices_between(
+        rss_xml,
+        municipality=municipality,
+        list_url=list_url,
+        start_date=target_date,
+        end_date=target_date,
+        fetched_at=fetched_at,
+        source_type=source_type,
+        keywords=keywords,
+    )
+
+
+def parse_seongbuk_notices_between(
+    rss_xml: str,
+    *,
+    municipality: str,
+    list_url: str,
+    start_date: date,
+    end_date: date,
+    fetched_at: datetime,
+    source_type: SourceType,
+    keywords: Iterable[str] = DEFAULT_KEYWORDS,
+) -> list[Notice]:
+    """Parse feed items published between ``start_date`` and ``end_date`` inclusive."""
     try:
         root = ET.fromstring(rss_xml)
     except ET.ParseError:
@@ -44,7 +68,7 @@ def parse_seongbuk_notices(
         content_encoded = _extract_text(item, "{http://purl.org/rss/1.0/modules/content/}encoded")
 
         published_date = _parse_regdate(regdate_text)
-        if published_date is None or published_date != target_date:
+        if published_date is None or not start_date <= published_date <= end_date:
             continue
         if not title or not link:
             continue
@@ -68,6 +92,15 @@ def parse_seongbuk_notices(
     return notices
 
 
+def parse_seongbuk_item_dates(rss_xml: str) -> list[date | None]:
+    """Publication date of every feed item, ``None`` where it is missing or invalid."""
+    try:
+        root = ET.fromstring(rss_xml)
+    except ET.ParseError:
+        return []
+    return [_parse_regdate(_extract_text(item, "regdate")) for item in root.findall(".//item")]
+
+
 def _extract_text(item: ET.Element, tag: str) -> str:
     node = item.find(tag)
     if node is None or node.text is None:
@@ -1,3 +1,13 @@
-from judgefinder.application.use_cases import CollectNoticesUseCase, ListNoticesUseCase
+from judgefinder.application.use_cases import (
+    CollectNoticesUseCase,
+    CoverageIssue,
+    ListNoticesUseCase,
+    VerifyShardCoverageUseCase,
+)
 
-__all__ = ["CollectNoticesUseCase", "ListNoticesUseCase"]
+__all__ = [
+    "CollectNoticesUseCase",
+    "CoverageIssue",
+    "ListNoticesUseCase",
+    "VerifyShardCoverageUseCase",
+]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Collection
+
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.deadline import Deadline, deadline_scope
+from judgefinder.domain.entities import CollectionJob, SourceRunStatus
+from judgefinder.domain.ports import CollectionJobQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Share of the lease a job may use, leaving time to record the outcome before it expires.
+LEASE_WORK_FRACTION = 0.9
+
+
+class CollectionWorker:
+    """Lease (source, date range) jobs from the shared queue and collect them one by one."""
+
+    def __init__(
+        self,
+        queue: CollectionJobQueue,
+        collect_use_case: Callable[[], CollectNoticesUseCase],
+        *,
+        owner: str,
+        lease_seconds: float,
+        source_slugs: Collection[str] | None = None,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive.")
+        self._queue = queue
+        self._collect_use_case = collect_use_case
+        self._owner = owner
+        self._lease_seconds = lease_seconds
+        self._source_slugs = source_slugs
+
+    def run_once(self) -> CollectionJob | None:
+        """Process one job; returns it, or None when nothing was available."""
+        job = self._queue.lease(
+            self._owner,
+            self._lease_seconds,
+            source_slugs=self._source_slugs,
+        )
+        if job is None:
+            return None
+
+        use_case = self._collect_use_case()
+        # Finish inside the lease so no other worker picks the job up while it still runs.
+        deadline = Deadline.after(self._lease_seconds * LEASE_WORK_FRACTION)
+        try:
+            with deadline_scope(deadline):
+                use_case.execute_range(
+                    job.start_date,
+                    job.end_date,
+                    source_slugs=[job.source_slug],
+                )
+        except Exception as exc:  # pragma: no cover - storage failure branch
+            self._fail(job, str(exc))
+            return job
+
+        status = use_case.source_statuses.get(job.source_slug)
+        if status is SourceRunStatus.OK:
+            if not self._queue.complete(job):
+                LOGGER.warning("Lease on job %s expired before it finished", job.id)
+        elif status is None:
+            self._fail(job, f"source '{job.source_slug}' is not enabled on this worker")
+        else:
+            self._fail(job, f"source finished with status '{status.value}'")
+        return job
+
+    def run(
+        self,
+        stop: threading.Event,
+        *,
+        idle_seconds: float = 5.0,
+        drain: bool = False,
+    ) -> int:
+        """Work until ``stop`` is set, or until the queue is empty with ``drain``."""
+        processed = 0
+        while not stop.is_set():
+            if self.run_once() is not None:
+                processed += 1
+                continue
+            if drain:
+                break
+            stop.wait(idle_seconds)
+        return processed
+
+    def _fail(self, job: CollectionJob, error: str) -> None:
+        LOGGER.warning(
+            "Job %s (%s, attempt %s/%s) failed: %s",
+            job.id,
+            job.source_slug,
+            job.attempts,
+            job.max_attempts,
+            error,
+        )
+        if not self._queue.fail(job, error):
+            LOGGER.warning("Lease on job %s expired before it finished", job.id)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+
+from judgefinder.domain.entities import Notice
+
+LOGGER = logging.getLogger(__name__)
+
+CollectSources = Callable[[Sequence[str]], list[Notice]]
+
+
+class PollingCollector:
+    """Poll every source on its own interval inside one long-lived process.
+
+    ``collect`` receives the slugs that are due and returns the notices it saved. Sources
+    that come due together are collected in one call so they still share the worker pool.
+    """
+
+    def __init__(
+        self,
+        collect: CollectSources,
+        intervals: Mapping[str, float],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._collect = collect
+        self._clock = clock
+        self._intervals: dict[str, float] = {}
+        self._next_due: dict[str, float] = {}
+        self.reschedule(intervals)
+
+    @property
+    def intervals(self) -> dict[str, float]:
+        return dict(self._intervals)
+
+    def reschedule(self, intervals: Mapping[str, float]) -> None:
+        """Apply new intervals; known sources keep their last poll, new ones are due now."""
+        now = self._clock()
+        next_due: dict[str, float] = {}
+        for slug, interval in intervals.items():
+            if interval <= 0:
+                raise ValueError(f"Poll interval for '{slug}' must be positive.")
+            previous_interval = self._intervals.get(slug)
+            if previous_interval is None:
+                next_due[slug] = now
+            else:
+                last_polled = self._next_due[slug] - previous_interval
+                next_due[slug] = last_polled + interval
+        self._intervals = dict(intervals)
+        self._next_due = next_due
+
+    def due_slugs(self) -> list[str]:
+        now = self._clock()
+        return [slug for slug, due_at in self._next_due.items() if due_at <= now]
+
+    def seconds_until_due(self) -> float:
+        if not self._next_due:
+            return float("inf")
+        return max(0.0, min(self._next_due.values()) - self._clock())
+
+    def run_due(self) -> list[Notice]:
+        due = self.due_slugs()
+        if not due:
+            return []
+        now = self._clock()
+        for slug in due:
+            self._next_due[slug] = now + self._intervals[slug]
+        try:
+            return self._collect(due)
+        except Exception as exc:  # pragma: no cover - storage failure branch
+            LOGGER.error("Polling %s failed: %s", ", ".join(due), exc)
+            return []
+
+    def run_forever(
+        self,
+        stop: threading.Event,
+        *,
+        on_idle: Callable[[], None] | None = None,
+        idle_seconds: float = 1.0,
+    ) -> None:
+        """Poll until ``stop`` is set; ``on_idle`` runs between polls (config reloads)."""
+        while not stop.is_set():
+            self.run_due()
+            if on_idle is not None:
+                on_idle()
+            stop.wait(min(idle_seconds, self.seconds_until_due()))
@@ -1,46 +1,505 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
-from collections.abc import Sequence
-from datetime import date
+import threading
+import time
+from collections.abc import Collection, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlparse
 
-from judgefinder.domain.entities import Notice
-from judgefinder.domain.ports import NoticeRepository, NoticeSource
+from judgefinder.domain.crawl_cursor import CrawlCursor, CrawlProgress, crawl_progress_scope
+from judgefinder.domain.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    PartialFetchError,
+    QuotaExhaustedError,
+    current_deadline,
+    deadline_scope,
+)
+from judgefinder.domain.entities import Notice, SourceRun, SourceRunStatus
+from judgefinder.domain.ports import (
+    AsyncNoticeSource,
+    AsyncRangeNoticeSource,
+    CrawlCursorRepository,
+    HostConcurrencyLimits,
+    NoticeRepository,
+    NoticeSource,
+    RangeNoticeSource,
+    SourceCircuitBreaker,
+    SourceRunRepository,
+)
+from judgefinder.domain.run_metrics import RunMetrics, source_metrics_scope
+from judgefinder.domain.tracing import RUN_GROUP, SOURCE_LANE, trace_lane, trace_span
 
 LOGGER = logging.getLogger(__name__)
 
 
 class CollectNoticesUseCase:
-    def __init__(self, repository: NoticeRepository, sources: Sequence[NoticeSource]) -> None:
+    def __init__(
+        self,
+        repository: NoticeRepository,
+        sources: Sequence[NoticeSource],
+        *,
+        max_workers: int = 1,
+        per_host_limit: int = 2,
+        circuit_breaker: SourceCircuitBreaker | None = None,
+        run_budget_seconds: float = 0.0,
+        cursor_repository: CrawlCursorRepository | None = None,
+        run_log: SourceRunRepository | None = None,
+        shard_label: str = "",
+        host_limits: HostConcurrencyLimits | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1.")
         self._repository = repository
         self._sources = list(sources)
+        self._max_workers = max_workers
+        self._per_host_limit = per_host_limit
+        self._circuit_breaker = circuit_breaker
+        self._run_budget_seconds = run_budget_seconds
+        self._cursor_repository = cursor_repository
+        self._run_log = run_log
+        self._shard_label = shard_label
+        self._host_limits = host_limits
+        self._pending_runs: list[SourceRun] = []
+        self._pending_cursors: list[CrawlCursor] = []
+        self._source_statuses: dict[str, SourceRunStatus] = {}
+        self._partial_lock = threading.Lock()
+        self._partial_sources: list[str] = []
+        self._metrics = RunMetrics()
 
-    def execute(self, target_date: date) -> list[Notice]:
-        notices: list[Notice] = []
-        seen_keys: set[tuple[str, str]] = set()
+    @property
+    def partial_sources(self) -> tuple[str, ...]:
+        """Slugs of sources that ran out of time during the last execution."""
+        with self._partial_lock:
+            return tuple(self._partial_sources)
 
-        for source in self._sources:
-            try:
-                fetched_notices = source.fetch(target_date)
-            except Exception as exc:  # pragma: no cover - network failure branch
-                source_slug = getattr(source, "slug", source.__class__.__name__)
-                LOGGER.warning(
-                    "Skipping source '%s' on %s due to fetch error: %s",
-                    source_slug,
-                    target_date.isoformat(),
-                    exc,
+    @property
+    def source_statuses(self) -> dict[str, SourceRunStatus]:
+        """Outcome of every source fetched during the last execution."""
+        with self._partial_lock:
+            return dict(self._source_statuses)
+
+    @property
+    def metrics(self) -> RunMetrics:
+        """Per-source fetch, parse and persist metrics of the last execution."""
+        return self._metrics
+
+    def execute(self, target_date: date, *, max_workers: int | None = None) -> list[Notice]:
+        return self.execute_range(target_date, target_date, max_workers=max_workers)
+
+    def execute_range(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        max_workers: int | None = None,
+        source_slugs: Collection[str] | None = None,
+    ) -> list[Notice]:
+        """Collect every notice published between ``start_date`` and ``end_date`` inclusive.
+
+        Range-aware sources walk their list pages once for the whole window; other sources
+        are fetched once per date. Results are ordered by date, then by source order.
+        ``source_slugs`` restricts the run to those sources.
+        """
+        _validate_range(start_date, end_date)
+        workers = max_workers if max_workers is not None else self._max_workers
+        sources = self._select_sources(source_slugs)
+        self._reset_partial_sources()
+        with (
+            deadline_scope(self._run_deadline()),
+            trace_lane("run", group=RUN_GROUP),
+            trace_span("fetch sources", category="run", sources=len(sources)),
+        ):
+            if workers <= 1 or len(sources) <= 1:
+                fetched_by_source = [
+                    self._fetch_source(source, start_date, end_date) for source in sources
+                ]
+            else:
+                fetched_by_source = self._fetch_concurrently(
+                    sources,
+                    start_date,
+                    end_date,
+                    workers=workers,
                 )
-                continue
+        return self._merge_and_save(sources, fetched_by_source)
+
+    async def execute_async(
+        self,
+        target_date: date,
+        *,
+        max_workers: int | None = None,
+    ) -> list[Notice]:
+        return await self.execute_range_async(target_date, target_date, max_workers=max_workers)
+
+    async def execute_range_async(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        max_workers: int | None = None,
+        source_slugs: Collection[str] | None = None,
+    ) -> list[Notice]:
+        _validate_range(start_date, end_date)
+        workers = max_workers if max_workers is not None else self._max_workers
+        sources = self._select_sources(source_slugs)
+        worker_slots = asyncio.Semaphore(workers)
+        host_usage: dict[str, int] = {}
+        host_freed = asyncio.Condition()
+
+        async def fetch_with_limits(source: NoticeSource) -> list[Notice]:
+            host = _source_host(source)
+            if not host:
+                async with worker_slots:
+                    return await self._fetch_source_async(source, start_date, end_date)
+            async with host_freed:
+                # The limit is read on every wake-up, so an adaptive limit applies as it moves.
+                await host_freed.wait_for(lambda: host_usage.get(host, 0) < self._host_limit(host))
+                host_usage[host] = host_usage.get(host, 0) + 1
+            try:
+                async with worker_slots:
+                    return await self._fetch_source_async(source, start_date, end_date)
+            finally:
+                async with host_freed:
+                    host_usage[host] -= 1
+                    host_freed.notify_all()
+
+        self._reset_partial_sources()
+        with (
+            deadline_scope(self._run_deadline()),
+            trace_lane("run", group=RUN_GROUP),
+            trace_span("fetch sources", category="run", sources=len(sources)),
+        ):
+            fetched_by_source = await asyncio.gather(
+                *(fetch_with_limits(source) for source in sources)
+            )
+        return self._merge_and_save(sources, list(fetched_by_source))
+
+    def _select_sources(self, source_slugs: Collection[str] | None) -> list[NoticeSource]:
+        if source_slugs is None:
+            return self._sources
+        return [source for source in self._sources if _source_slug(source) in source_slugs]
+
+    def _run_deadline(self) -> Deadline | None:
+        if self._run_budget_seconds <= 0:
+            return None
+        return Deadline.after(self._run_budget_seconds)
+
+    def _reset_partial_sources(self) -> None:
+        with self._partial_lock:
+            self._partial_sources = []
+            self._source_statuses = {}
+            self._pending_cursors = []
+            self._metrics = RunMetrics()
 
+    def _merge_and_save(
+        self,
+        sources: list[NoticeSource],
+        fetched_by_source: list[list[Notice]],
+    ) -> list[Notice]:
+        notices: list[Notice] = []
+        seen_keys: set[tuple[str, str]] = set()
+        stored_counts: dict[tuple[str, date], int] = {}
+        for source, fetched_notices in zip(sources, fetched_by_source, strict=True):
             for notice in fetched_notices:
                 if notice.unique_key in seen_keys:
                     continue
                 seen_keys.add(notice.unique_key)
                 notices.append(notice)
+                key = (_source_slug(source), notice.published_date)
+                stored_counts[key] = stored_counts.get(key, 0) + 1
+
+        # sort is stable, so notices of the same day keep the configured source order.
+        notices.sort(key=lambda notice: notice.published_date)
+        with self._partial_lock:
+            cursors, self._pending_cursors = self._pending_cursors, []
+        with trace_lane("db", group=RUN_GROUP):
+            started = time.perf_counter()
+            with trace_span("save notices", category="db", notices=len(notices)):
+                self._repository.save_many(notices)
+            self._metrics.record_persist(time.perf_counter() - started, stored_counts)
+            # Cursors only move once the notices they skip past are stored; if saving
+            # fails or the process dies first, the next run walks the pages again.
+            self._save_cursors(cursors)
+            self._flush_runs()
+        return notices
+
+    def _save_cursors(self, cursors: list[CrawlCursor]) -> None:
+        if self._cursor_repository is None or not cursors:
+            return
+        with trace_span("save cursors", category="db", cursors=len(cursors)):
+            for cursor in cursors:
+                self._cursor_repository.save(cursor)
+
+    def _flush_runs(self) -> None:
+        with self._partial_lock:
+            runs, self._pending_runs = self._pending_runs, []
+        if self._run_log is not None:
+            with trace_span("save runs", category="db", runs=len(runs)):
+                self._run_log.save_runs(runs)
+
+    def _fetch_concurrently(
+        self,
+        sources: list[NoticeSource],
+        start_date: date,
+        end_date: date,
+        *,
+        workers: int,
+    ) -> list[list[Notice]]:
+        # Results are slotted by source index so dedupe keeps the configured source order.
+        results: list[list[Notice]] = [[] for _ in sources]
+        pending = list(range(len(sources)))
+        running: dict[Future[list[Notice]], int] = {}
+        host_usage: dict[str, int] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collect") as executor:
+            while pending or running:
+                for index in list(pending):
+                    if len(running) >= workers:
+                        break
+                    host = _source_host(sources[index])
+                    if host and host_usage.get(host, 0) >= self._host_limit(host):
+                        continue
+                    pending.remove(index)
+                    if host:
+                        host_usage[host] = host_usage.get(host, 0) + 1
+                    # Worker threads do not inherit context variables such as the deadline.
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._fetch_source,
+                        sources[index],
+                        start_date,
+                        end_date,
+                    )
+                    running[future] = index
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    host = _source_host(sources[index])
+                    if host:
+                        host_usage[host] -= 1
+                    results[index] = future.result()
+
+        return results
+
+    def _host_limit(self, host: str) -> int:
+        if self._host_limits is None:
+            return self._per_host_limit
+        return max(1, int(self._host_limits.limit_for(host)))
+
+    def _fetch_source(self, source: NoticeSource, start_date: date, end_date: date) -> list[Notice]:
+        started = time.perf_counter()
+        slug = _source_slug(source)
+        metrics = self._metrics.for_source(slug)
+        with (
+            source_metrics_scope(metrics),
+            trace_lane(SOURCE_LANE, group=slug),
+            trace_span("fetch", category="source", period=_format_period(start_date, end_date)),
+        ):
+            notices, status = self._fetch_source_outcome(source, start_date, end_date)
+        metrics.record_kept(notice.published_date for notice in notices)
+        self._record_run(source, start_date, end_date, status, started, notices)
+        return notices
+
+    def _fetch_source_outcome(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[list[Notice], SourceRunStatus]:
+        if not self._circuit_allows(source, start_date, end_date):
+            return [], SourceRunStatus.SKIPPED
+        if _run_deadline_passed():
+            self._record_partial(source, start_date, end_date, "run deadline exceeded", [])
+            return [], SourceRunStatus.SKIPPED
+        notices: list[Notice] = []
+        progress = self._start_progress(source, start_date, end_date)
+        try:
+            with crawl_progress_scope(progress):
+                if start_date == end_date:
+                    notices = source.fetch(start_date)
+                elif isinstance(source, RangeNoticeSource):
+                    notices = source.fetch_range(start_date, end_date)
+                else:
+                    for target_date in _iter_dates(start_date, end_date):
+                        notices.extend(source.fetch(target_date))
+        except PartialFetchError as exc:
+            notices.extend(exc.notices)
+            self._record_partial(source, start_date, end_date, exc.reason, notices)
+            return notices, SourceRunStatus.PARTIAL
+        except DeadlineExceededError as exc:
+            self._record_partial(source, start_date, end_date, str(exc), notices)
+            return notices, SourceRunStatus.PARTIAL
+        except QuotaExhaustedError as exc:
+            # Not the source's fault, so the circuit breaker does not count it.
+            _log_skipped_source(source, start_date, end_date, exc)
+            return notices, SourceRunStatus.SKIPPED
+        except Exception as exc:  # pragma: no cover - network failure branch
+            self._record_failure(source)
+            _log_skipped_source(source, start_date, end_date, exc)
+            return [], SourceRunStatus.FAILED
+        self._record_success(source)
+        self._advance_cursor(source, progress)
+        return notices, SourceRunStatus.OK
 
-        self._repository.save_many(notices)
+    async def _fetch_source_async(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+    ) -> list[Notice]:
+        started = time.perf_counter()
+        slug = _source_slug(source)
+        metrics = self._metrics.for_source(slug)
+        with (
+            source_metrics_scope(metrics),
+            trace_lane(SOURCE_LANE, group=slug),
+            trace_span("fetch", category="source", period=_format_period(start_date, end_date)),
+        ):
+            notices, status = await self._fetch_source_outcome_async(source, start_date, end_date)
+        metrics.record_kept(notice.published_date for notice in notices)
+        self._record_run(source, start_date, end_date, status, started, notices)
         return notices
 
+    async def _fetch_source_outcome_async(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[list[Notice], SourceRunStatus]:
+        if not self._circuit_allows(source, start_date, end_date):
+            return [], SourceRunStatus.SKIPPED
+        if _run_deadline_passed():
+            self._record_partial(source, start_date, end_date, "run deadline exceeded", [])
+            return [], SourceRunStatus.SKIPPED
+        notices: list[Notice] = []
+        progress = self._start_progress(source, start_date, end_date)
+        try:
+            with crawl_progress_scope(progress):
+                if isinstance(source, AsyncRangeNoticeSource):
+                    notices = await source.fetch_range_async(start_date, end_date)
+                elif start_date != end_date and isinstance(source, RangeNoticeSource):
+                    notices = await asyncio.to_thread(source.fetch_range, start_date, end_date)
+                else:
+                    for target_date in _iter_dates(start_date, end_date):
+                        if isinstance(source, AsyncNoticeSource):
+                            notices.extend(await source.fetch_async(target_date))
+                        else:
+                            notices.extend(await asyncio.to_thread(source.fetch, target_date))
+        except PartialFetchError as exc:
+            notices.extend(exc.notices)
+            self._record_partial(source, start_date, end_date, exc.reason, notices)
+            return notices, SourceRunStatus.PARTIAL
+        except DeadlineExceededError as exc:
+            self._record_partial(source, start_date, end_date, str(exc), notices)
+            return notices, SourceRunStatus.PARTIAL
+        except QuotaExhaustedError as exc:
+            # Not the source's fault, so the circuit breaker does not count it.
+            _log_skipped_source(source, start_date, end_date, exc)
+            return notices, SourceRunStatus.SKIPPED
+        except Exception as exc:  # pragma: no cover - network failure branch
+            self._record_failure(source)
+            _log_skipped_source(source, start_date, end_date, exc)
+            return [], SourceRunStatus.FAILED
+        self._record_success(source)
+        self._advance_cursor(source, progress)
+        return notices, SourceRunStatus.OK
+
+    def _circuit_allows(self, source: NoticeSource, start_date: date, end_date: date) -> bool:
+        if self._circuit_breaker is None or self._circuit_breaker.allow(_source_slug(source)):
+            return True
+        LOGGER.warning(
+            "Skipping source '%s' on %s: circuit open after repeated failures",
+            _source_slug(source),
+            _format_period(start_date, end_date),
+        )
+        return False
+
+    def _record_partial(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+        reason: str,
+        notices: list[Notice],
+    ) -> None:
+        LOGGER.warning(
+            "Source '%s' on %s stopped early (%s); keeping %s notices collected so far",
+            _source_slug(source),
+            _format_period(start_date, end_date),
+            reason,
+            len(notices),
+        )
+        with self._partial_lock:
+            self._partial_sources.append(_source_slug(source))
+
+    def _record_run(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+        status: SourceRunStatus,
+        started: float,
+        notices: list[Notice],
+    ) -> None:
+        with self._partial_lock:
+            self._source_statuses[_source_slug(source)] = status
+        if self._run_log is None:
+            return
+        dates = _iter_dates(start_date, end_date)
+        # A range is walked once, so its time is spread evenly over the dates it covered.
+        duration_per_date = (time.perf_counter() - started) / len(dates)
+        finished_at = datetime.now(tz=timezone.utc)
+        runs = [
+            SourceRun(
+                source_slug=_source_slug(source),
+                target_date=target_date,
+                shard=self._shard_label,
+                status=status,
+                duration_seconds=duration_per_date,
+                notice_count=sum(1 for notice in notices if notice.published_date == target_date),
+                finished_at=finished_at,
+            )
+            for target_date in dates
+        ]
+        with self._partial_lock:
+            self._pending_runs.extend(runs)
+
+    def _start_progress(
+        self,
+        source: NoticeSource,
+        start_date: date,
+        end_date: date,
+    ) -> CrawlProgress | None:
+        if self._cursor_repository is None:
+            return None
+        cursor = self._cursor_repository.load(_source_slug(source))
+        return CrawlProgress(cursor, start_date, end_date)
+
+    def _advance_cursor(self, source: NoticeSource, progress: CrawlProgress | None) -> None:
+        # Only complete walks move the cursor; partial or failed ones left rows unseen.
+        if self._cursor_repository is None or progress is None:
+            return
+        cursor = progress.advanced_cursor(_source_slug(source))
+        if cursor is not None:
+            with self._partial_lock:
+                self._pending_cursors.append(cursor)
+
+    def _record_success(self, source: NoticeSource) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success(_source_slug(source))
+
+    def _record_failure(self, source: NoticeSource) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_failure(_source_slug(source))
+
 
 class ListNoticesUseCase:
     def __init__(self, repository: NoticeRepository) -> None:
@@ -48,3 +507,88 @@ class ListNoticesUseCase:
 
     def execute(self, target_date: date) -> list[Notice]:
         return self._repository.list_by_date(target_date)
+
+
+@dataclass(frozen=True, slots=True)
+class CoverageIssue:
+    source_slug: str
+    target_date: date
+    shards: tuple[str, ...]
+
+    @property
+    def missing(self) -> bool:
+        return not self.shards
+
+
+class VerifyShardCoverageUseCase:
+    """Check that every source was collected by exactly one shard on every date."""
+
+    def __init__(self, run_log: SourceRunRepository) -> None:
+        self._run_log = run_log
+
+    def execute(
+        self,
+        source_slugs: Sequence[str],
+        start_date: date,
+        end_date: date,
+    ) -> list[CoverageIssue]:
+        _validate_range(start_date, end_date)
+        shards_by_key: dict[tuple[str, date], set[str]] = {}
+        for run in self._run_log.list_runs(start_date, end_date):
+            if run.status.collected:
+                shards_by_key.setdefault((run.source_slug, run.target_date), set()).add(run.shard)
+
+        issues: list[CoverageIssue] = []
+        for target_date in _iter_dates(start_date, end_date):
+            for slug in source_slugs:
+                shards = shards_by_key.get((slug, target_date), set())
+                if len(shards) != 1:
+                    issues.append(CoverageIssue(slug, target_date, tuple(sorted(shards))))
+        return issues
+
+
+def _source_host(source: NoticeSource) -> str:
+    list_url = getattr(source, "list_url", "")
+    if not isinstance(list_url, str) or not list_url:
+        return ""
+    return urlparse(list_url).netloc.lower()
+
+
+def _run_deadline_passed() -> bool:
+    deadline = current_deadline()
+    return deadline is not None and deadline.remaining() <= 0
+
+
+def _validate_range(start_date: date, end_date: date) -> None:
+    if start_date > end_date:
+        raise ValueError("start_date must not be after end_date.")
+
+
+def _iter_dates(start_date: date, end_date: date) -> list[date]:
+    return [
+        start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)
+    ]
+
+
+def _log_skipped_source(
+    source: NoticeSource,
+    start_date: date,
+    end_date: date,
+    exc: Exception,
+) -> None:
+    LOGGER.warning(
+        "Skipping source '%s' on %s due to fetch error: %s",
+        _source_slug(source),
+        _format_period(start_date, end_date),
+        exc,
+    )
+
+
+def _source_slug(source: NoticeSource) -> str:
+    return str(getattr(source, "slug", source.__class__.__name__))
+
+
+def _format_period(start_date: date, end_date: date) -> str:
+    if start_date == end_date:
+        return start_date.isoformat()
+    return f"{start_date.isoformat()}..{end_date.isoformat()}"
@@ -1,19 +1,84 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+from sqlalchemy.orm import Session, sessionmaker
+
 from judgefinder.adapters.config import AppConfig, load_config
 from judgefinder.adapters.source_registry import SourceRegistry
+from judgefinder.adapters.sources.generic_engine.parse_pool import GenericEngineParsePool
+from judgefinder.adapters.sources.page_cache import PageCache
 from judgefinder.application.use_cases import CollectNoticesUseCase, ListNoticesUseCase
-from judgefinder.infrastructure.db.repository import SqlAlchemyNoticeRepository
+from judgefinder.domain.sharding import ShardSpec
+from judgefinder.domain.tracing import trace_span
+from judgefinder.infrastructure.db.circuit_breaker import SqlAlchemyCircuitBreaker
+from judgefinder.infrastructure.db.daily_quota import SqlAlchemyDailyQuotaStore
+from judgefinder.infrastructure.db.job_queue import SqlAlchemyCollectionJobQueue
+from judgefinder.infrastructure.db.repository import (
+    SqlAlchemyCrawlCursorRepository,
+    SqlAlchemyNoticeRepository,
+    SqlAlchemySourceRunRepository,
+    merge_sqlite_database,
+)
 from judgefinder.infrastructure.db.session import (
     create_schema,
     create_session_factory,
     create_sqlite_engine,
 )
-from judgefinder.infrastructure.http.client import RequestsHttpClient
+from judgefinder.infrastructure.http.adaptive import (
+    AdaptiveConcurrencyAsyncHttpClient,
+    AdaptiveConcurrencyHttpClient,
+    AimdController,
+    AimdSettings,
+)
+from judgefinder.infrastructure.http.cassette import RecordingHttpClient, ReplayHttpClient
+from judgefinder.infrastructure.http.client import (
+    AsyncHttpClient,
+    HttpClient,
+    RequestsHttpClient,
+    ThreadedAsyncHttpClient,
+)
+from judgefinder.infrastructure.http.conditional_cache import (
+    ConditionalGetAsyncHttpClient,
+    ConditionalGetHttpClient,
+    HttpCacheStore,
+)
+from judgefinder.infrastructure.http.hedging import (
+    HedgePolicy,
+    HedgeSettings,
+    HedgingAsyncHttpClient,
+    HedgingHttpClient,
+)
+from judgefinder.infrastructure.http.rate_limit import (
+    HostRateLimiter,
+    RateLimitedAsyncHttpClient,
+    RateLimitedHttpClient,
+)
+from judgefinder.infrastructure.http.retry import RetryBudget, RetryPolicy
+
+LOGGER = logging.getLogger(__name__)
+
+# Collection settings read once per use case; every other [collection] key shapes the
+# shared HTTP stack and caches, so it only takes effect after a restart.
+RELOADABLE_COLLECTION_KEYS: tuple[str, ...] = (
+    "workers",
+    "per_host_limit",
+    "runner",
+    "run_budget_seconds",
+    "poll_interval_seconds",
+    "incremental",
+)
+
+# Requests one collection worker can have in flight: a page and its prefetched successor,
+# each of which may be hedged. Thread pools grow lazily, so unused slots cost nothing.
+THREADS_PER_WORKER = 4
+
+CollectionBuilder = Callable[[AppConfig, ZoneInfo], tuple[SourceRegistry, CollectNoticesUseCase]]
 
 
 @dataclass(slots=True)
@@ -23,12 +88,113 @@ class AppContainer:
     source_registry: SourceRegistry
     collect_use_case: CollectNoticesUseCase
     list_use_case: ListNoticesUseCase
+    page_cache: PageCache
+    http_cache: HttpCacheStore | None = None
+    parse_pool: GenericEngineParsePool | None = None
+    base_http_client: RequestsHttpClient | None = None
+    hedge_policy: HedgePolicy | None = None
+    hedging_http_client: HedgingHttpClient | None = None
+    async_transport: ThreadedAsyncHttpClient | None = None
+    config_path: Path | None = None
+    retry_budget: RetryBudget | None = None
+    collection_builder: CollectionBuilder | None = None
+    run_log: SqlAlchemySourceRunRepository | None = None
+    session_factory: sessionmaker[Session] | None = None
+    shard: ShardSpec | None = None
+    job_queue: SqlAlchemyCollectionJobQueue | None = None
+    recorder: RecordingHttpClient | None = None
+    replay_http_client: ReplayHttpClient | None = None
+
+    def reload_config(self) -> None:
+        """Re-read ``config_path`` and rebuild the sources on top of the warm HTTP stack.
+
+        Connections, caches, rate limiters and the database engine are kept, so settings
+        that shape them are logged and ignored until the next restart.
+        """
+        if self.config_path is None or self.collection_builder is None:
+            raise RuntimeError("This container was not created from a config file.")
+        with trace_span("load config", category="config"):
+            config = load_config(self.config_path, base_dir=_infer_base_dir(self.config_path))
+        ignored = _restart_only_changes(self.config, config)
+        if ignored:
+            LOGGER.warning("Restart to apply changed settings: %s", ", ".join(ignored))
+        timezone = ZoneInfo(config.timezone)
+        self.source_registry, self.collect_use_case = self.collection_builder(config, timezone)
+        self.config = config
+        self.timezone = timezone
+        self.size_for_workers(config.collection.workers)
+
+    def size_for_workers(self, workers: int) -> None:
+        """Give the asyncio runner enough threads for ``workers`` concurrent sources."""
+        if self.async_transport is not None:
+            self.async_transport.set_max_threads(THREADS_PER_WORKER * workers)
 
+    def merge_database(self, other_db_path: Path) -> None:
+        """Fold another shard's notices and run history into this node's database."""
+        if self.session_factory is None:
+            raise RuntimeError("This container has no database session.")
+        merge_sqlite_database(self.session_factory, other_db_path)
 
-def create_app(config_path: str | Path = "config/config.toml") -> AppContainer:
+    def close(self) -> None:
+        if self.recorder is not None:
+            self.recorder.save()
+            LOGGER.info("Recorded %s HTTP interactions", self.recorder.interaction_count)
+            self.recorder = None
+        if self.replay_http_client is not None and self.replay_http_client.misses:
+            LOGGER.warning(
+                "%s requests had no recording in the cassette",
+                self.replay_http_client.misses,
+            )
+        if self.hedging_http_client is not None:
+            self.hedging_http_client.close()
+            self.hedging_http_client = None
+        if self.async_transport is not None:
+            self.async_transport.close()
+            self.async_transport = None
+        if self.base_http_client is not None:
+            self.base_http_client.close()
+            self.base_http_client = None
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+            self.parse_pool = None
+
+
+def create_app(
+    config_path: str | Path = "config/config.toml",
+    *,
+    shard: ShardSpec | None = None,
+    shard_costs: Mapping[str, float] | None = None,
+    record_path: Path | None = None,
+    replay_path: Path | None = None,
+    replay_latency_scale: float = 0.0,
+    serial: bool = False,
+) -> AppContainer:
+    """Wire the application; ``record_path`` and ``replay_path`` select a cassette mode.
+
+    Recording captures every request the run sends. Replaying answers from a cassette
+    without touching the network and skips rate limits, hedging and the breaker, so the
+    run measures this process alone. Both modes turn off the conditional HTTP cache and
+    the crawl cursor, whose state would otherwise change what the next run requests.
+    ``serial`` collects one source at a time on the calling thread, without hedged
+    requests or parse processes, which is what a profiler needs to attribute work.
+    """
+    if record_path is not None and replay_path is not None:
+        raise ValueError("Cannot record and replay a cassette in the same run.")
     resolved_config_path = Path(config_path).resolve()
     base_dir = _infer_base_dir(resolved_config_path)
-    config = load_config(resolved_config_path, base_dir=base_dir)
+    with trace_span("load config", category="config"):
+        config = load_config(resolved_config_path, base_dir=base_dir)
+    if serial:
+        config = replace(
+            config,
+            collection=replace(
+                config.collection,
+                workers=1,
+                runner="threads",
+                parse_processes=0,
+                hedge_requests=False,
+            ),
+        )
 
     timezone = ZoneInfo(config.timezone)
     config.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -37,12 +203,160 @@ def create_app(config_path: str | Path = "config/config.toml") -> AppContainer:
     create_schema(engine)
     session_factory = create_session_factory(engine)
     repository = SqlAlchemyNoticeRepository(session_factory)
+    run_log = SqlAlchemySourceRunRepository(
+        session_factory,
+        retention_days=config.collection.run_log_retention_days,
+    )
+    job_queue = SqlAlchemyCollectionJobQueue(
+        session_factory,
+        max_attempts=config.collection.job_max_attempts,
+        retry_delay_seconds=config.collection.job_retry_seconds,
+    )
+
+    state_dir = config.collection.state_dir or config.db_path.parent / "state"
+    rate_limiter = HostRateLimiter(
+        quota_store=SqlAlchemyDailyQuotaStore(
+            session_factory,
+            today=lambda: datetime.now(tz=timezone).date(),
+        )
+    )
+    cassette_mode = record_path is not None or replay_path is not None
+    if cassette_mode:
+        config = replace(
+            config,
+            collection=replace(config.collection, http_cache=False, incremental=False),
+        )
+    replay_http_client = (
+        ReplayHttpClient.from_file(replay_path, latency_scale=replay_latency_scale)
+        if replay_path is not None
+        else None
+    )
+    base_http_client: RequestsHttpClient | None = None
+    recorder: RecordingHttpClient | None = None
+    http_client: HttpClient
+    if replay_http_client is not None:
+        http_client = replay_http_client
+    else:
+        base_http_client = RequestsHttpClient(
+            pool_connections=config.collection.http_pool_hosts,
+            pool_maxsize=config.collection.http_pool_size,
+            connect_timeout_seconds=config.collection.connect_timeout_seconds,
+        )
+        http_client = base_http_client
+        if record_path is not None:
+            # Innermost, so retries and hedges are captured as the requests they really are.
+            recorder = RecordingHttpClient(base_http_client, record_path)
+            http_client = recorder
+    async_transport = ThreadedAsyncHttpClient(
+        http_client,
+        max_threads=THREADS_PER_WORKER * config.collection.workers,
+    )
+    async_http_client: AsyncHttpClient = async_transport
+    hedge_policy: HedgePolicy | None = None
+    hedging_http_client: HedgingHttpClient | None = None
+    if config.collection.hedge_requests and replay_http_client is None:
+        # Hedge right above the transport so only network latency feeds the percentiles;
+        # rate-limited hosts are never hedged, which keeps duplicates off polite hosts.
+        hedge_policy = HedgePolicy(
+            HedgeSettings(
+                percentile=config.collection.hedge_percentile,
+                max_hedge_ratio=config.collection.hedge_max_ratio,
+            ),
+            eligible=lambda host: rate_limiter.limit_for(host) is None,
+        )
+        hedging_http_client = HedgingHttpClient(
+            http_client,
+            hedge_policy,
+            max_workers=THREADS_PER_WORKER * config.collection.workers,
+        )
+        http_client = hedging_http_client
+        async_http_client = HedgingAsyncHttpClient(async_http_client, hedge_policy)
+    concurrency_controller: AimdController | None = None
+    if config.collection.adaptive_concurrency and replay_http_client is None:
+        concurrency_controller = AimdController(
+            AimdSettings(max_limit=float(config.collection.adaptive_max_per_host))
+        )
+        http_client = AdaptiveConcurrencyHttpClient(http_client, concurrency_controller)
+        async_http_client = AdaptiveConcurrencyAsyncHttpClient(
+            async_http_client,
+            concurrency_controller,
+        )
+    if replay_http_client is None:
+        http_client = RateLimitedHttpClient(http_client, rate_limiter)
+        async_http_client = RateLimitedAsyncHttpClient(async_http_client, rate_limiter)
+    http_cache: HttpCacheStore | None = None
+    if config.collection.http_cache:
+        # Outermost, so a revalidation still waits for its rate-limit token.
+        http_cache = HttpCacheStore(
+            state_dir / "http_cache",
+            max_age_seconds=config.collection.http_cache_max_age_days * 86400.0,
+        )
+        http_client = ConditionalGetHttpClient(http_client, http_cache)
+        async_http_client = ConditionalGetAsyncHttpClient(async_http_client, http_cache)
+    parse_pool = (
+        GenericEngineParsePool(max_workers=config.collection.parse_processes)
+        if config.collection.parse_processes > 0
+        else None
+    )
+    page_cache = PageCache(max_bytes=config.collection.page_cache_mb * 1024 * 1024)
+    retry_policy = RetryPolicy(
+        base_delay_seconds=config.collection.retry_base_seconds,
+        max_delay_seconds=config.collection.retry_max_seconds,
+        budget=(
+            RetryBudget(config.collection.retry_budget)
+            if config.collection.retry_budget > 0
+            else None
+        ),
+    )
+    circuit_breaker = (
+        SqlAlchemyCircuitBreaker(
+            session_factory,
+            failure_threshold=config.collection.breaker_threshold,
+            cooldown_seconds=config.collection.breaker_cooldown_seconds,
+        )
+        if config.collection.breaker_threshold > 0 and replay_http_client is None
+        else None
+    )
 
-    http_client = RequestsHttpClient()
-    source_registry = SourceRegistry(config=config, http_client=http_client, timezone=timezone)
-    sources = source_registry.build_enabled_sources()
+    def build_collection(
+        config: AppConfig,
+        timezone: ZoneInfo,
+    ) -> tuple[SourceRegistry, CollectNoticesUseCase]:
+        with trace_span("build sources", category="registry"):
+            source_registry = SourceRegistry(
+                config=config,
+                http_client=http_client,
+                timezone=timezone,
+                async_http_client=async_http_client,
+                parse_pool=parse_pool,
+                rate_limiter=rate_limiter,
+                concurrency_controller=concurrency_controller,
+                page_cache=page_cache,
+                retry_policy=retry_policy,
+                shard=shard,
+                shard_costs=shard_costs,
+            )
+            sources = source_registry.build_enabled_sources()
+        collect_use_case = CollectNoticesUseCase(
+            repository=repository,
+            sources=sources,
+            max_workers=config.collection.workers,
+            per_host_limit=config.collection.per_host_limit,
+            circuit_breaker=circuit_breaker,
+            run_budget_seconds=config.collection.run_budget_seconds,
+            cursor_repository=(
+                SqlAlchemyCrawlCursorRepository(session_factory)
+                if config.collection.incremental and not cassette_mode
+                else None
+            ),
+            run_log=run_log,
+            shard_label=shard.label if shard is not None else "",
+            # With adaptive concurrency, the AIMD limit decides how many sources share a host.
+            host_limits=concurrency_controller,
+        )
+        return source_registry, collect_use_case
 
-    collect_use_case = CollectNoticesUseCase(repository=repository, sources=sources)
+    source_registry, collect_use_case = build_collection(config, timezone)
     list_use_case = ListNoticesUseCase(repository=repository)
 
     return AppContainer(
@@ -51,9 +365,35 @@ def create_app(config_path: str | Path = "config/config.toml") -> AppContainer:
         source_registry=source_registry,
         collect_use_case=collect_use_case,
         list_use_case=list_use_case,
+        page_cache=page_cache,
+        http_cache=http_cache,
+        parse_pool=parse_pool,
+        base_http_client=base_http_client,
+        hedge_policy=hedge_policy,
+        hedging_http_client=hedging_http_client,
+        async_transport=async_transport,
+        config_path=resolved_config_path,
+        retry_budget=retry_policy.budget,
+        collection_builder=build_collection,
+        run_log=run_log,
+        session_factory=session_factory,
+        shard=shard,
+        job_queue=job_queue,
+        recorder=recorder,
+        replay_http_client=replay_http_client,
     )
 
 
+def _restart_only_changes(current: AppConfig, reloaded: AppConfig) -> list[str]:
+    changed: list[str] = []
+    if reloaded.db_path != current.db_path:
+        changed.append("db_path")
+    keep = {key: getattr(current.collection, key) for key in RELOADABLE_COLLECTION_KEYS}
+    if replace(reloaded.collection, **keep) != current.collection:
+        changed.append("[collection]")
+    return changed
+
+
 def _infer_base_dir(config_path: Path) -> Path:
     if config_path.parent.name == "config":
         return config_path.parent.parent
@@ -1,3 +1,17 @@
-from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.entities import (
+    CollectionJob,
+    JobStatus,
+    Notice,
+    SourceRun,
+    SourceRunStatus,
+    SourceType,
+)
 
-__all__ = ["Notice", "SourceType"]
+__all__ = [
+    "CollectionJob",
+    "JobStatus",
+    "Notice",
+    "SourceRun",
+    "SourceRunStatus",
+    "SourceType",
+]
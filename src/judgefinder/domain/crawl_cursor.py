@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class CrawlCursor:
+    """High-water mark left by the last complete crawl of one source.
+
+    ``newest_url`` is the newest row that crawl saw and ``covered_since`` the oldest date
+    it walked back to, so every row published before ``newest_date`` and on or after
+    ``covered_since`` has already been stored.
+    """
+
+    source_slug: str
+    newest_url: str
+    newest_date: date
+    covered_since: date
+
+
+class CrawlProgress:
+    """Track one walk of a source's list pages against its stored cursor."""
+
+    def __init__(self, cursor: CrawlCursor | None, start_date: date, end_date: date) -> None:
+        self._cursor = cursor
+        self._start_date = start_date
+        self._end_date = end_date
+        self._newest: tuple[str, date] | None = None
+        self._stopped_at_cursor = False
+
+    @property
+    def stopped_at_cursor(self) -> bool:
+        return self._stopped_at_cursor
+
+    def observe_page(self, rows: Sequence[tuple[str, date]]) -> bool:
+        """Record the ``(url, published_date)`` rows of one page, newest first.
+
+        Returns True once every row on later pages is known to be stored already, so
+        the walk can stop after this page.
+        """
+        for url, published_date in rows:
+            if published_date > self._end_date:
+                continue
+            if self._newest is None or published_date > self._newest[1]:
+                self._newest = (url, published_date)
+        cursor = self._cursor
+        if cursor is None or not rows or self._start_date < cursor.covered_since:
+            return False
+        # Later pages only hold rows older than this one. Comparing the newest row keeps
+        # pinned old notices at the top of a board from ending the walk too early.
+        reached_cursor = any(url == cursor.newest_url for url, _ in rows)
+        if reached_cursor or max(published for _, published in rows) < cursor.newest_date:
+            self._stopped_at_cursor = True
+        return self._stopped_at_cursor
+
+    def advanced_cursor(self, source_slug: str) -> CrawlCursor | None:
+        """Cursor to store after the walk finished, or None to keep the current one."""
+        if self._newest is None:
+            return None
+        newest_url, newest_date = self._newest
+        cursor = self._cursor
+        if cursor is not None and newest_date < cursor.newest_date:
+            # A backfill of older dates says nothing about rows above the old cursor.
+            return None
+        covered_since = self._start_date
+        if cursor is not None and self._stopped_at_cursor:
+            covered_since = cursor.covered_since
+        return CrawlCursor(
+            source_slug=source_slug,
+            newest_url=newest_url,
+            newest_date=newest_date,
+            covered_since=covered_since,
+        )
+
+
+_CURRENT_PROGRESS: ContextVar[CrawlProgress | None] = ContextVar(
+    "judgefinder_crawl_progress",
+    default=None,
+)
+
+
+def current_crawl_progress() -> CrawlProgress | None:
+    return _CURRENT_PROGRESS.get()
+
+
+@contextmanager
+def crawl_progress_scope(progress: CrawlProgress | None) -> Iterator[None]:
+    token = _CURRENT_PROGRESS.set(progress)
+    try:
+        yield
+    finally:
+        _CURRENT_PROGRESS.reset(token)
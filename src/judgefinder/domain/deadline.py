@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from judgefinder.domain.entities import Notice
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when the time budget of the current run or source has run out."""
+
+
+class QuotaExhaustedError(RuntimeError):
+    """A host's request quota is used up; retrying before it resets cannot succeed."""
+
+
+class PartialFetchError(Exception):
+    """A source stopped early but the notices collected so far are still valid."""
+
+    def __init__(self, notices: list[Notice], reason: str) -> None:
+        super().__init__(reason)
+        self.notices = notices
+        self.reason = reason
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def clamp(self, timeout_seconds: float) -> float:
+        """Shrink a timeout so it ends by the deadline; raise if nothing is left."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError("Time budget exhausted.")
+        return min(timeout_seconds, remaining)
+
+
+_CURRENT_DEADLINE: ContextVar[Deadline | None] = ContextVar("judgefinder_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _CURRENT_DEADLINE.get()
+
+
+def clamp_timeout(timeout_seconds: float) -> float:
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout_seconds
+    return deadline.clamp(timeout_seconds)
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[None]:
+    """Apply ``deadline`` to the current context, never extending an outer deadline.
+
+    The deadline lives in a context variable, so it follows asyncio tasks and
+    ``asyncio.to_thread`` calls but has to be copied explicitly into executor threads.
+    """
+    outer = _CURRENT_DEADLINE.get()
+    effective = deadline
+    if outer is not None and (effective is None or outer.expires_at < effective.expires_at):
+        effective = outer
+    token = _CURRENT_DEADLINE.set(effective)
+    try:
+        yield
+    finally:
+        _CURRENT_DEADLINE.reset(token)
@@ -23,3 +23,47 @@ class Notice:
     @property
     def unique_key(self) -> tuple[str, str]:
         return (self.municipality, self.url)
+
+
+class SourceRunStatus(str, Enum):
+    OK = "ok"
+    PARTIAL = "partial"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    @property
+    def collected(self) -> bool:
+        return self in {SourceRunStatus.OK, SourceRunStatus.PARTIAL}
+
+
+@dataclass(slots=True)
+class SourceRun:
+    """Outcome of collecting one source for one date on one shard."""
+
+    source_slug: str
+    target_date: date
+    shard: str
+    status: SourceRunStatus
+    duration_seconds: float
+    notice_count: int
+    finished_at: datetime
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class CollectionJob:
+    """One (source, date range) unit of work leased from the shared job queue."""
+
+    id: int
+    source_slug: str
+    start_date: date
+    end_date: date
+    attempts: int
+    max_attempts: int
+    lease_token: str
@@ -1,21 +1,79 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import date
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
-from judgefinder.domain.entities import Notice
+from judgefinder.domain.crawl_cursor import CrawlCursor
+from judgefinder.domain.entities import CollectionJob, JobStatus, Notice, SourceRun
 
 
 class NoticeRepository(Protocol):
-    def save_many(self, notices: list[Notice]) -> None:
-        ...
+    def save_many(self, notices: list[Notice]) -> None: ...
 
-    def list_by_date(self, target_date: date) -> list[Notice]:
-        ...
+    def list_by_date(self, target_date: date) -> list[Notice]: ...
+
+
+class CrawlCursorRepository(Protocol):
+    def load(self, source_slug: str) -> CrawlCursor | None: ...
+
+    def save(self, cursor: CrawlCursor) -> None: ...
+
+
+class SourceRunRepository(Protocol):
+    def save_runs(self, runs: list[SourceRun]) -> None: ...
+
+    def list_runs(self, start_date: date, end_date: date) -> list[SourceRun]: ...
+
+    def average_costs(self) -> dict[str, float]: ...
+
+
+class CollectionJobQueue(Protocol):
+    def enqueue(self, source_slugs: list[str], start_date: date, end_date: date) -> int: ...
+
+    def lease(
+        self,
+        owner: str,
+        lease_seconds: float,
+        *,
+        source_slugs: Collection[str] | None = None,
+    ) -> CollectionJob | None: ...
+
+    def complete(self, job: CollectionJob) -> bool: ...
+
+    def fail(self, job: CollectionJob, error: str) -> bool: ...
+
+    def counts(self) -> dict[JobStatus, int]: ...
+
+
+class SourceCircuitBreaker(Protocol):
+    def allow(self, source_slug: str) -> bool: ...
+
+    def record_success(self, source_slug: str) -> None: ...
+
+    def record_failure(self, source_slug: str) -> None: ...
+
+
+class HostConcurrencyLimits(Protocol):
+    def limit_for(self, host: str) -> float: ...
 
 
 class NoticeSource(Protocol):
     slug: str
 
-    def fetch(self, target_date: date) -> list[Notice]:
-        ...
+    def fetch(self, target_date: date) -> list[Notice]: ...
+
+
+@runtime_checkable
+class RangeNoticeSource(NoticeSource, Protocol):
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]: ...
+
+
+@runtime_checkable
+class AsyncNoticeSource(NoticeSource, Protocol):
+    async def fetch_async(self, target_date: date) -> list[Notice]: ...
+
+
+@runtime_checkable
+class AsyncRangeNoticeSource(NoticeSource, Protocol):
+    async def fetch_range_async(self, start_date: date, end_date: date) -> list[Notice]: ...
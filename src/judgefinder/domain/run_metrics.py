@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+
+@dataclass(slots=True)
+class DateMetrics:
+    candidates_kept: int = 0
+    persist_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class SourceMetrics:
+    """Where one source spent its time during one collect run.
+
+    Pages, bytes, retries and timings belong to the whole walk, because a range-aware
+    source reads its list pages once for every date it covers. Kept notices and persist
+    time are also broken down by publication date. ``cache_hits`` counts pages served by
+    the in-memory page cache and HTTP revalidations answered with 304.
+    """
+
+    source_slug: str
+    pages_fetched: int = 0
+    page_bytes: int = 0
+    revalidated_bytes: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    candidates_seen: int = 0
+    persist_seconds: float = 0.0
+    dates: dict[date, DateMetrics] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def bytes_downloaded(self) -> int:
+        return max(self.page_bytes - self.revalidated_bytes, 0)
+
+    @property
+    def candidates_kept(self) -> int:
+        return sum(metrics.candidates_kept for metrics in self.dates.values())
+
+    @property
+    def cost_seconds(self) -> float:
+        return self.fetch_seconds + self.parse_seconds + self.persist_seconds
+
+    def record_page(self, *, size_bytes: int, seconds: float, retries: int) -> None:
+        with self._lock:
+            self.pages_fetched += 1
+            self.page_bytes += size_bytes
+            self.fetch_seconds += seconds
+            self.retries += retries
+
+    def record_failed_fetch(self, *, seconds: float, retries: int) -> None:
+        with self._lock:
+            self.fetch_seconds += seconds
+            self.retries += retries
+
+    def record_cache_hit(self, *, revalidated_bytes: int = 0) -> None:
+        with self._lock:
+            self.cache_hits += 1
+            self.revalidated_bytes += revalidated_bytes
+
+    def record_parse(self, *, seconds: float, candidates: int) -> None:
+        with self._lock:
+            self.parse_seconds += seconds
+            self.candidates_seen += candidates
+
+    def record_kept(self, published_dates: Iterable[date]) -> None:
+        with self._lock:
+            for published_date in published_dates:
+                self._date(published_date).candidates_kept += 1
+
+    def record_persist(self, seconds_by_date: Mapping[date, float]) -> None:
+        with self._lock:
+            for published_date, seconds in seconds_by_date.items():
+                self._date(published_date).persist_seconds += seconds
+                self.persist_seconds += seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "source": self.source_slug,
+                "pages_fetched": self.pages_fetched,
+                "bytes_downloaded": self.bytes_downloaded,
+                "cache_hits": self.cache_hits,
+                "retries": self.retries,
+                "fetch_seconds": round(self.fetch_seconds, 6),
+                "parse_seconds": round(self.parse_seconds, 6),
+                "candidates_seen": self.candidates_seen,
+                "candidates_kept": self.candidates_kept,
+                "persist_seconds": round(self.persist_seconds, 6),
+                "cost_seconds": round(self.cost_seconds, 6),
+                "dates": {
+                    published_date.isoformat(): {
+                        "candidates_kept": metrics.candidates_kept,
+                        "persist_seconds": round(metrics.persist_seconds, 6),
+                    }
+                    for published_date, metrics in sorted(self.dates.items())
+                },
+            }
+
+    def _date(self, published_date: date) -> DateMetrics:
+        metrics = self.dates.get(published_date)
+        if metrics is None:
+            metrics = self.dates[published_date] = DateMetrics()
+        return metrics
+
+
+class RunMetrics:
+    """Per-source metrics of one collect run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sources: dict[str, SourceMetrics] = {}
+
+    def for_source(self, source_slug: str) -> SourceMetrics:
+        with self._lock:
+            metrics = self._sources.get(source_slug)
+            if metrics is None:
+                metrics = self._sources[source_slug] = SourceMetrics(source_slug)
+            return metrics
+
+    def record_persist(
+        self,
+        seconds: float,
+        notice_counts: Mapping[tuple[str, date], int],
+    ) -> None:
+        """Share one bulk write between sources and dates by how many notices each stored."""
+        total = sum(notice_counts.values())
+        if total <= 0:
+            return
+        shares: dict[str, dict[date, float]] = {}
+        for (source_slug, published_date), count in notice_counts.items():
+            shares.setdefault(source_slug, {})[published_date] = seconds * count / total
+        for source_slug, seconds_by_date in shares.items():
+            self.for_source(source_slug).record_persist(seconds_by_date)
+
+    def by_cost(self) -> list[SourceMetrics]:
+        with self._lock:
+            sources = list(self._sources.values())
+        return sorted(sources, key=lambda metrics: (-metrics.cost_seconds, metrics.source_slug))
+
+    def to_dict(self) -> dict[str, Any]:
+        sources = [metrics.to_dict() for metrics in self.by_cost()]
+        totals = {
+            key: sum(source[key] for source in sources)
+            for key in (
+                "pages_fetched",
+                "bytes_downloaded",
+                "cache_hits",
+                "retries",
+                "candidates_seen",
+                "candidates_kept",
+            )
+        }
+        for key in ("fetch_seconds", "parse_seconds", "persist_seconds", "cost_seconds"):
+            totals[key] = round(sum(source[key] for source in sources), 6)
+        return {"totals": totals, "sources": sources}
+
+
+_CURRENT_SOURCE_METRICS: ContextVar[SourceMetrics | None] = ContextVar(
+    "judgefinder_source_metrics",
+    default=None,
+)
+
+
+def current_source_metrics() -> SourceMetrics | None:
+    return _CURRENT_SOURCE_METRICS.get()
+
+
+@contextmanager
+def source_metrics_scope(metrics: SourceMetrics | None) -> Iterator[None]:
+    token = _CURRENT_SOURCE_METRICS.set(metrics)
+    try:
+        yield
+    finally:
+        _CURRENT_SOURCE_METRICS.reset(token)
+
+
+def record_page(*, size_bytes: int, seconds: float, retries: int) -> None:
+    metrics = current_source_metrics()
+    if metrics is not None:
+        metrics.record_page(size_bytes=size_bytes, seconds=seconds, retries=retries)
+
+
+def record_failed_fetch(*, seconds: float, retries: int) -> None:
+    metrics = current_source_metrics()
+    if metrics is not None:
+        metrics.record_failed_fetch(seconds=seconds, retries=retries)
+
+
+def record_cache_hit(*, revalidated_bytes: int = 0) -> None:
+    metrics = current_source_metrics()
+    if metrics is not None:
+        metrics.record_cache_hit(revalidated_bytes=revalidated_bytes)
+
+
+def record_parse(*, seconds: float, candidates: int) -> None:
+    metrics = current_source_metrics()
+    if metrics is not None:
+        metrics.record_parse(seconds=seconds, candidates=candidates)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ShardSpec:
+    """One slice of ``enabled_sources``; ``index`` is 1-based as in ``--shard 2/4``."""
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 1 <= self.index <= self.count:
+            raise ValueError("Shard must be 'i/n' with 1 <= i <= n.")
+
+    @classmethod
+    def parse(cls, raw: str) -> ShardSpec:
+        index_text, separator, count_text = raw.partition("/")
+        if not separator:
+            raise ValueError("Shard must be 'i/n' with 1 <= i <= n.")
+        try:
+            return cls(index=int(index_text), count=int(count_text))
+        except ValueError as exc:
+            raise ValueError("Shard must be 'i/n' with 1 <= i <= n.") from exc
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def select(
+        self,
+        slugs: Sequence[str],
+        *,
+        costs: Mapping[str, float] | None = None,
+    ) -> list[str]:
+        """Slugs owned by this shard, in their configured order."""
+        assignment = assign_shards(slugs, self.count, costs=costs)
+        return [slug for slug in slugs if assignment[slug] == self.index]
+
+
+def assign_shards(
+    slugs: Sequence[str],
+    shard_count: int,
+    *,
+    costs: Mapping[str, float] | None = None,
+) -> dict[str, int]:
+    """Map every slug to a 1-based shard; every node computes the same answer.
+
+    Without costs each slug goes to the shard with the highest rendezvous hash, so
+    changing the shard count only moves the slugs that have to move. With costs the
+    most expensive slugs are placed first on the least loaded shard, and hashes only
+    break ties; every node must then read the same cost table.
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1.")
+    if not costs:
+        return {
+            slug: max(range(1, shard_count + 1), key=lambda shard: _hash(f"{slug}:{shard}"))
+            for slug in slugs
+        }
+
+    known_costs = [cost for slug, cost in costs.items() if slug in slugs and cost > 0]
+    default_cost = sum(known_costs) / len(known_costs) if known_costs else 1.0
+    loads = dict.fromkeys(range(1, shard_count + 1), 0.0)
+    assignment: dict[str, int] = {}
+    ordered = sorted(
+        set(slugs),
+        key=lambda slug: (-_cost_of(slug, costs, default_cost), _hash(slug)),
+    )
+    for slug in ordered:
+        shard = min(loads, key=lambda candidate: (loads[candidate], candidate))
+        assignment[slug] = shard
+        loads[shard] += _cost_of(slug, costs, default_cost)
+    return assignment
+
+
+def _cost_of(slug: str, costs: Mapping[str, float], default_cost: float) -> float:
+    cost = costs.get(slug, 0.0)
+    return cost if cost > 0 else default_cost
+
+
+def _hash(value: str) -> int:
+    # Python's built-in hash is salted per process, so it cannot be shared across nodes.
+    return int.from_bytes(hashlib.sha256(value.encode("utf-8")).digest()[:8], "big")
@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 
+# Pages a source may walk at its full timeout and retry count before the derived budget ends.
+DEFAULT_BUDGET_PAGES = 10
+
 
 class EngineType(str, Enum):
     SAEOL_GOSI = "saeol_gosi"
@@ -37,6 +40,18 @@ class RequestStrategy:
     retries: int = 3
     timeout_seconds: float = 10.0
     throttle_seconds: float = 0.0
+    burst: int = 1
+    daily_quota: int = 0
+    prefetch: bool = False
+    cache_ttl_seconds: float = 300.0
+    budget_seconds: float = 0.0
+    poll_interval_seconds: float = 0.0
+
+    def effective_budget_seconds(self) -> float:
+        """Time limit for one source fetch; derived from timeout and retries unless set."""
+        if self.budget_seconds > 0:
+            return self.budget_seconds
+        return self.timeout_seconds * self.retries * DEFAULT_BUDGET_PAGES
 
     @classmethod
     def from_access_profile(cls, access_profile: AccessProfile) -> RequestStrategy:
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+RUN_GROUP = "collect"
+SOURCE_LANE = "source"
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class SpanSink(Protocol):
+    """Receiver of the spans opened with ``trace_span``."""
+
+    def span(
+        self,
+        name: str,
+        *,
+        category: str,
+        group: str,
+        lane: str,
+        args: dict[str, Any] | None = None,
+    ) -> AbstractContextManager[None]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSpan:
+    name: str
+    category: str
+    group: str
+    lane: str
+    start_seconds: float
+    duration_seconds: float
+    args: dict[str, Any]
+
+
+class TraceRecorder:
+    """Collect timed spans and render them as Chrome trace-event JSON.
+
+    Spans are placed on lanes: every group (a source, or the run itself) becomes a
+    process in the trace viewer and every lane inside it a thread, so a source's page
+    fetches sit on their own rows under the source. Open the output in
+    ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._spans: list[TraceSpan] = []
+
+    @property
+    def spans(self) -> list[TraceSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        category: str,
+        group: str,
+        lane: str,
+        args: dict[str, Any] | None = None,
+    ) -> Iterator[None]:
+        span_args = dict(args or {})
+        started = self._clock()
+        try:
+            yield
+        except BaseException as exc:
+            span_args["error"] = type(exc).__name__
+            raise
+        finally:
+            finished = self._clock()
+            with self._lock:
+                self._spans.append(
+                    TraceSpan(
+                        name=name,
+                        category=category,
+                        group=group,
+                        lane=lane,
+                        start_seconds=started - self._origin,
+                        duration_seconds=finished - started,
+                        args=span_args,
+                    )
+                )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        spans = sorted(self.spans, key=lambda span: span.start_seconds)
+        process_ids: dict[str, int] = {RUN_GROUP: 1}
+        thread_ids: dict[tuple[str, str], int] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            pid = process_ids.setdefault(span.group, len(process_ids) + 1)
+            tid = thread_ids.setdefault((span.group, span.lane), len(thread_ids) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start_seconds * 1_000_000, 3),
+                    "dur": round(span.duration_seconds * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": span.args,
+                }
+            )
+        metadata: list[dict[str, Any]] = []
+        for group, pid in process_ids.items():
+            metadata.append(_metadata("process_name", pid, 0, {"name": group}))
+            metadata.append(_metadata("process_sort_index", pid, 0, {"sort_index": pid}))
+        for (group, lane), tid in thread_ids.items():
+            pid = process_ids[group]
+            metadata.append(_metadata("thread_name", pid, tid, {"name": lane}))
+            metadata.append(
+                _metadata("thread_sort_index", pid, tid, {"sort_index": _lane_order(lane)})
+            )
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+_CURRENT_SINKS: ContextVar[tuple[SpanSink, ...]] = ContextVar(
+    "judgefinder_span_sinks",
+    default=(),
+)
+_CURRENT_GROUP: ContextVar[str] = ContextVar("judgefinder_trace_group", default=RUN_GROUP)
+_CURRENT_LANE: ContextVar[str] = ContextVar("judgefinder_trace_lane", default=SOURCE_LANE)
+
+
+@contextmanager
+def trace_scope(sink: SpanSink | None) -> Iterator[None]:
+    """Send spans opened in this context to ``sink`` as well as to any outer sink."""
+    if sink is None:
+        yield
+        return
+    token = _CURRENT_SINKS.set((*_CURRENT_SINKS.get(), sink))
+    try:
+        yield
+    finally:
+        _CURRENT_SINKS.reset(token)
+
+
+@contextmanager
+def trace_lane(lane: str, *, group: str | None = None) -> Iterator[None]:
+    """Put spans opened in this context on ``lane``, optionally in another group."""
+    group_token = _CURRENT_GROUP.set(group) if group is not None else None
+    lane_token = _CURRENT_LANE.set(lane)
+    try:
+        yield
+    finally:
+        _CURRENT_LANE.reset(lane_token)
+        if group_token is not None:
+            _CURRENT_GROUP.reset(group_token)
+
+
+def trace_span(name: str, *, category: str, **args: Any) -> AbstractContextManager[None]:
+    """Time the block as a span on the current lane; free when no sink is installed."""
+    sinks = _CURRENT_SINKS.get()
+    if not sinks:
+        return _NO_SPAN
+    group = _CURRENT_GROUP.get()
+    lane = _CURRENT_LANE.get()
+    if len(sinks) == 1:
+        return sinks[0].span(name, category=category, group=group, lane=lane, args=args)
+    return _all_spans(
+        [sink.span(name, category=category, group=group, lane=lane, args=args) for sink in sinks]
+    )
+
+
+@contextmanager
+def _all_spans(spans: list[AbstractContextManager[None]]) -> Iterator[None]:
+    with ExitStack() as stack:
+        for span in spans:
+            stack.enter_context(span)
+        yield
+
+
+def _metadata(name: str, pid: int, tid: int, args: dict[str, Any]) -> dict[str, Any]:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": args}
+
+
+def _lane_order(lane: str) -> int:
+    # Keep the source lane on top and page lanes in page order.
+    if lane.startswith("page "):
+        suffix = lane.removeprefix("page ")
+        if suffix.isdigit():
+            return int(suffix)
+    return 0
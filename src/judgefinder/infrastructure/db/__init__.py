@@ -1,4 +1,12 @@
-from judgefinder.infrastructure.db.repository import SqlAlchemyNoticeRepository
+from judgefinder.infrastructure.db.circuit_breaker import SqlAlchemyCircuitBreaker
+from judgefinder.infrastructure.db.daily_quota import SqlAlchemyDailyQuotaStore
+from judgefinder.infrastructure.db.job_queue import SqlAlchemyCollectionJobQueue
+from judgefinder.infrastructure.db.repository import (
+    SqlAlchemyCrawlCursorRepository,
+    SqlAlchemyNoticeRepository,
+    SqlAlchemySourceRunRepository,
+    merge_sqlite_database,
+)
 from judgefinder.infrastructure.db.session import (
     create_schema,
     create_session_factory,
@@ -6,8 +14,14 @@ from judgefinder.infrastructure.db.session import (
 )
 
 __all__ = [
+    "SqlAlchemyCircuitBreaker",
+    "SqlAlchemyCollectionJobQueue",
+    "SqlAlchemyDailyQuotaStore",
+    "SqlAlchemyCrawlCursorRepository",
     "SqlAlchemyNoticeRepository",
+    "SqlAlchemySourceRunRepository",
     "create_schema",
     "create_session_factory",
     "create_sqlite_engine",
+    "merge_sqlite_database",
 ]
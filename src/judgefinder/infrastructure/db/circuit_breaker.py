@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+
+from sqlalchemy import case, delete, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.domain.ports import SourceCircuitBreaker
+from judgefinder.infrastructure.db.models import CircuitBreakerModel
+
+LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SqlAlchemyCircuitBreaker(SourceCircuitBreaker):
+    """Per-source circuit breaker stored in the shared SQLite database.
+
+    ``failure_threshold`` consecutive failed fetches open the circuit. While it is open
+    the source is skipped; once ``cooldown_seconds`` have passed a single half-open probe
+    is let through. A successful probe closes the circuit, a failed one re-opens it for
+    another cooldown. A probe that never reports back (for example a killed run) is
+    retried after the next cooldown.
+
+    Failures are counted with a single upsert and the probe is claimed with a
+    conditional UPDATE, so collectors in several processes share one count and only
+    one of them gets the probe.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self._session_factory = session_factory
+        self._failure_threshold = failure_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._clock = clock
+
+    def allow(self, source_slug: str) -> bool:
+        breaker = CircuitBreakerModel
+        with self._session_factory() as session:
+            row = session.execute(
+                select(breaker.state, breaker.opened_at).where(breaker.source_slug == source_slug)
+            ).first()
+            if row is None or row.state == CLOSED:
+                return True
+            now = self._clock()
+            if now - row.opened_at < self._cooldown_seconds:
+                return False
+            result = session.execute(
+                update(breaker)
+                .where(
+                    breaker.source_slug == source_slug,
+                    breaker.state == row.state,
+                    breaker.opened_at == row.opened_at,
+                )
+                .values(state=HALF_OPEN, opened_at=now)
+            )
+            session.commit()
+        if not getattr(result, "rowcount", 0):
+            # Another process claimed the probe first.
+            return False
+        LOGGER.info("Probing source '%s' after circuit cooldown.", source_slug)
+        return True
+
+    def record_success(self, source_slug: str) -> None:
+        with self._session_factory() as session:
+            session.execute(
+                delete(CircuitBreakerModel).where(CircuitBreakerModel.source_slug == source_slug)
+            )
+            session.commit()
+
+    def record_failure(self, source_slug: str) -> None:
+        breaker = CircuitBreakerModel
+        now = self._clock()
+        opens_at_once = self._failure_threshold <= 1
+        trips = (breaker.state == HALF_OPEN) | (breaker.failures + 1 >= self._failure_threshold)
+        statement = sqlite_insert(breaker).values(
+            source_slug=source_slug,
+            state=OPEN if opens_at_once else CLOSED,
+            failures=1,
+            opened_at=now if opens_at_once else 0.0,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["source_slug"],
+            set_={
+                "failures": breaker.failures + 1,
+                "state": case((trips, OPEN), else_=breaker.state),
+                "opened_at": case((trips, now), else_=breaker.opened_at),
+            },
+        )
+
+        with self._session_factory() as session:
+            before = self._read_state(session, source_slug)
+            session.execute(statement)
+            session.commit()
+            row = session.execute(
+                select(breaker.state, breaker.failures).where(breaker.source_slug == source_slug)
+            ).one()
+        if row.state == OPEN and before != OPEN:
+            LOGGER.warning(
+                "Opening circuit for source '%s' after %s consecutive failures.",
+                source_slug,
+                row.failures,
+            )
+
+    def state_of(self, source_slug: str) -> str:
+        with self._session_factory() as session:
+            return self._read_state(session, source_slug)
+
+    @staticmethod
+    def _read_state(session: Session, source_slug: str) -> str:
+        state = session.scalar(
+            select(CircuitBreakerModel.state).where(CircuitBreakerModel.source_slug == source_slug)
+        )
+        return CLOSED if state is None else state
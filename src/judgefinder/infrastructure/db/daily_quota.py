@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date
+
+from sqlalchemy import case, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.infrastructure.db.models import DailyQuotaModel
+from judgefinder.infrastructure.http.rate_limit import DailyQuotaExceededError, DailyQuotaStore
+
+
+class SqlAlchemyDailyQuotaStore(DailyQuotaStore):
+    """Per-host request counters for the current day, kept in the shared SQLite database.
+
+    Each request is counted by one upsert that only goes through while the host is under
+    its quota, so collectors in several processes never lose or overshoot a count. The
+    first request of a new day resets the row.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self._session_factory = session_factory
+        self._today = today
+
+    def consume(self, host: str, quota: int) -> None:
+        quota_row = DailyQuotaModel
+        today = self._today()
+        same_day = quota_row.day == today
+        statement = sqlite_insert(quota_row).values(host=host, day=today, count=1)
+        statement = statement.on_conflict_do_update(
+            index_elements=["host"],
+            set_={
+                "day": today,
+                "count": case((same_day, quota_row.count + 1), else_=1),
+            },
+            where=~same_day | (quota_row.count < quota),
+        )
+
+        with self._session_factory() as session:
+            result = session.execute(statement)
+            session.commit()
+        if not getattr(result, "rowcount", 0):
+            raise DailyQuotaExceededError(host, quota)
+
+    def used(self, host: str) -> int:
+        with self._session_factory() as session:
+            row = session.execute(
+                select(DailyQuotaModel.day, DailyQuotaModel.count).where(
+                    DailyQuotaModel.host == host
+                )
+            ).first()
+        if row is None:
+            return 0
+        day, count = row
+        return int(count) if day == self._today() else 0
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Callable, Collection
+from datetime import date
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.domain.entities import CollectionJob, JobStatus
+from judgefinder.domain.ports import CollectionJobQueue
+from judgefinder.infrastructure.db.models import CollectionJobModel
+
+MAX_ERROR_LENGTH = 1024
+
+
+class SqlAlchemyCollectionJobQueue(CollectionJobQueue):
+    """Lease-based job queue stored in the shared SQLite database.
+
+    Claiming a job is a single UPDATE, so two workers can never hold the same lease.
+    A worker that dies simply lets its lease expire and the job is handed out again;
+    completions and failures carry the lease token, so a worker whose lease was taken
+    over cannot overwrite the outcome of the new holder.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self._session_factory = session_factory
+        self._max_attempts = max_attempts
+        self._retry_delay_seconds = retry_delay_seconds
+        self._clock = clock
+
+    def enqueue(self, source_slugs: list[str], start_date: date, end_date: date) -> int:
+        """Queue one job per source; finished jobs for the same range are queued again."""
+        if not source_slugs:
+            return 0
+        now = self._clock()
+        statement = sqlite_insert(CollectionJobModel).values(
+            [
+                {
+                    "source_slug": slug,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "status": JobStatus.PENDING.value,
+                    "attempts": 0,
+                    "max_attempts": self._max_attempts,
+                    "lease_owner": "",
+                    "lease_token": "",
+                    "lease_expires_at": 0.0,
+                    "last_error": "",
+                    "updated_at": now,
+                }
+                for slug in dict.fromkeys(source_slugs)
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["source_slug", "start_date", "end_date"],
+            set_={
+                "status": JobStatus.PENDING.value,
+                "attempts": 0,
+                "max_attempts": statement.excluded.max_attempts,
+                "lease_owner": "",
+                "lease_token": "",
+                "lease_expires_at": 0.0,
+                "last_error": "",
+                "updated_at": now,
+            },
+            where=CollectionJobModel.status.in_([JobStatus.DONE.value, JobStatus.FAILED.value]),
+        )
+
+        with self._session_factory() as session:
+            result = session.execute(statement)
+            session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    def lease(
+        self,
+        owner: str,
+        lease_seconds: float,
+        *,
+        source_slugs: Collection[str] | None = None,
+    ) -> CollectionJob | None:
+        """Claim the oldest available job, limited to ``source_slugs`` when given."""
+        now = self._clock()
+        token = uuid.uuid4().hex
+        job = CollectionJobModel
+        available = or_(
+            job.status == JobStatus.PENDING.value,
+            job.status == JobStatus.LEASED.value,
+        )
+        conditions = [available, job.lease_expires_at <= now, job.attempts < job.max_attempts]
+        if source_slugs is not None:
+            conditions.append(job.source_slug.in_(list(source_slugs)))
+        candidate = select(job.id).where(*conditions).order_by(job.id.asc()).limit(1)
+
+        with self._session_factory() as session:
+            # A lease that ran out on the last attempt means the worker kept crashing.
+            session.execute(
+                update(job)
+                .where(
+                    job.status == JobStatus.LEASED.value,
+                    job.lease_expires_at <= now,
+                    job.attempts >= job.max_attempts,
+                )
+                .values(
+                    status=JobStatus.FAILED.value,
+                    last_error="lease expired on the last attempt",
+                    updated_at=now,
+                )
+            )
+            session.execute(
+                update(job)
+                .where(job.id == candidate.scalar_subquery())
+                .values(
+                    status=JobStatus.LEASED.value,
+                    attempts=job.attempts + 1,
+                    lease_owner=owner,
+                    lease_token=token,
+                    lease_expires_at=now + lease_seconds,
+                    updated_at=now,
+                )
+            )
+            session.commit()
+            record = session.scalars(select(job).where(job.lease_token == token)).first()
+
+        if record is None:
+            return None
+        return CollectionJob(
+            id=record.id,
+            source_slug=record.source_slug,
+            start_date=record.start_date,
+            end_date=record.end_date,
+            attempts=record.attempts,
+            max_attempts=record.max_attempts,
+            lease_token=record.lease_token,
+        )
+
+    def complete(self, job: CollectionJob) -> bool:
+        return self._finish(job, status=JobStatus.DONE, available_at=0.0, error="")
+
+    def fail(self, job: CollectionJob, error: str) -> bool:
+        """Release the job for a later retry, or mark it failed after its last attempt."""
+        if job.attempts >= job.max_attempts:
+            return self._finish(job, status=JobStatus.FAILED, available_at=0.0, error=error)
+        delay = self._retry_delay_seconds * 2 ** (job.attempts - 1)
+        return self._finish(
+            job,
+            status=JobStatus.PENDING,
+            available_at=self._clock() + delay,
+            error=error,
+        )
+
+    def counts(self) -> dict[JobStatus, int]:
+        statement = select(CollectionJobModel.status, func.count()).group_by(
+            CollectionJobModel.status
+        )
+
+        with self._session_factory() as session:
+            rows = session.execute(statement).all()
+
+        counts = dict.fromkeys(JobStatus, 0)
+        for status, count in rows:
+            counts[JobStatus(status)] = int(count)
+        return counts
+
+    def _finish(
+        self,
+        job: CollectionJob,
+        *,
+        status: JobStatus,
+        available_at: float,
+        error: str,
+    ) -> bool:
+        statement = (
+            update(CollectionJobModel)
+            .where(
+                CollectionJobModel.id == job.id,
+                CollectionJobModel.status == JobStatus.LEASED.value,
+                CollectionJobModel.lease_token == job.lease_token,
+            )
+            .values(
+                status=status.value,
+                lease_token="",
+                lease_expires_at=available_at,
+                last_error=error[:MAX_ERROR_LENGTH],
+                updated_at=self._clock(),
+            )
+        )
+
+        with self._session_factory() as session:
+            result = session.execute(statement)
+            session.commit()
+        return int(getattr(result, "rowcount", 0) or 0) == 1
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Date, DateTime, Float, Integer, String, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -21,3 +21,74 @@ class NoticeModel(Base):
     published_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     source_type: Mapped[str] = mapped_column(String(32), nullable=False)
+
+
+class CrawlCursorModel(Base):
+    __tablename__ = "crawl_cursors"
+
+    source_slug: Mapped[str] = mapped_column(String(128), primary_key=True)
+    newest_url: Mapped[str] = mapped_column(String(1024), nullable=False)
+    newest_date: Mapped[date] = mapped_column(Date, nullable=False)
+    covered_since: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class SourceRunModel(Base):
+    __tablename__ = "source_runs"
+    __table_args__ = (
+        UniqueConstraint(
+            "source_slug",
+            "target_date",
+            "shard",
+            "finished_at",
+            name="uq_source_run",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source_slug: Mapped[str] = mapped_column(String(128), nullable=False)
+    target_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    shard: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    notice_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class CollectionJobModel(Base):
+    __tablename__ = "collection_jobs"
+    __table_args__ = (
+        UniqueConstraint("source_slug", "start_date", "end_date", name="uq_collection_job"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source_slug: Mapped[str] = mapped_column(String(128), nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    lease_owner: Mapped[str] = mapped_column(String(128), nullable=False, default="")
+    lease_token: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+    # Seconds since the epoch; plain numbers keep lease comparisons inside SQLite exact.
+    lease_expires_at: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_error: Mapped[str] = mapped_column(String(1024), nullable=False, default="")
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class CircuitBreakerModel(Base):
+    __tablename__ = "circuit_breakers"
+
+    source_slug: Mapped[str] = mapped_column(String(128), primary_key=True)
+    state: Mapped[str] = mapped_column(String(16), nullable=False)
+    failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Seconds since the epoch, like collection_jobs.lease_expires_at.
+    opened_at: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+class DailyQuotaModel(Base):
+    __tablename__ = "http_daily_quota"
+
+    host: Mapped[str] = mapped_column(String(255), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
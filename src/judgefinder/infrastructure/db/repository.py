@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from datetime import date
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, sessionmaker
 
-from judgefinder.domain.entities import Notice, SourceType
-from judgefinder.domain.ports import NoticeRepository
-from judgefinder.infrastructure.db.models import NoticeModel
+from judgefinder.domain.crawl_cursor import CrawlCursor
+from judgefinder.domain.entities import Notice, SourceRun, SourceRunStatus, SourceType
+from judgefinder.domain.ports import (
+    CrawlCursorRepository,
+    NoticeRepository,
+    SourceRunRepository,
+)
+from judgefinder.infrastructure.db.models import CrawlCursorModel, NoticeModel, SourceRunModel
+
+RUN_PRUNE_INTERVAL_SECONDS = 3600.0
 
 
 class SqlAlchemyNoticeRepository(NoticeRepository):
@@ -60,3 +70,172 @@ class SqlAlchemyNoticeRepository(NoticeRepository):
             fetched_at=model.fetched_at,
             source_type=SourceType(model.source_type),
         )
+
+
+class SqlAlchemyCrawlCursorRepository(CrawlCursorRepository):
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def load(self, source_slug: str) -> CrawlCursor | None:
+        with self._session_factory() as session:
+            record = session.get(CrawlCursorModel, source_slug)
+        if record is None:
+            return None
+        return CrawlCursor(
+            source_slug=record.source_slug,
+            newest_url=record.newest_url,
+            newest_date=record.newest_date,
+            covered_since=record.covered_since,
+        )
+
+    def save(self, cursor: CrawlCursor) -> None:
+        values = {
+            "source_slug": cursor.source_slug,
+            "newest_url": cursor.newest_url,
+            "newest_date": cursor.newest_date,
+            "covered_since": cursor.covered_since,
+            "updated_at": datetime.now(tz=timezone.utc),
+        }
+        statement = sqlite_insert(CrawlCursorModel).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["source_slug"],
+            set_={key: value for key, value in values.items() if key != "source_slug"},
+        )
+
+        with self._session_factory() as session:
+            session.execute(statement)
+            session.commit()
+
+
+class SqlAlchemySourceRunRepository(SourceRunRepository):
+    """Per-source, per-date run history used for shard costs and coverage checks.
+
+    With ``retention_days`` set, runs that finished longer ago than that are deleted
+    while saving, at most once per ``RUN_PRUNE_INTERVAL_SECONDS``, so a collector that
+    polls all day keeps a bounded table.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        retention_days: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._session_factory = session_factory
+        self._retention_days = retention_days
+        self._clock = clock
+        self._next_prune_at = float("-inf")
+
+    def save_runs(self, runs: list[SourceRun]) -> None:
+        if not runs:
+            return
+
+        values = [
+            {
+                "source_slug": run.source_slug,
+                "target_date": run.target_date,
+                "shard": run.shard,
+                "status": run.status.value,
+                "duration_seconds": run.duration_seconds,
+                "notice_count": run.notice_count,
+                "finished_at": run.finished_at,
+            }
+            for run in runs
+        ]
+        statement = sqlite_insert(SourceRunModel).values(values).on_conflict_do_nothing()
+
+        with self._session_factory() as session:
+            session.execute(statement)
+            session.commit()
+        self._prune_if_due()
+
+    def prune(self) -> int:
+        """Delete runs older than ``retention_days`` and return how many went."""
+        if self._retention_days <= 0:
+            return 0
+        cutoff = datetime.fromtimestamp(self._clock(), tz=timezone.utc) - timedelta(
+            days=self._retention_days
+        )
+        statement = delete(SourceRunModel).where(SourceRunModel.finished_at < cutoff)
+
+        with self._session_factory() as session:
+            result = session.execute(statement)
+            session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    def _prune_if_due(self) -> None:
+        now = self._clock()
+        if self._retention_days <= 0 or now < self._next_prune_at:
+            return
+        self._next_prune_at = now + RUN_PRUNE_INTERVAL_SECONDS
+        self.prune()
+
+    def list_runs(self, start_date: date, end_date: date) -> list[SourceRun]:
+        statement = (
+            select(SourceRunModel)
+            .where(SourceRunModel.target_date.between(start_date, end_date))
+            .order_by(SourceRunModel.id.asc())
+        )
+
+        with self._session_factory() as session:
+            records = session.scalars(statement).all()
+
+        return [
+            SourceRun(
+                source_slug=record.source_slug,
+                target_date=record.target_date,
+                shard=record.shard,
+                status=SourceRunStatus(record.status),
+                duration_seconds=record.duration_seconds,
+                notice_count=record.notice_count,
+                finished_at=record.finished_at,
+            )
+            for record in records
+        ]
+
+    def average_costs(self) -> dict[str, float]:
+        """Mean seconds spent per source and date over every recorded run that fetched."""
+        statement = (
+            select(SourceRunModel.source_slug, func.avg(SourceRunModel.duration_seconds))
+            .where(SourceRunModel.status != SourceRunStatus.SKIPPED.value)
+            .group_by(SourceRunModel.source_slug)
+            .order_by(SourceRunModel.source_slug.asc())
+        )
+
+        with self._session_factory() as session:
+            rows = session.execute(statement).all()
+
+        return {slug: float(cost) for slug, cost in rows}
+
+
+def merge_sqlite_database(session_factory: sessionmaker[Session], other_db_path: Path) -> None:
+    """Copy notices and source runs of another node's database into this one."""
+    with session_factory() as session:
+        session.execute(text("ATTACH DATABASE :path AS other"), {"path": str(other_db_path)})
+        try:
+            tables = set(
+                session.scalars(text("SELECT name FROM other.sqlite_master WHERE type = 'table'"))
+            )
+            if "notices" in tables:
+                session.execute(
+                    text(
+                        "INSERT OR IGNORE INTO notices "
+                        "(municipality, title, url, published_date, fetched_at, source_type) "
+                        "SELECT municipality, title, url, published_date, fetched_at, source_type "
+                        "FROM other.notices ORDER BY id"
+                    )
+                )
+            if "source_runs" in tables:
+                session.execute(
+                    text(
+                        "INSERT OR IGNORE INTO source_runs "
+                        "(source_slug, target_date, shard, status, duration_seconds, "
+                        "notice_count, finished_at) "
+                        "SELECT source_slug, target_date, shard, status, duration_seconds, "
+                        "notice_count, finished_at FROM other.source_runs ORDER BY id"
+                    )
+                )
+            session.commit()
+        finally:
+            session.execute(text("DETACH DATABASE other"))
@@ -1,3 +1,8 @@
-from judgefinder.infrastructure.http.client import HttpClient, RequestsHttpClient
+from judgefinder.infrastructure.http.client import (
+    AsyncHttpClient,
+    HttpClient,
+    RequestsHttpClient,
+    ThreadedAsyncHttpClient,
+)
 
-__all__ = ["HttpClient", "RequestsHttpClient"]
+__all__ = ["AsyncHttpClient", "HttpClient", "RequestsHttpClient", "ThreadedAsyncHttpClient"]
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from judgefinder.domain.deadline import Deadline, DeadlineExceededError, current_deadline
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient, HttpResponse
+from judgefinder.infrastructure.http.errors import (
+    BACKPRESSURE_STATUS_CODES,
+    is_backpressure,
+    is_timeout,
+)
+
+
+@dataclass(slots=True)
+class AimdSettings:
+    initial_limit: float = 2.0
+    min_limit: float = 1.0
+    max_limit: float = 16.0
+    additive_step: float = 1.0
+    decrease_factor: float = 0.5
+    slow_latency_ratio: float = 3.0
+    decrease_cooldown_seconds: float = 1.0
+    latency_smoothing: float = 0.2
+
+
+@dataclass(slots=True)
+class _HostState:
+    limit: float
+    in_flight: int = 0
+    latency_ewma: float | None = None
+    latency_floor: float | None = None
+    last_decrease_at: float = float("-inf")
+
+
+class AimdController:
+    """Additive-increase / multiplicative-decrease concurrency limit per host.
+
+    Every healthy response raises the host's limit by ``additive_step / limit``, which
+    adds roughly one slot per round of requests. A 429/503, connection reset or timeout
+    cuts the limit by ``decrease_factor`` at most once per cooldown window. Responses that
+    are much slower than the fastest smoothed latency seen for the host hold the limit
+    where it is.
+
+    Waiting for a slot never outlives the active deadline. Threads wait on a condition;
+    tasks wait on an ``asyncio.Event`` that ``release`` sets from whichever thread frees
+    the slot.
+    """
+
+    def __init__(
+        self,
+        settings: AimdSettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings or AimdSettings()
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._hosts: dict[str, _HostState] = {}
+        self._initial_limits: dict[str, float] = {}
+        self._async_waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    def seed(self, host: str, initial_limit: float) -> None:
+        with self._condition:
+            key = host.lower()
+            self._initial_limits[key] = min(
+                initial_limit,
+                self._initial_limits.get(key, initial_limit),
+            )
+
+    def limit_for(self, host: str) -> float:
+        with self._condition:
+            return self._state(host.lower()).limit
+
+    def try_acquire(self, host: str) -> bool:
+        with self._condition:
+            return self._take_slot(host.lower())
+
+    def acquire(self, host: str) -> None:
+        deadline = current_deadline()
+        with self._condition:
+            key = host.lower()
+            while not self._take_slot(key):
+                self._condition.wait(_remaining(deadline, host))
+
+    async def acquire_async(self, host: str) -> None:
+        deadline = current_deadline()
+        loop = asyncio.get_running_loop()
+        key = host.lower()
+        while True:
+            waiter = (loop, asyncio.Event())
+            with self._condition:
+                if self._take_slot(key):
+                    return
+                self._async_waiters.setdefault(key, []).append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1].wait(), _remaining(deadline, host))
+            except asyncio.TimeoutError:
+                raise _slot_deadline_error(host) from None
+            finally:
+                with self._condition:
+                    waiters = self._async_waiters.get(key, [])
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+
+    def release(self, host: str, *, latency_seconds: float | None, backpressure: bool) -> None:
+        settings = self._settings
+        with self._condition:
+            state = self._state(host.lower())
+            state.in_flight = max(0, state.in_flight - 1)
+            if backpressure:
+                now = self._clock()
+                if now - state.last_decrease_at >= settings.decrease_cooldown_seconds:
+                    state.limit = max(settings.min_limit, state.limit * settings.decrease_factor)
+                    state.last_decrease_at = now
+            elif latency_seconds is not None:
+                self._observe_latency(state, latency_seconds)
+                if not self._is_slow(state):
+                    state.limit = min(
+                        settings.max_limit,
+                        state.limit + settings.additive_step / state.limit,
+                    )
+            self._condition.notify_all()
+            for loop, event in self._async_waiters.pop(host.lower(), []):
+                loop.call_soon_threadsafe(event.set)
+
+    def _take_slot(self, key: str) -> bool:
+        state = self._state(key)
+        if state.in_flight >= max(1, int(state.limit)):
+            return False
+        state.in_flight += 1
+        return True
+
+    def _observe_latency(self, state: _HostState, latency_seconds: float) -> None:
+        smoothing = self._settings.latency_smoothing
+        if state.latency_ewma is None:
+            state.latency_ewma = latency_seconds
+        else:
+            state.latency_ewma += smoothing * (latency_seconds - state.latency_ewma)
+        if state.latency_floor is None or state.latency_ewma < state.latency_floor:
+            state.latency_floor = state.latency_ewma
+
+    def _is_slow(self, state: _HostState) -> bool:
+        if state.latency_ewma is None or not state.latency_floor:
+            return False
+        return state.latency_ewma > state.latency_floor * self._settings.slow_latency_ratio
+
+    def _state(self, key: str) -> _HostState:
+        state = self._hosts.get(key)
+        if state is None:
+            initial_limit = self._initial_limits.get(key, self._settings.initial_limit)
+            state = _HostState(limit=max(self._settings.min_limit, initial_limit))
+            self._hosts[key] = state
+        return state
+
+
+class AdaptiveConcurrencyHttpClient(HttpClient):
+    def __init__(self, http_client: HttpClient, controller: AimdController) -> None:
+        self._http_client = http_client
+        self._controller = controller
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        host = _host_of(url)
+        self._controller.acquire(host)
+        timeout_clamped = _timeout_clamped(timeout_seconds)
+        started = time.perf_counter()
+        try:
+            text = self._http_client.get_text(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        except BaseException as exc:
+            self._controller.release(
+                host,
+                latency_seconds=None,
+                backpressure=_signals_backpressure(exc, timeout_clamped=timeout_clamped),
+            )
+            raise
+        self._controller.release(
+            host,
+            latency_seconds=time.perf_counter() - started,
+            backpressure=False,
+        )
+        return text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        host = _host_of(url)
+        self._controller.acquire(host)
+        timeout_clamped = _timeout_clamped(timeout_seconds)
+        started = time.perf_counter()
+        try:
+            response = self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        except BaseException as exc:
+            self._controller.release(
+                host,
+                latency_seconds=None,
+                backpressure=_signals_backpressure(exc, timeout_clamped=timeout_clamped),
+            )
+            raise
+        self._controller.release(
+            host,
+            latency_seconds=time.perf_counter() - started,
+            backpressure=response.status_code in BACKPRESSURE_STATUS_CODES,
+        )
+        return response
+
+
+class AdaptiveConcurrencyAsyncHttpClient(AsyncHttpClient):
+    def __init__(self, http_client: AsyncHttpClient, controller: AimdController) -> None:
+        self._http_client = http_client
+        self._controller = controller
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        host = _host_of(url)
+        await self._controller.acquire_async(host)
+        timeout_clamped = _timeout_clamped(timeout_seconds)
+        started = time.perf_counter()
+        try:
+            text = await self._http_client.get_text(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        except BaseException as exc:
+            self._controller.release(
+                host,
+                latency_seconds=None,
+                backpressure=_signals_backpressure(exc, timeout_clamped=timeout_clamped),
+            )
+            raise
+        self._controller.release(
+            host,
+            latency_seconds=time.perf_counter() - started,
+            backpressure=False,
+        )
+        return text
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        host = _host_of(url)
+        await self._controller.acquire_async(host)
+        timeout_clamped = _timeout_clamped(timeout_seconds)
+        started = time.perf_counter()
+        try:
+            response = await self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        except BaseException as exc:
+            self._controller.release(
+                host,
+                latency_seconds=None,
+                backpressure=_signals_backpressure(exc, timeout_clamped=timeout_clamped),
+            )
+            raise
+        self._controller.release(
+            host,
+            latency_seconds=time.perf_counter() - started,
+            backpressure=response.status_code in BACKPRESSURE_STATUS_CODES,
+        )
+        return response
+
+
+def _remaining(deadline: Deadline | None, host: str) -> float | None:
+    if deadline is None:
+        return None
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise _slot_deadline_error(host)
+    return remaining
+
+
+def _timeout_clamped(timeout_seconds: float) -> bool:
+    """Whether the deadline, not ``timeout_seconds``, will end this request."""
+    deadline = current_deadline()
+    return deadline is not None and deadline.remaining() <= timeout_seconds
+
+
+def _signals_backpressure(exc: BaseException, *, timeout_clamped: bool) -> bool:
+    # A timeout the deadline cut short says nothing about how loaded the host is.
+    if timeout_clamped and is_timeout(exc):
+        return False
+    return is_backpressure(exc)
+
+
+def _slot_deadline_error(host: str) -> DeadlineExceededError:
+    return DeadlineExceededError(f"Time budget exhausted waiting for a slot on host '{host}'.")
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from judgefinder.infrastructure.http.client import HttpClient, HttpResponse
+from judgefinder.infrastructure.http.errors import is_timeout, raise_for_status
+
+LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Served for URLs that were never recorded; a 4xx is not retried, so misses fail fast.
+MISSING_STATUS_CODE = 404
+
+
+@dataclass(slots=True)
+class Interaction:
+    url: str
+    request_headers: dict[str, str]
+    status_code: int = 0
+    headers: dict[str, str] = field(default_factory=dict)
+    text: str = ""
+    final_url: str = ""
+    latency_seconds: float = 0.0
+    error: str = ""
+
+    def to_response(self) -> HttpResponse:
+        return HttpResponse(
+            status_code=self.status_code,
+            text=self.text,
+            headers=dict(self.headers),
+            url=self.final_url or self.url,
+        )
+
+    def raise_error(self) -> None:
+        if self.error == "timeout":
+            raise requests.Timeout(f"Recorded timeout for url: {self.url}")
+        if self.error:
+            raise requests.ConnectionError(f"Recorded {self.error} for url: {self.url}")
+
+
+def load_cassette(path: Path) -> list[Interaction]:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(raw, dict) or raw.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette format: {path}")
+    interactions = raw.get("interactions")
+    if not isinstance(interactions, list):
+        raise ValueError(f"Unsupported cassette format: {path}")
+    return [Interaction(**_interaction_fields(item)) for item in interactions]
+
+
+def save_cassette(path: Path, interactions: list[Interaction]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_text(
+        json.dumps(
+            {
+                "version": CASSETTE_VERSION,
+                "interactions": [asdict(interaction) for interaction in interactions],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    temp_path.replace(path)
+
+
+class RecordingHttpClient(HttpClient):
+    """Capture every request that reaches the network so a run can be replayed offline.
+
+    Transport errors are recorded too, so a replay fails the same way the live run did.
+    Interactions are written by ``save``, in the order their responses arrived.
+    """
+
+    def __init__(self, http_client: HttpClient, path: Path) -> None:
+        self._http_client = http_client
+        self._path = path
+        self._lock = threading.Lock()
+        self._interactions: list[Interaction] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        response = self.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+        raise_for_status(response)
+        return response.text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        interaction = Interaction(url=url, request_headers=dict(headers or {}))
+        started = time.perf_counter()
+        try:
+            response = self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        except (requests.RequestException, OSError) as exc:
+            interaction.latency_seconds = time.perf_counter() - started
+            interaction.error = "timeout" if is_timeout(exc) else type(exc).__name__
+            self._append(interaction)
+            raise
+        interaction.latency_seconds = time.perf_counter() - started
+        interaction.status_code = response.status_code
+        interaction.headers = dict(response.headers)
+        interaction.text = response.text
+        interaction.final_url = response.url
+        self._append(interaction)
+        return response
+
+    @property
+    def interaction_count(self) -> int:
+        with self._lock:
+            return len(self._interactions)
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = list(self._interactions)
+        save_cassette(self._path, interactions)
+
+    def _append(self, interaction: Interaction) -> None:
+        with self._lock:
+            self._interactions.append(interaction)
+
+
+class ReplayHttpClient(HttpClient):
+    """Serve recorded interactions instead of touching the network.
+
+    Each URL replays its recordings in their original order and then keeps returning
+    the last one, so repeated runs over one cassette stay deterministic. With
+    ``latency_scale`` above zero every answer is delayed by its recorded latency times
+    that factor.
+    """
+
+    def __init__(
+        self,
+        interactions: list[Interaction],
+        *,
+        latency_scale: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if latency_scale < 0:
+            raise ValueError("latency_scale must not be negative.")
+        self._latency_scale = latency_scale
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._by_url: dict[str, deque[Interaction]] = {}
+        for interaction in interactions:
+            self._by_url.setdefault(interaction.url, deque()).append(interaction)
+        self._misses = 0
+
+    @classmethod
+    def from_file(cls, path: Path, *, latency_scale: float = 0.0) -> ReplayHttpClient:
+        return cls(load_cassette(path), latency_scale=latency_scale)
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        response = self.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+        raise_for_status(response)
+        return response.text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        interaction = self._next(url)
+        if interaction is None:
+            LOGGER.warning("Cassette has no recording for %s", url)
+            return HttpResponse(status_code=MISSING_STATUS_CODE, text="", headers={}, url=url)
+        if self._latency_scale > 0:
+            self._sleep(interaction.latency_seconds * self._latency_scale)
+        interaction.raise_error()
+        return interaction.to_response()
+
+    def _next(self, url: str) -> Interaction | None:
+        with self._lock:
+            recorded = self._by_url.get(url)
+            if not recorded:
+                self._misses += 1
+                return None
+            if len(recorded) > 1:
+                return recorded.popleft()
+            return recorded[0]
+
+
+def _interaction_fields(item: Any) -> dict[str, Any]:
+    if not isinstance(item, dict) or not isinstance(item.get("url"), str):
+        raise ValueError("Cassette interaction needs a url.")
+    allowed = set(Interaction.__dataclass_fields__)
+    return {key: value for key, value in item.items() if key in allowed}
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Protocol
+from http.cookiejar import Cookie, DefaultCookiePolicy
+from typing import Any, Protocol, TypeVar
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from judgefinder.domain.deadline import clamp_timeout
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 5.0
+
+ResultT = TypeVar("ResultT")
 
 
 @dataclass(slots=True)
@@ -26,8 +41,7 @@ class HttpClient(Protocol):
         timeout_seconds: float = 10.0,
         headers: Mapping[str, str] | None = None,
         use_session: bool = False,
-    ) -> str:
-        ...
+    ) -> str: ...
 
     def get_response(
         self,
@@ -35,13 +49,52 @@ class HttpClient(Protocol):
         timeout_seconds: float = 10.0,
         headers: Mapping[str, str] | None = None,
         use_session: bool = False,
-    ) -> HttpResponse:
-        ...
+    ) -> HttpResponse: ...
+
+
+class AsyncHttpClient(Protocol):
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str: ...
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse: ...
 
 
 class RequestsHttpClient(HttpClient):
-    def __init__(self) -> None:
-        self._session = requests.Session()
+    """Blocking client that reuses pooled keep-alive connections for every request.
+
+    Requests without ``use_session`` go through one shared session whose cookie jar
+    rejects every cookie, so they behave like ``requests.get`` without the per-request
+    TCP/TLS handshake. Requests with ``use_session`` get one session per host, which keeps
+    cookies isolated between sites.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    ) -> None:
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Connection pool sizes must be at least 1.")
+        self._connect_timeout_seconds = connect_timeout_seconds
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._shared_session = self._new_session()
+        self._shared_session.cookies.set_policy(_RejectAllCookiesPolicy())
+        self._host_sessions: dict[str, requests.Session] = {}
 
     def get_text(
         self,
@@ -89,5 +142,123 @@ class RequestsHttpClient(HttpClient):
         headers: Mapping[str, str] | None,
         use_session: bool,
     ) -> requests.Response:
-        requester = self._session.get if use_session else requests.get
-        return requester(url, timeout=timeout_seconds, headers=headers)
+        # timeout_seconds is the read timeout; both are cut short by the active deadline.
+        read_timeout = clamp_timeout(timeout_seconds)
+        connect_timeout = min(self._connect_timeout_seconds, read_timeout)
+        session = self._session_for(url) if use_session else self._shared_session
+        return session.get(url, timeout=(connect_timeout, read_timeout), headers=headers)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = [self._shared_session, *self._host_sessions.values()]
+            self._host_sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _session_for(self, url: str) -> requests.Session:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            session = self._host_sessions.get(host)
+            if session is None:
+                session = self._new_session()
+                self._host_sessions[host] = session
+            return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+    def return_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+
+class ThreadedAsyncHttpClient(AsyncHttpClient):
+    """Expose a blocking HttpClient through the AsyncHttpClient protocol.
+
+    Every awaited request holds one thread until the blocking call returns. Without
+    ``max_threads`` calls run on the event loop's default executor, which Python caps at
+    ``min(32, cpu_count + 4)`` threads; with it the client runs them on its own pool of
+    that size, so the concurrency settings rather than the host CPU set the limit.
+    """
+
+    def __init__(self, http_client: HttpClient, *, max_threads: int | None = None) -> None:
+        self._http_client = http_client
+        self._executor: ThreadPoolExecutor | None = None
+        self._max_threads: int | None = None
+        if max_threads is not None:
+            self.set_max_threads(max_threads)
+
+    @property
+    def max_threads(self) -> int | None:
+        return self._max_threads
+
+    def set_max_threads(self, max_threads: int) -> None:
+        """Resize the pool between runs; requests already running finish on the old one."""
+        if max_threads < 1:
+            raise ValueError("max_threads must be at least 1.")
+        if max_threads == self._max_threads:
+            return
+        previous = self._executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_threads,
+            thread_name_prefix="async-http",
+        )
+        self._max_threads = max_threads
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._max_threads = None
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        return await self._run(
+            lambda: self._http_client.get_text(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        )
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        return await self._run(
+            lambda: self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            )
+        )
+
+    async def _run(self, call: Callable[[], ResultT]) -> ResultT:
+        if self._executor is None:
+            return await asyncio.to_thread(call)
+        # Copy the context as asyncio.to_thread does, so deadlines and metrics follow.
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, context.run, call)
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from judgefinder.domain.run_metrics import record_cache_hit
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient, HttpResponse
+from judgefinder.infrastructure.http.errors import raise_for_status
+
+LOGGER = logging.getLogger(__name__)
+
+NOT_MODIFIED = 304
+PRUNE_INTERVAL_SECONDS = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class HttpCacheStats:
+    requests: int = 0
+    revalidated: int = 0
+    stored: int = 0
+    bytes_saved: int = 0
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    url: str
+    text: str
+    headers: dict[str, str]
+    etag: str = ""
+    last_modified: str = ""
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> HttpResponse:
+        return HttpResponse(status_code=200, text=self.text, headers=self.headers, url=self.url)
+
+
+class HttpCacheStore:
+    """On-disk store of response bodies and their validators, one JSON file per URL.
+
+    With ``max_age_seconds`` set, an entry that has not been stored or revalidated for
+    that long is treated as a miss; the full response fetched instead overwrites it, and
+    ``save`` sweeps expired entries out of the whole directory at most once per
+    ``PRUNE_INTERVAL_SECONDS``, so URLs that are never requested again do not pile up.
+
+    Several processes may share the directory: writes go through a temp file unique to
+    the process and thread and are swapped in atomically, and readers take an entry's
+    age from the file they opened, so a concurrent ``save`` never yields a torn read.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_age_seconds: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = directory
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._next_prune_at = float("-inf")
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._revalidated = 0
+        self._stored = 0
+        self._bytes_saved = 0
+
+    def load(self, url: str) -> CachedResponse | None:
+        path = self._path_for(url)
+        try:
+            with path.open(encoding="utf-8") as handle:
+                if self._is_expired_at(os.fstat(handle.fileno()).st_mtime):
+                    return None
+                raw = json.loads(handle.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            LOGGER.debug("Ignoring unreadable HTTP cache entry: %s", path)
+            return None
+        if not isinstance(raw, dict) or raw.get("url") != url:
+            return None
+        headers = raw.get("headers")
+        return CachedResponse(
+            url=url,
+            text=str(raw.get("text", "")),
+            headers=dict(headers) if isinstance(headers, dict) else {},
+            etag=str(raw.get("etag", "")),
+            last_modified=str(raw.get("last_modified", "")),
+        )
+
+    def save(self, response: HttpResponse, *, url: str) -> None:
+        etag = _header(response.headers, "ETag")
+        last_modified = _header(response.headers, "Last-Modified")
+        path = self._path_for(url)
+        if not etag and not last_modified:
+            # Without validators the entry could never be revalidated.
+            path.unlink(missing_ok=True)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "text": response.text,
+                    "headers": dict(response.headers),
+                    "etag": etag,
+                    "last_modified": last_modified,
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        temp_path.replace(path)
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            # Another process pruned or replaced the entry in between; nothing to date.
+            LOGGER.debug("HTTP cache entry vanished before it was dated: %s", path)
+        with self._lock:
+            self._stored += 1
+            prune_due = self._max_age_seconds > 0 and now >= self._next_prune_at
+            if prune_due:
+                self._next_prune_at = now + PRUNE_INTERVAL_SECONDS
+        if prune_due:
+            self.prune()
+
+    def mark_fresh(self, url: str) -> None:
+        """Restart the age of an entry the server just confirmed with a 304."""
+        path = self._path_for(url)
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            LOGGER.debug("Could not refresh HTTP cache entry: %s", path)
+
+    def prune(self) -> int:
+        """Delete entries older than ``max_age_seconds`` and return how many went."""
+        if self._max_age_seconds <= 0 or not self._directory.exists():
+            return 0
+        removed = 0
+        for path in self._directory.glob("*/*.json"):
+            # Losing a race with a concurrent save only costs that URL one full download.
+            if self._is_expired(path):
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            LOGGER.debug("Pruned %s expired HTTP cache entries", removed)
+        return removed
+
+    def record_request(self, *, revalidated: CachedResponse | None) -> None:
+        with self._lock:
+            self._requests += 1
+            if revalidated is not None:
+                self._revalidated += 1
+                self._bytes_saved += len(revalidated.text.encode("utf-8"))
+
+    def stats(self) -> HttpCacheStats:
+        with self._lock:
+            return HttpCacheStats(
+                requests=self._requests,
+                revalidated=self._revalidated,
+                stored=self._stored,
+                bytes_saved=self._bytes_saved,
+            )
+
+    def _is_expired(self, path: Path) -> bool:
+        try:
+            modified_at = path.stat().st_mtime
+        except OSError:
+            return False
+        return self._is_expired_at(modified_at)
+
+    def _is_expired_at(self, modified_at: float) -> bool:
+        if self._max_age_seconds <= 0:
+            return False
+        return self._clock() - modified_at > self._max_age_seconds
+
+    def _path_for(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self._directory / digest[:2] / f"{digest}.json"
+
+
+class ConditionalGetHttpClient(HttpClient):
+    """Revalidate cached bodies with If-None-Match / If-Modified-Since.
+
+    A 304 answer is served from the store as a normal 200 response, so callers never
+    see the difference except in the saved bandwidth reported by ``HttpCacheStore``.
+    """
+
+    def __init__(self, http_client: HttpClient, store: HttpCacheStore) -> None:
+        self._http_client = http_client
+        self._store = store
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        response = self.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+        raise_for_status(response)
+        return response.text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        cached = self._store.load(url)
+        response = self._http_client.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=_with_validators(headers, cached),
+            use_session=use_session,
+        )
+        return _resolve(self._store, url, cached, response)
+
+
+class ConditionalGetAsyncHttpClient(AsyncHttpClient):
+    def __init__(self, http_client: AsyncHttpClient, store: HttpCacheStore) -> None:
+        self._http_client = http_client
+        self._store = store
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        response = await self.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+        raise_for_status(response)
+        return response.text
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        cached = self._store.load(url)
+        response = await self._http_client.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=_with_validators(headers, cached),
+            use_session=use_session,
+        )
+        return _resolve(self._store, url, cached, response)
+
+
+def _with_validators(
+    headers: Mapping[str, str] | None,
+    cached: CachedResponse | None,
+) -> Mapping[str, str] | None:
+    if cached is None:
+        return headers
+    return {**(headers or {}), **cached.validator_headers()}
+
+
+def _resolve(
+    store: HttpCacheStore,
+    url: str,
+    cached: CachedResponse | None,
+    response: HttpResponse,
+) -> HttpResponse:
+    if response.status_code == NOT_MODIFIED and cached is not None:
+        store.record_request(revalidated=cached)
+        store.mark_fresh(url)
+        record_cache_hit(revalidated_bytes=len(cached.text.encode("utf-8")))
+        return cached.to_response()
+    store.record_request(revalidated=None)
+    if response.ok:
+        store.save(response, url=url)
+    return response
+
+
+def _header(headers: Mapping[str, str], name: str) -> str:
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return ""
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import requests
+
+from judgefinder.domain.deadline import DeadlineExceededError
+from judgefinder.infrastructure.http.client import HttpResponse
+
+BACKPRESSURE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+
+
+def status_code_of(exc: BaseException) -> int | None:
+    response = getattr(exc, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    return isinstance(exc, (requests.ConnectionError, ConnectionError))
+
+
+def is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, (requests.Timeout, TimeoutError))
+
+
+def is_backpressure(exc: BaseException) -> bool:
+    """Whether the failure means the host is asking us to slow down."""
+    if isinstance(exc, DeadlineExceededError):
+        # Our own time budget ran out; the host did nothing to cause it.
+        return False
+    status_code = status_code_of(exc)
+    if status_code is not None:
+        return status_code in BACKPRESSURE_STATUS_CODES
+    return is_connection_error(exc) or is_timeout(exc)
+
+
+def raise_for_status(response: HttpResponse) -> None:
+    """Raise the same error type RequestsHttpClient.get_text raises for 4xx/5xx responses."""
+    if response.status_code < 400:
+        return
+    kind = "Client" if response.status_code < 500 else "Server"
+    raise requests.HTTPError(
+        f"{response.status_code} {kind} Error for url: {response.url}",
+        response=response,  # type: ignore[arg-type]
+    )
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TypeVar
+from urllib.parse import urlparse
+
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient, HttpResponse
+
+ResultT = TypeVar("ResultT")
+
+
+@dataclass(slots=True)
+class HedgeSettings:
+    percentile: float = 0.9
+    min_samples: int = 20
+    window_size: int = 200
+    max_hedge_ratio: float = 0.1
+    min_delay_seconds: float = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+
+class HedgePolicy:
+    """Decide when a slow request gets a duplicate, and keep hedging volume bounded.
+
+    The hedge delay of a host is the configured percentile of its recent latencies, so
+    only the slowest tail of requests is duplicated. Hedges are refused once they would
+    exceed ``max_hedge_ratio`` of the requests that could have been hedged in this run,
+    that is those to eligible hosts with enough latency samples.
+    """
+
+    def __init__(
+        self,
+        settings: HedgeSettings | None = None,
+        *,
+        eligible: Callable[[str], bool] = lambda host: True,
+    ) -> None:
+        self._settings = settings or HedgeSettings()
+        self._eligible = eligible
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def hedge_delay(self, host: str) -> float | None:
+        if not self._eligible(host):
+            return None
+        with self._lock:
+            samples = self._latencies.get(host)
+            if samples is None or len(samples) < self._settings.min_samples:
+                return None
+            self._requests += 1
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(self._settings.percentile * len(ordered)) - 1)
+        return max(self._settings.min_delay_seconds, ordered[index])
+
+    def try_start_hedge(self) -> bool:
+        with self._lock:
+            if self._hedged + 1 > self._settings.max_hedge_ratio * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def record_latency(self, host: str, latency_seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.setdefault(
+                host,
+                deque(maxlen=self._settings.window_size),
+            )
+            samples.append(latency_seconds)
+
+    def record_hedge_win(self) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                hedge_wins=self._hedge_wins,
+            )
+
+
+class HedgingHttpClient(HttpClient):
+    """Send a duplicate GET once a request outlives its host's latency percentile.
+
+    Whichever attempt succeeds first wins. The losing attempt cannot be interrupted
+    mid-read, so it finishes on a background thread and its result is dropped.
+
+    Requests to hosts that are not hedged yet run on the calling thread; hedged ones run
+    both attempts on the pool, so ``max_workers`` should cover two attempts for every
+    request that can be in flight at once. The hedge delay is counted from the moment
+    the first attempt starts, so time spent queued for the pool never causes a hedge.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        policy: HedgePolicy,
+        *,
+        max_workers: int = 32,
+    ) -> None:
+        self._http_client = http_client
+        self._policy = policy
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        return self._hedged(
+            url,
+            lambda: self._http_client.get_text(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            ),
+        )
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        return self._hedged(
+            url,
+            lambda: self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            ),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _hedged(self, url: str, call: Callable[[], ResultT]) -> ResultT:
+        host = _host_of(url)
+        delay = self._policy.hedge_delay(host)
+        if delay is None:
+            return _timed(self._policy, host, call)
+
+        started = threading.Event()
+        primary = self._submit(host, call, started=started)
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._policy.try_start_hedge():
+            return primary.result()
+
+        hedge = self._submit(host, call)
+        attempts: set[Future[ResultT]] = {primary, hedge}
+        last_error: BaseException | None = None
+        while attempts:
+            done, attempts = wait(attempts, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is hedge:
+                        self._policy.record_hedge_win()
+                    return future.result()
+                last_error = error
+        if last_error is None:
+            raise RuntimeError("Hedged request finished without a result.")
+        raise last_error
+
+    def _submit(
+        self,
+        host: str,
+        call: Callable[[], ResultT],
+        *,
+        started: threading.Event | None = None,
+    ) -> Future[ResultT]:
+        context = contextvars.copy_context()
+
+        def run() -> ResultT:
+            if started is not None:
+                started.set()
+            return _timed(self._policy, host, call)
+
+        return self._executor.submit(context.run, run)
+
+
+class HedgingAsyncHttpClient(AsyncHttpClient):
+    def __init__(self, http_client: AsyncHttpClient, policy: HedgePolicy) -> None:
+        self._http_client = http_client
+        self._policy = policy
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        return await self._hedged(
+            url,
+            lambda: self._http_client.get_text(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            ),
+        )
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        return await self._hedged(
+            url,
+            lambda: self._http_client.get_response(
+                url,
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+                use_session=use_session,
+            ),
+        )
+
+    async def _hedged(self, url: str, call: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        host = _host_of(url)
+        delay = self._policy.hedge_delay(host)
+        if delay is None:
+            return await _timed_async(self._policy, host, call)
+
+        primary = asyncio.ensure_future(_timed_async(self._policy, host, call))
+        finished, _ = await asyncio.wait({primary}, timeout=delay)
+        if finished or not self._policy.try_start_hedge():
+            return await primary
+
+        hedge = asyncio.ensure_future(_timed_async(self._policy, host, call))
+        attempts: set[asyncio.Future[ResultT]] = {primary, hedge}
+        last_error: BaseException | None = None
+        try:
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        if future is hedge:
+                            self._policy.record_hedge_win()
+                        return future.result()
+                    last_error = error
+        finally:
+            for unfinished in attempts:
+                unfinished.cancel()
+        if last_error is None:
+            raise RuntimeError("Hedged request finished without a result.")
+        raise last_error
+
+
+def _timed(policy: HedgePolicy, host: str, call: Callable[[], ResultT]) -> ResultT:
+    started = time.perf_counter()
+    result = call()
+    policy.record_latency(host, time.perf_counter() - started)
+    return result
+
+
+async def _timed_async(
+    policy: HedgePolicy,
+    host: str,
+    call: Callable[[], Awaitable[ResultT]],
+) -> ResultT:
+    started = time.perf_counter()
+    result = await call()
+    policy.record_latency(host, time.perf_counter() - started)
+    return result
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
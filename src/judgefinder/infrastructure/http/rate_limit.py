@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import urlparse
+
+from judgefinder.domain.deadline import QuotaExhaustedError
+from judgefinder.infrastructure.http.client import AsyncHttpClient, HttpClient, HttpResponse
+
+
+class DailyQuotaExceededError(QuotaExhaustedError):
+    def __init__(self, host: str, quota: int) -> None:
+        super().__init__(f"Daily request quota of {quota} exhausted for host '{host}'.")
+        self.host = host
+        self.quota = quota
+
+
+@dataclass(slots=True)
+class HostRateLimit:
+    rate_per_second: float
+    burst: int = 1
+    daily_quota: int = 0
+
+    @classmethod
+    def from_throttle(
+        cls,
+        throttle_seconds: float,
+        *,
+        burst: int = 1,
+        daily_quota: int = 0,
+    ) -> HostRateLimit | None:
+        if throttle_seconds <= 0 and daily_quota <= 0:
+            return None
+        rate_per_second = 1.0 / throttle_seconds if throttle_seconds > 0 else float("inf")
+        return cls(rate_per_second=rate_per_second, burst=burst, daily_quota=daily_quota)
+
+    def merge(self, other: HostRateLimit) -> HostRateLimit:
+        """Combine two limits for the same host, keeping the stricter value of each."""
+        quotas = [quota for quota in (self.daily_quota, other.daily_quota) if quota > 0]
+        return HostRateLimit(
+            rate_per_second=min(self.rate_per_second, other.rate_per_second),
+            burst=min(self.burst, other.burst),
+            daily_quota=min(quotas) if quotas else 0,
+        )
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    limit: HostRateLimit
+    tokens: float
+    updated_at: float
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        if self.limit.rate_per_second == float("inf"):
+            return 0.0
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(
+            float(self.limit.burst),
+            self.tokens + elapsed * self.limit.rate_per_second,
+        )
+        self.updated_at = now
+        self.tokens -= 1.0
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.limit.rate_per_second
+
+
+class DailyQuotaStore(Protocol):
+    """Per-host request counters for the current day, shared by every collector."""
+
+    def consume(self, host: str, quota: int) -> None:
+        """Count one request, raising ``DailyQuotaExceededError`` once ``quota`` is used."""
+        ...
+
+    def used(self, host: str) -> int: ...
+
+
+class HostRateLimiter:
+    """Token-bucket limiter shared by every source, keyed by request host.
+
+    The lock only guards bucket bookkeeping; callers wait outside of it, so a throttled
+    host never blocks requests to other hosts. ``acquire`` sleeps the calling thread and
+    ``acquire_async`` suspends only the calling task.
+    """
+
+    def __init__(
+        self,
+        *,
+        quota_store: DailyQuotaStore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._quota_store = quota_store
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def configure(self, host: str, limit: HostRateLimit) -> None:
+        """Set the limit for ``host``, replacing any earlier one."""
+        with self._lock:
+            self._set_limit(host.lower(), limit)
+
+    def replace_all(self, limits: Mapping[str, HostRateLimit]) -> None:
+        """Swap in a whole new set of limits; hosts left out are no longer limited.
+
+        Buckets of hosts that stay limited keep their spent tokens, so a reload does not
+        hand out a fresh burst.
+        """
+        keyed = {host.lower(): limit for host, limit in limits.items()}
+        with self._lock:
+            for key in set(self._buckets) - set(keyed):
+                del self._buckets[key]
+            for key, limit in keyed.items():
+                self._set_limit(key, limit)
+
+    def limit_for(self, host: str) -> HostRateLimit | None:
+        with self._lock:
+            bucket = self._buckets.get(host.lower())
+            return None if bucket is None else bucket.limit
+
+    def _set_limit(self, key: str, limit: HostRateLimit) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = _TokenBucket(
+                limit=limit,
+                tokens=float(limit.burst),
+                updated_at=self._clock(),
+            )
+            return
+        bucket.limit = limit
+        bucket.tokens = min(bucket.tokens, float(limit.burst))
+
+    def reserve(self, host: str) -> float:
+        """Count the request against the host's daily quota, then take a bucket token."""
+        key = host.lower()
+        quota = self._daily_quota(key)
+        if quota > 0 and self._quota_store is not None:
+            self._quota_store.consume(key, quota)
+        return self._take_token(key)
+
+    def acquire(self, host: str) -> None:
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, host: str) -> None:
+        key = host.lower()
+        quota = self._daily_quota(key)
+        if quota > 0 and self._quota_store is not None:
+            # The quota store writes to the database; keep that off the event loop.
+            await asyncio.to_thread(self._quota_store.consume, key, quota)
+        delay = self._take_token(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _daily_quota(self, key: str) -> int:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return 0 if bucket is None else bucket.limit.daily_quota
+
+    def _take_token(self, key: str) -> float:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return 0.0 if bucket is None else bucket.reserve(self._clock())
+
+
+class RateLimitedHttpClient(HttpClient):
+    def __init__(self, http_client: HttpClient, rate_limiter: HostRateLimiter) -> None:
+        self._http_client = http_client
+        self._rate_limiter = rate_limiter
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        self._rate_limiter.acquire(_host_of(url))
+        return self._http_client.get_text(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        self._rate_limiter.acquire(_host_of(url))
+        return self._http_client.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+
+
+class RateLimitedAsyncHttpClient(AsyncHttpClient):
+    def __init__(self, http_client: AsyncHttpClient, rate_limiter: HostRateLimiter) -> None:
+        self._http_client = http_client
+        self._rate_limiter = rate_limiter
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        await self._rate_limiter.acquire_async(_host_of(url))
+        return await self._http_client.get_text(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        await self._rate_limiter.acquire_async(_host_of(url))
+        return await self._http_client.get_response(
+            url,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            use_session=use_session,
+        )
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
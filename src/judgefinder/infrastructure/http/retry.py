@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from judgefinder.domain.deadline import QuotaExhaustedError
+from judgefinder.infrastructure.http.errors import status_code_of
+
+LOGGER = logging.getLogger(__name__)
+
+# 4xx answers that describe a transient condition rather than a bad request.
+RETRYABLE_CLIENT_STATUS_CODES: frozenset[int] = frozenset({408, 425, 429})
+
+
+class RetryBudget:
+    """Cap on the number of retries spent across every source during one run."""
+
+    def __init__(self, max_retries: int) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        self._max_retries = max_retries
+        self._remaining = max_retries
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self._remaining
+
+    def refill(self) -> None:
+        """Start a new run; long-lived processes call this before every collection."""
+        with self._lock:
+            self._remaining = self._max_retries
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, QuotaExhaustedError):
+        return False
+    status_code = status_code_of(exc)
+    if status_code is None:
+        return True
+    if 400 <= status_code < 500:
+        return status_code in RETRYABLE_CLIENT_STATUS_CODES
+    return True
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, shared by every source.
+
+    Attempt ``n`` (1-based) that failed waits a random time in
+    ``[0, min(max_delay_seconds, base_delay_seconds * multiplier ** (n - 1))]``.
+    Client errors other than timeouts and 429 are returned to the caller at once.
+    """
+
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    multiplier: float = 2.0
+    budget: RetryBudget | None = None
+    random_fraction: Callable[[], float] = field(default=random.random, repr=False)
+
+    def next_delay(self, exc: BaseException, *, attempt: int, max_attempts: int) -> float | None:
+        """Seconds to wait before the next attempt, or None when the error should surface."""
+        if attempt >= max_attempts or not is_retryable(exc):
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            LOGGER.debug("Retry budget exhausted; not retrying after: %s", exc)
+            return None
+        ceiling = min(
+            self.max_delay_seconds,
+            self.base_delay_seconds * self.multiplier ** (attempt - 1),
+        )
+        return ceiling * self.random_fraction()
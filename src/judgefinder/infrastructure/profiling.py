@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+# Span categories (see judgefinder.domain.tracing) and the stage they are billed to.
+STAGE_BY_CATEGORY: dict[str, str] = {
+    "bootstrap": "bootstrap",
+    "config": "config_load",
+    "registry": "registry_build",
+    "source": "fetch",
+    "http": "fetch",
+    "parse": "parse",
+    "filter": "parse",
+    "db": "persist",
+}
+STAGES: tuple[str, ...] = (
+    "bootstrap",
+    "config_load",
+    "registry_build",
+    "fetch",
+    "parse",
+    "persist",
+)
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 25
+
+
+@dataclass(slots=True)
+class StageTotals:
+    seconds: float = 0.0
+    spans: int = 0
+    allocated_bytes: int = 0
+
+
+@dataclass(slots=True)
+class _ActiveStage:
+    stage: str
+    profile: cProfile.Profile | None
+    child_seconds: float = 0.0
+    child_bytes: int = 0
+
+
+class StageProfiler:
+    """cProfile and tracemalloc split by pipeline stage, fed by ``trace_span`` spans.
+
+    Each stage gets its own cProfile profile per thread. Nested spans switch the thread
+    over to the inner stage and back, so a stage's time and statistics exclude the spans
+    it contains (fetching a source includes parsing its pages, which is billed to
+    "parse").
+    Interpreters that allow only one active profiler (3.12+) skip cProfile for spans on
+    other threads while one is running; their wall time is still counted.
+
+    tracemalloc starts with the profiler. Stage totals count the net traced memory the
+    stage's own code left behind, and ``checkpoint`` snapshots let ``write`` list the
+    allocation sites that grew most between two points of the run.
+    """
+
+    def __init__(self, output_dir: Path, *, trace_memory: bool = True) -> None:
+        self._output_dir = output_dir
+        self._trace_memory = trace_memory
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles: dict[str, list[cProfile.Profile]] = {}
+        self._totals: dict[str, StageTotals] = {}
+        self._checkpoints: list[tuple[str, tracemalloc.Snapshot]] = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        category: str,
+        group: str,
+        lane: str,
+        args: dict[str, Any] | None = None,
+    ) -> Iterator[None]:
+        _ = (name, group, lane, args)
+        stage = STAGE_BY_CATEGORY.get(category)
+        if stage is None:
+            yield
+            return
+        stack = self._stack()
+        if stack and stack[-1].profile is not None:
+            stack[-1].profile.disable()
+        active = _ActiveStage(stage, self._enable_profile(stage))
+        stack.append(active)
+        memory_before = self._traced_memory()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            allocated = self._traced_memory() - memory_before
+            if active.profile is not None:
+                active.profile.disable()
+            stack.pop()
+            self._add_totals(
+                stage,
+                elapsed - active.child_seconds,
+                allocated - active.child_bytes,
+            )
+            if stack:
+                parent = stack[-1]
+                parent.child_seconds += elapsed
+                parent.child_bytes += allocated
+                if parent.profile is not None:
+                    try:
+                        parent.profile.enable()
+                    except ValueError:
+                        parent.profile = None
+
+    def checkpoint(self, label: str) -> None:
+        """Snapshot traced allocations; ``write`` diffs consecutive checkpoints."""
+        if self._trace_memory and tracemalloc.is_tracing():
+            self._checkpoints.append((label, tracemalloc.take_snapshot()))
+
+    def totals(self) -> dict[str, StageTotals]:
+        with self._lock:
+            return {stage: self._totals[stage] for stage in STAGES if stage in self._totals}
+
+    def write(self) -> list[Path]:
+        """Write one ``<stage>.pstats`` per stage, a summary and the allocation report."""
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+        summary = io.StringIO()
+        summary.write(self.format_totals() + "\n")
+        with self._lock:
+            profiles = {stage: list(items) for stage, items in self._profiles.items()}
+        for stage in STAGES:
+            stats = _merged_stats(profiles.get(stage, []), stream=summary)
+            if stats is None:
+                continue
+            path = self._output_dir / f"{stage}.pstats"
+            stats.dump_stats(path)
+            written.append(path)
+            summary.write(f"\n== {stage}: top {TOP_FUNCTIONS} functions by own time ==\n")
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        summary_path = self._output_dir / "summary.txt"
+        summary_path.write_text(summary.getvalue(), encoding="utf-8")
+        written.append(summary_path)
+        if len(self._checkpoints) > 1:
+            allocations_path = self._output_dir / "allocations.txt"
+            allocations_path.write_text(self._format_allocations(), encoding="utf-8")
+            written.append(allocations_path)
+        return written
+
+    def close(self) -> None:
+        if self._trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def format_totals(self) -> str:
+        lines = [f"{'stage':<16} {'seconds':>9} {'spans':>7} {'net KiB':>10}"]
+        for stage, totals in self.totals().items():
+            lines.append(
+                f"{stage:<16} {totals.seconds:>9.3f} {totals.spans:>7} "
+                f"{totals.allocated_bytes / 1024:>10,.1f}"
+            )
+        return "\n".join(lines)
+
+    def _format_allocations(self) -> str:
+        sections: list[str] = []
+        for (_, before), (label, after) in zip(
+            self._checkpoints, self._checkpoints[1:], strict=False
+        ):
+            sections.append(f"== {label}: top {TOP_ALLOCATIONS} allocation sites by growth ==")
+            for difference in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+                sections.append(str(difference))
+            sections.append("")
+        return "\n".join(sections)
+
+    def _stack(self) -> list[_ActiveStage]:
+        stack: list[_ActiveStage] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enable_profile(self, stage: str) -> cProfile.Profile | None:
+        profiles: dict[str, cProfile.Profile] | None = getattr(self._local, "profiles", None)
+        if profiles is None:
+            profiles = self._local.profiles = {}
+        profile = profiles.get(stage)
+        if profile is None:
+            profile = profiles[stage] = cProfile.Profile()
+            with self._lock:
+                self._profiles.setdefault(stage, []).append(profile)
+        try:
+            profile.enable()
+        except ValueError:
+            # Another thread holds the interpreter's only profiler slot.
+            return None
+        return profile
+
+    def _add_totals(self, stage: str, seconds: float, allocated_bytes: int) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(stage, StageTotals())
+            totals.seconds += seconds
+            totals.spans += 1
+            totals.allocated_bytes += allocated_bytes
+
+    def _traced_memory(self) -> int:
+        if not self._trace_memory:
+            return 0
+        current, _ = tracemalloc.get_traced_memory()
+        return current
+
+
+def _merged_stats(profiles: list[cProfile.Profile], *, stream: io.StringIO) -> pstats.Stats | None:
+    stats: pstats.Stats | None = None
+    for profile in profiles:
+        profile.create_stats()
+        if not getattr(profile, "stats", None):
+            continue
+        if stats is None:
+            stats = pstats.Stats(profile, stream=stream)
+        else:
+            stats.add(profile)
+    return stats
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 import logging
+import os
+import signal
+import socket
+import threading
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import click
 
+from judgefinder.application.job_worker import CollectionWorker
+from judgefinder.application.polling import PollingCollector
+from judgefinder.application.use_cases import VerifyShardCoverageUseCase
 from judgefinder.bootstrap import AppContainer, create_app
+from judgefinder.domain.entities import Notice
+from judgefinder.domain.run_metrics import RunMetrics
+from judgefinder.domain.sharding import ShardSpec
+from judgefinder.domain.tracing import TraceRecorder, trace_scope, trace_span
+from judgefinder.infrastructure.profiling import StageProfiler
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,11 +36,92 @@ LOGGER = logging.getLogger(__name__)
     show_default=True,
 )
 @click.option("--verbose", is_flag=True, default=False, help="Enable debug logging.")
+@click.option(
+    "--shard",
+    "raw_shard",
+    default=None,
+    metavar="I/N",
+    help="Only handle the I-th of N deterministic slices of enabled_sources.",
+)
+@click.option(
+    "--shard-costs",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+    default=None,
+    help="JSON of per-source costs (from 'shard-costs') used to balance --shard.",
+)
+@click.option(
+    "--record",
+    "record_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Save every HTTP request and response of this run to a cassette file.",
+)
+@click.option(
+    "--replay",
+    "replay_path",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+    default=None,
+    help="Answer HTTP requests from a cassette instead of the network.",
+)
+@click.option(
+    "--replay-latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="With --replay, wait this multiple of each recorded response time (0 = no wait).",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write a Chrome/Perfetto trace-event timeline of HTTP, parse and DB spans here.",
+)
+@click.option(
+    "--profile",
+    "profile_dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=None,
+    help="Profile the run one source at a time; write per-stage pstats and allocations here.",
+)
 @click.pass_context
-def app(ctx: click.Context, config_path: Path, verbose: bool) -> None:
+def app(
+    ctx: click.Context,
+    config_path: Path,
+    verbose: bool,
+    raw_shard: str | None,
+    shard_costs: Path | None,
+    record_path: Path | None,
+    replay_path: Path | None,
+    replay_latency: float,
+    trace_file: Path | None,
+    profile_dir: Path | None,
+) -> None:
     _configure_logging(verbose=verbose)
-    container = create_app(config_path)
+    if record_path is not None and replay_path is not None:
+        raise click.UsageError("Use either --record or --replay, not both.")
+    if trace_file is not None:
+        recorder = TraceRecorder()
+        ctx.with_resource(trace_scope(recorder))
+        ctx.call_on_close(lambda: _write_trace(recorder, trace_file))
+    profiler = StageProfiler(profile_dir) if profile_dir is not None else None
+    if profiler is not None:
+        profiler.checkpoint("start")
+        ctx.with_resource(trace_scope(profiler))
+        ctx.call_on_close(lambda: _write_profile(profiler))
+    with trace_span("create app", category="bootstrap"):
+        container = create_app(
+            config_path,
+            shard=_parse_shard(raw_shard),
+            shard_costs=_load_shard_costs(shard_costs) if shard_costs is not None else None,
+            record_path=record_path,
+            replay_path=replay_path,
+            replay_latency_scale=replay_latency,
+            serial=profiler is not None,
+        )
+    if profiler is not None:
+        profiler.checkpoint("bootstrap")
     ctx.obj = container
+    ctx.call_on_close(container.close)
 
 
 @app.command("collect")
@@ -36,23 +133,195 @@ def app(ctx: click.Context, config_path: Path, verbose: bool) -> None:
     show_default=True,
     help="Collect notices for N days ending at --date.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of sources fetched concurrently (overrides [collection] workers).",
+)
+@click.option(
+    "--runner",
+    type=click.Choice(["threads", "asyncio"]),
+    default=None,
+    help=(
+        "Collection engine (overrides [collection] runner). asyncio runs blocking HTTP calls "
+        "on 4 threads per worker, so --workers also bounds its requests in flight."
+    ),
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print per-source fetch/parse/persist metrics to stderr, most expensive first.",
+)
+@click.option(
+    "--metrics-json",
+    "metrics_json",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write per-source and per-date run metrics to this JSON file.",
+)
 @click.pass_obj
-def collect(container: AppContainer, raw_date: str, days: int) -> None:
+def collect(
+    container: AppContainer,
+    raw_date: str,
+    days: int,
+    workers: int | None,
+    runner: str | None,
+    show_metrics: bool,
+    metrics_json: Path | None,
+) -> None:
     target_dates = _resolve_target_dates(
         raw_date=raw_date,
         timezone_name=container.config.timezone,
         days=days,
     )
+    start_date, end_date = target_dates[0], target_dates[-1]
+    LOGGER.debug("Collecting notices for %s..%s", start_date.isoformat(), end_date.isoformat())
+    use_case = container.collect_use_case
+    if workers is not None:
+        container.size_for_workers(workers)
+    if (runner or container.config.collection.runner) == "asyncio":
+        notices = asyncio.run(
+            use_case.execute_range_async(start_date, end_date, max_workers=workers)
+        )
+    else:
+        notices = use_case.execute_range(start_date, end_date, max_workers=workers)
+    LOGGER.debug("Page cache: %s", container.page_cache.stats())
+    if container.http_cache is not None:
+        http_cache_stats = container.http_cache.stats()
+        LOGGER.debug(
+            "HTTP cache: %s of %s requests answered 304, %s bytes not downloaded",
+            http_cache_stats.revalidated,
+            http_cache_stats.requests,
+            http_cache_stats.bytes_saved,
+        )
+
     seen_urls: set[str] = set()
+    for notice in notices:
+        if notice.url in seen_urls:
+            continue
+        seen_urls.add(notice.url)
+        click.echo(notice.url)
+    if container.hedge_policy is not None:
+        LOGGER.debug("Hedged requests: %s", container.hedge_policy.stats())
+    if use_case.partial_sources:
+        click.echo(
+            f"Partial results (time budget exceeded): {', '.join(use_case.partial_sources)}",
+            err=True,
+        )
+    if metrics_json is not None:
+        metrics_json.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            **use_case.metrics.to_dict(),
+        }
+        metrics_json.write_text(
+            json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+    if show_metrics:
+        for line in _format_metrics_table(use_case.metrics):
+            click.echo(line, err=True)
 
-    for target_date in target_dates:
-        LOGGER.debug("Collecting notices for %s", target_date.isoformat())
-        notices = container.collect_use_case.execute(target_date)
+
+@app.command("serve-collector")
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Collect notices for the last N days on every poll.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of sources fetched concurrently (overrides [collection] workers).",
+)
+@click.option(
+    "--runner",
+    type=click.Choice(["threads", "asyncio"]),
+    default=None,
+    help=(
+        "Collection engine (overrides [collection] runner). asyncio runs blocking HTTP calls "
+        "on 4 threads per worker, so --workers also bounds its requests in flight."
+    ),
+)
+@click.pass_obj
+def serve_collector(
+    container: AppContainer,
+    days: int,
+    workers: int | None,
+    runner: str | None,
+) -> None:
+    """Keep collecting in one process, polling each source on its own interval."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    printed_urls: dict[str, date] = {}
+
+    def collect_due(slugs: Sequence[str]) -> list[Notice]:
+        _begin_poll(container, workers)
+        target_dates = _resolve_target_dates(
+            raw_date="today",
+            timezone_name=container.config.timezone,
+            days=days,
+        )
+        start_date, end_date = target_dates[0], target_dates[-1]
+        LOGGER.debug("Polling %s for %s..%s", ", ".join(slugs), start_date, end_date)
+        use_case = container.collect_use_case
+        if (runner or container.config.collection.runner) == "asyncio":
+            notices = asyncio.run(
+                use_case.execute_range_async(
+                    start_date,
+                    end_date,
+                    max_workers=workers,
+                    source_slugs=slugs,
+                )
+            )
+        else:
+            notices = use_case.execute_range(
+                start_date,
+                end_date,
+                max_workers=workers,
+                source_slugs=slugs,
+            )
+        # Forget URLs that left the window so the set stays bounded while the daemon runs.
+        for url, published_date in list(printed_urls.items()):
+            if published_date < start_date:
+                del printed_urls[url]
         for notice in notices:
-            if notice.url in seen_urls:
-                continue
-            seen_urls.add(notice.url)
-            click.echo(notice.url)
+            if notice.url not in printed_urls:
+                printed_urls[notice.url] = notice.published_date
+                click.echo(notice.url)
+        if use_case.partial_sources:
+            click.echo(
+                f"Partial results (time budget exceeded): {', '.join(use_case.partial_sources)}",
+                err=True,
+            )
+        return notices
+
+    collector = PollingCollector(collect_due, _poll_intervals(container))
+    config_path = container.config_path
+    config_mtime = _config_mtime(config_path)
+
+    def reload_if_changed() -> None:
+        nonlocal config_mtime
+        mtime = _config_mtime(config_path)
+        if mtime == config_mtime:
+            return
+        config_mtime = mtime
+        try:
+            container.reload_config()
+        except (OSError, ValueError) as exc:
+            LOGGER.error("Keeping the previous configuration; reload failed: %s", exc)
+            return
+        collector.reschedule(_poll_intervals(container))
+        LOGGER.info("Reloaded %s", config_path)
+
+    with contextlib.suppress(KeyboardInterrupt):
+        collector.run_forever(stop, on_idle=reload_if_changed)
 
 
 @app.command("list")
@@ -89,6 +358,180 @@ def list_sources(container: AppContainer) -> None:
         click.echo(slug)
 
 
+@app.command("enqueue")
+@click.option("--date", "raw_date", default="today", show_default=True)
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Queue N days ending at --date as one job per source.",
+)
+@click.pass_obj
+def enqueue(container: AppContainer, raw_date: str, days: int) -> None:
+    """Queue one collection job per enabled source for 'work' processes to pick up."""
+    if container.job_queue is None:
+        raise click.ClickException("No job queue is available.")
+    target_dates = _resolve_target_dates(
+        raw_date=raw_date,
+        timezone_name=container.config.timezone,
+        days=days,
+    )
+    queued = container.job_queue.enqueue(
+        container.source_registry.list_enabled_source_slugs(),
+        target_dates[0],
+        target_dates[-1],
+    )
+    click.echo(f"Queued {queued} jobs")
+
+
+@app.command("work")
+@click.option(
+    "--drain",
+    is_flag=True,
+    default=False,
+    help="Exit once no job can be leased instead of waiting for new ones.",
+)
+@click.option(
+    "--idle-seconds",
+    type=click.FloatRange(min=0.1),
+    default=5.0,
+    show_default=True,
+    help="Wait between queue checks while the queue is empty.",
+)
+@click.pass_obj
+def work(container: AppContainer, drain: bool, idle_seconds: float) -> None:
+    """Lease jobs from the shared queue and collect them until stopped."""
+    if container.job_queue is None:
+        raise click.ClickException("No job queue is available.")
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    worker = CollectionWorker(
+        container.job_queue,
+        lambda: container.collect_use_case,
+        owner=f"{socket.gethostname()}:{os.getpid()}",
+        lease_seconds=container.config.collection.job_lease_seconds,
+        source_slugs=(
+            container.source_registry.list_enabled_source_slugs()
+            if container.shard is not None
+            else None
+        ),
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        processed = worker.run(stop, idle_seconds=idle_seconds, drain=drain)
+        LOGGER.info("Processed %s jobs", processed)
+
+
+@app.command("jobs")
+@click.pass_obj
+def jobs(container: AppContainer) -> None:
+    """Print the number of queued jobs per status."""
+    if container.job_queue is None:
+        raise click.ClickException("No job queue is available.")
+    for status, count in container.job_queue.counts().items():
+        click.echo(f"{status.value} {count}")
+
+
+@app.command("shard-costs")
+@click.pass_obj
+def shard_costs_command(container: AppContainer) -> None:
+    """Print the average cost per source and date as JSON for --shard-costs."""
+    if container.run_log is None:
+        raise click.ClickException("No run history is available.")
+    click.echo(json.dumps(container.run_log.average_costs(), indent=2, sort_keys=True))
+
+
+@app.command("verify-shards")
+@click.option("--date", "raw_date", default="today", show_default=True)
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Verify N days ending at --date.",
+)
+@click.option(
+    "--merge",
+    "merge_paths",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+    multiple=True,
+    help="Database of another shard to merge into this one first (repeatable).",
+)
+@click.pass_obj
+def verify_shards(
+    container: AppContainer,
+    raw_date: str,
+    days: int,
+    merge_paths: tuple[Path, ...],
+) -> None:
+    """Check that every enabled source was collected by exactly one shard per date."""
+    if container.run_log is None:
+        raise click.ClickException("No run history is available.")
+    for merge_path in merge_paths:
+        container.merge_database(merge_path)
+    target_dates = _resolve_target_dates(
+        raw_date=raw_date,
+        timezone_name=container.config.timezone,
+        days=days,
+    )
+    issues = VerifyShardCoverageUseCase(container.run_log).execute(
+        container.config.enabled_sources,
+        target_dates[0],
+        target_dates[-1],
+    )
+    for issue in issues:
+        if issue.missing:
+            click.echo(f"missing {issue.source_slug} {issue.target_date.isoformat()}")
+        else:
+            click.echo(
+                f"duplicate {issue.source_slug} {issue.target_date.isoformat()} "
+                f"({', '.join(shard or 'unsharded' for shard in issue.shards)})"
+            )
+    if issues:
+        click.get_current_context().exit(1)
+
+
+def _parse_shard(raw_shard: str | None) -> ShardSpec | None:
+    if raw_shard is None:
+        return None
+    try:
+        return ShardSpec.parse(raw_shard)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--shard") from exc
+
+
+def _load_shard_costs(path: Path) -> dict[str, float]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise click.BadParameter(str(exc), param_hint="--shard-costs") from exc
+    if not isinstance(raw, dict) or not all(
+        isinstance(cost, (int, float)) for cost in raw.values()
+    ):
+        raise click.BadParameter("Expected a JSON object of numbers.", param_hint="--shard-costs")
+    return {str(slug): float(cost) for slug, cost in raw.items()}
+
+
+def _begin_poll(container: AppContainer, workers: int | None = None) -> None:
+    if container.retry_budget is not None:
+        container.retry_budget.refill()
+    if workers is not None:
+        # A config reload sizes the pools for the configured workers; --workers wins.
+        container.size_for_workers(workers)
+    # List pages cached by the previous poll would hide notices posted since then, so
+    # the page cache only shares pages within a single poll.
+    container.page_cache.clear()
+
+
+def _poll_intervals(container: AppContainer) -> dict[str, float]:
+    owned = set(container.source_registry.list_enabled_source_slugs())
+    return {
+        slug: interval
+        for slug, interval in container.config.poll_intervals().items()
+        if slug in owned
+    }
+
+
 def _resolve_date(raw_date: str, timezone_name: str) -> date:
     if raw_date == "today":
         return datetime.now(tz=ZoneInfo(timezone_name)).date()
@@ -104,10 +547,51 @@ def _resolve_target_dates(raw_date: str, timezone_name: str, days: int) -> list[
     return [start_date + timedelta(days=offset) for offset in range(days)]
 
 
+def _config_mtime(config_path: Path | None) -> int | None:
+    if config_path is None:
+        return None
+    try:
+        return config_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def _configure_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
 
 
+def _write_trace(recorder: TraceRecorder, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(recorder.to_chrome_trace(), ensure_ascii=False), encoding="utf-8")
+    LOGGER.info("Wrote %s trace spans to %s", len(recorder.spans), path)
+
+
+def _write_profile(profiler: StageProfiler) -> None:
+    profiler.checkpoint("command")
+    try:
+        written = profiler.write()
+    finally:
+        profiler.close()
+    click.echo(profiler.format_totals(), err=True)
+    LOGGER.info("Wrote profile to %s", ", ".join(str(path) for path in written))
+
+
+def _format_metrics_table(metrics: RunMetrics) -> list[str]:
+    lines = [
+        f"{'source':<28} {'cost s':>8} {'fetch s':>8} {'parse s':>8} {'persist s':>9} "
+        f"{'pages':>5} {'KiB':>8} {'cache':>5} {'retry':>5} {'seen':>6} {'kept':>5}"
+    ]
+    for source in metrics.by_cost():
+        lines.append(
+            f"{source.source_slug:<28} {source.cost_seconds:>8.3f} "
+            f"{source.fetch_seconds:>8.3f} {source.parse_seconds:>8.3f} "
+            f"{source.persist_seconds:>9.3f} {source.pages_fetched:>5} "
+            f"{source.bytes_downloaded / 1024:>8.1f} {source.cache_hits:>5} "
+            f"{source.retries:>5} {source.candidates_seen:>6} {source.candidates_kept:>5}"
+        )
+    return lines
+
+
 if __name__ == "__main__":
     app()
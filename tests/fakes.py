@@ -0,0 +1,115 @@
+"""Fakes shared by the collection tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.source_profiles import EngineType
+from judgefinder.infrastructure.http.client import HttpResponse
+
+# (published, nttNo) or (published, nttNo, title) per row of an eGov board list page.
+BoardRow = tuple[str, ...]
+DEFAULT_TITLE = "평가위원 모집"
+
+
+@dataclass(slots=True)
+class StubRepository:
+    saved_notices: list[Notice] = field(default_factory=list)
+
+    def save_many(self, notices: list[Notice]) -> None:
+        self.saved_notices = list(notices)
+
+    def list_by_date(self, target_date: date) -> list[Notice]:
+        return [notice for notice in self.saved_notices if notice.published_date == target_date]
+
+
+def board_list_html(rows: Sequence[BoardRow]) -> str:
+    cells = "".join(_board_row_html(*row) for row in rows)
+    return f"<html><table>{cells}</table></html>"
+
+
+def _board_row_html(published: str, ntt_no: str, title: str = DEFAULT_TITLE) -> str:
+    return f"""
+        <tr>
+          <td>{published}</td>
+          <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo={ntt_no}">{title}</a></td>
+        </tr>
+        """
+
+
+class PagedHttpClient:
+    """Serves ``pages`` keyed by the page number in the ``page_param`` query parameter.
+
+    Pages are rendered as eGov board lists unless another ``render`` is given.
+    """
+
+    def __init__(
+        self,
+        pages: Mapping[int, Sequence[BoardRow]],
+        *,
+        render: Callable[[Sequence[BoardRow]], str] = board_list_html,
+        page_param: str = "pageIndex",
+    ) -> None:
+        self.pages = pages
+        self.render = render
+        self.page_param = page_param
+        self.calls: list[str] = []
+        self.payloads: list[str] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        self.calls.append(url)
+        payload = self.render(self.pages.get(page_index_of(url, self.page_param), []))
+        self.payloads.append(payload)
+        return payload
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        return HttpResponse(status_code=200, text="", headers={}, url=url)
+
+
+def page_index_of(url: str, page_param: str = "pageIndex") -> int:
+    return int(url.split(f"{page_param}=")[1].split("&")[0])
+
+
+def board_source(
+    http_client: Any,
+    *,
+    slug: str = "city",
+    municipality: str = "City",
+    **options: Any,
+) -> GenericEngineSource:
+    """An eGov board source on ``https://<slug>.go.kr`` reading five pages at most."""
+    settings: dict[str, Any] = {"keywords": ("평가위원",), "max_pages": 5, **options}
+    return GenericEngineSource(
+        slug=slug,
+        municipality=municipality,
+        source_type=SourceType.HTML,
+        list_url=f"https://{slug}.go.kr/www/selectBbsNttList.do?bbsNo=18",
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+        timezone=ZoneInfo("Asia/Seoul"),
+        http_client=http_client,
+        **settings,
+    )
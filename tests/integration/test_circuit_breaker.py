@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.entities import Notice
+from judgefinder.infrastructure.db import (
+    SqlAlchemyCircuitBreaker,
+    create_schema,
+    create_session_factory,
+    create_sqlite_engine,
+)
+from tests.fakes import StubRepository
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class ToggleSource:
+    slug: str
+    failing: bool = True
+    calls: int = 0
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        _ = target_date
+        self.calls += 1
+        if self.failing:
+            raise RuntimeError("municipality is down")
+        return []
+
+
+def _session_factory(tmp_path: Path) -> sessionmaker[Session]:
+    engine = create_sqlite_engine(tmp_path / "judgefinder.db")
+    create_schema(engine)
+    return create_session_factory(engine)
+
+
+def _breaker(
+    tmp_path: Path,
+    clock: FakeClock,
+    *,
+    failure_threshold: int,
+) -> SqlAlchemyCircuitBreaker:
+    return SqlAlchemyCircuitBreaker(
+        _session_factory(tmp_path),
+        failure_threshold=failure_threshold,
+        cooldown_seconds=60,
+        clock=clock,
+    )
+
+
+def test_circuit_opens_after_threshold_and_persists(tmp_path: Path) -> None:
+    clock = FakeClock()
+    breaker = _breaker(tmp_path, clock, failure_threshold=2)
+
+    breaker.record_failure("city")
+    assert breaker.allow("city")
+    breaker.record_failure("city")
+
+    next_run = _breaker(tmp_path, clock, failure_threshold=2)
+    assert next_run.state_of("city") == "open"
+    assert not next_run.allow("city")
+
+
+def test_processes_sharing_the_database_share_counts_and_the_probe(tmp_path: Path) -> None:
+    clock = FakeClock()
+    first = _breaker(tmp_path, clock, failure_threshold=2)
+    second = _breaker(tmp_path, clock, failure_threshold=2)
+
+    first.record_failure("city")
+    second.record_failure("city")
+    assert first.state_of("city") == "open"
+
+    clock.now += 60
+    assert first.allow("city")
+    assert not second.allow("city")
+    second.record_success("city")
+    assert first.state_of("city") == "closed"
+
+
+def test_half_open_probe_closes_or_reopens_circuit(tmp_path: Path) -> None:
+    clock = FakeClock()
+    breaker = _breaker(tmp_path, clock, failure_threshold=1)
+    breaker.record_failure("city")
+
+    clock.now += 60
+    assert breaker.allow("city")
+    assert breaker.state_of("city") == "half_open"
+    assert not breaker.allow("city")
+    breaker.record_failure("city")
+    assert breaker.state_of("city") == "open"
+
+    clock.now += 60
+    assert breaker.allow("city")
+    breaker.record_success("city")
+    assert breaker.state_of("city") == "closed"
+
+
+def test_collect_use_case_skips_sources_with_open_circuit(tmp_path: Path) -> None:
+    clock = FakeClock()
+    breaker = _breaker(tmp_path, clock, failure_threshold=2)
+    source = ToggleSource(slug="city")
+    use_case = CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=[source],
+        circuit_breaker=breaker,
+    )
+
+    for _ in range(4):
+        use_case.execute(date(2026, 2, 2))
+    assert source.calls == 2
+
+    source.failing = False
+    clock.now += 60
+    use_case.execute(date(2026, 2, 2))
+    assert source.calls == 3
+    assert breaker.state_of("city") == "closed"
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime, timezone
 from pathlib import Path
 
-from judgefinder.bootstrap import create_app
+from judgefinder.application.use_cases import VerifyShardCoverageUseCase
+from judgefinder.bootstrap import THREADS_PER_WORKER, create_app
+from judgefinder.domain.crawl_cursor import CrawlCursor
+from judgefinder.domain.entities import SourceRun, SourceRunStatus
+from judgefinder.domain.sharding import ShardSpec
+from judgefinder.infrastructure.db import (
+    SqlAlchemyCrawlCursorRepository,
+    SqlAlchemySourceRunRepository,
+    create_schema,
+    create_session_factory,
+    create_sqlite_engine,
+)
+from judgefinder.interfaces.cli.main import _begin_poll
 
 
 def test_collect_use_case_saves_into_sqlite_and_deduplicates(tmp_path: Path) -> None:
@@ -42,3 +54,174 @@ def test_collect_use_case_saves_into_sqlite_and_deduplicates(tmp_path: Path) ->
         "https://example.com/sample-city/notices/20260216-a",
         "https://example.com/sample-city/notices/20260216-b",
     ]
+
+
+def test_reload_config_rebuilds_sources_and_keeps_warm_clients(tmp_path: Path) -> None:
+    db_path = tmp_path / "judgefinder.db"
+    fixture_path = Path(__file__).resolve().parents[1] / "fixtures" / "sample_city_list.html"
+    config_path = tmp_path / "config.toml"
+    lines = [
+        'timezone = "Asia/Seoul"',
+        f'db_path = "{db_path.as_posix()}"',
+        'enabled_sources = ["sample_city"]',
+        "",
+        "[sources.sample_city]",
+        'municipality = "샘플시"',
+        'source_type = "html"',
+        'list_url = "https://example.com/sample_city/notices"',
+        f'fixture_path = "{fixture_path.as_posix()}"',
+        "",
+    ]
+    config_path.write_text("\n".join(lines), encoding="utf-8")
+    container = create_app(config_path=config_path)
+    page_cache = container.page_cache
+    base_http_client = container.base_http_client
+    assert container.config.poll_intervals() == {"sample_city": 900.0}
+
+    config_path.write_text(
+        "\n".join([*lines, "[sources.sample_city.request_strategy]", "poll_interval_seconds = 60"]),
+        encoding="utf-8",
+    )
+    container.reload_config()
+
+    assert container.config.poll_intervals() == {"sample_city": 60.0}
+    assert container.async_transport is not None
+    assert container.async_transport.max_threads == THREADS_PER_WORKER
+    container.size_for_workers(8)
+    assert container.async_transport.max_threads == 8 * THREADS_PER_WORKER
+    assert container.page_cache is page_cache
+    assert container.base_http_client is base_http_client
+    target_date = date(2026, 2, 16)
+    collected = container.collect_use_case.execute_range(
+        target_date,
+        target_date,
+        source_slugs=["sample_city"],
+    )
+    assert len(collected) == 2
+    container.close()
+
+
+def test_each_poll_starts_with_an_empty_page_cache(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        "\n".join(
+            [
+                'timezone = "Asia/Seoul"',
+                f'db_path = "{(tmp_path / "judgefinder.db").as_posix()}"',
+                'enabled_sources = ["sample_city"]',
+                "",
+                "[collection]",
+                "poll_interval_seconds = 60",
+                "",
+                "[sources.sample_city]",
+                'municipality = "샘플시"',
+                'source_type = "html"',
+                'list_url = "https://example.com/sample_city/notices"',
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    container = create_app(config_path=config_path)
+    page_url = "https://example.com/sample_city/notices?pageIndex=1"
+    # A page from the previous poll, still inside the default five-minute TTL.
+    container.page_cache.put(page_url, "<html></html>", ttl_seconds=300.0)
+
+    _begin_poll(container)
+
+    assert container.page_cache.get(page_url) is None
+    container.close()
+
+
+def test_crawl_cursor_repository_upserts_by_source(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(tmp_path / "judgefinder.db")
+    create_schema(engine)
+    repository = SqlAlchemyCrawlCursorRepository(create_session_factory(engine))
+    first = CrawlCursor("city", "https://city/1", date(2026, 3, 1), covered_since=date(2026, 2, 1))
+    second = CrawlCursor("city", "https://city/2", date(2026, 3, 2), covered_since=date(2026, 2, 1))
+
+    assert repository.load("city") is None
+    repository.save(first)
+    repository.save(second)
+
+    assert repository.load("city") == second
+
+
+def test_source_runs_past_retention_are_pruned_on_save(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(tmp_path / "judgefinder.db")
+    create_schema(engine)
+    now = datetime(2026, 3, 31, 12, 0, tzinfo=timezone.utc)
+    run_log = SqlAlchemySourceRunRepository(
+        create_session_factory(engine),
+        retention_days=30,
+        clock=now.timestamp,
+    )
+
+    def run(target_date: date, finished_at: datetime) -> SourceRun:
+        return SourceRun(
+            source_slug="city",
+            target_date=target_date,
+            shard="",
+            status=SourceRunStatus.OK,
+            duration_seconds=1.0,
+            notice_count=1,
+            finished_at=finished_at,
+        )
+
+    run_log.save_runs(
+        [
+            run(date(2026, 2, 1), datetime(2026, 2, 1, 9, 0, tzinfo=timezone.utc)),
+            run(date(2026, 3, 30), datetime(2026, 3, 30, 9, 0, tzinfo=timezone.utc)),
+        ]
+    )
+
+    assert [stored.target_date for stored in run_log.list_runs(date(2026, 1, 1), now.date())] == [
+        date(2026, 3, 30)
+    ]
+
+
+def test_shards_merge_into_exactly_once_coverage(tmp_path: Path) -> None:
+    fixture_path = Path(__file__).resolve().parents[1] / "fixtures" / "sample_city_list.html"
+    containers = []
+    for index in (1, 2):
+        node_dir = tmp_path / f"node{index}"
+        node_dir.mkdir()
+        config_path = node_dir / "config.toml"
+        config_path.write_text(
+            "\n".join(
+                [
+                    'timezone = "Asia/Seoul"',
+                    f'db_path = "{(node_dir / "judgefinder.db").as_posix()}"',
+                    'enabled_sources = ["sample_city"]',
+                    "",
+                    "[sources.sample_city]",
+                    'municipality = "샘플시"',
+                    'source_type = "html"',
+                    'list_url = "https://example.com/sample_city/notices"',
+                    f'fixture_path = "{fixture_path.as_posix()}"',
+                    "",
+                ]
+            ),
+            encoding="utf-8",
+        )
+        containers.append(create_app(config_path, shard=ShardSpec(index, 2)))
+    target_date = date(2026, 2, 16)
+    for container in containers:
+        container.collect_use_case.execute(target_date)
+
+    owners = [
+        container.shard.label
+        for container in containers
+        if container.shard is not None and container.source_registry.list_enabled_source_slugs()
+    ]
+    first = containers[0]
+    assert first.run_log is not None
+    verify = VerifyShardCoverageUseCase(first.run_log)
+    first.merge_database(tmp_path / "node2" / "judgefinder.db")
+    first.merge_database(tmp_path / "node2" / "judgefinder.db")
+
+    assert len(owners) == 1
+    assert verify.execute(["sample_city"], target_date, target_date) == []
+    assert len(first.list_use_case.execute(target_date)) == 2
+    for container in containers:
+        container.close()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.application.job_worker import CollectionWorker
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.entities import JobStatus, Notice, SourceType
+from judgefinder.domain.ports import NoticeSource
+from judgefinder.infrastructure.db import (
+    SqlAlchemyCollectionJobQueue,
+    SqlAlchemyNoticeRepository,
+    create_schema,
+    create_session_factory,
+    create_sqlite_engine,
+)
+
+START = date(2026, 3, 1)
+END = date(2026, 3, 2)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class StaticSource:
+    slug: str
+    fail: bool = False
+    calls: list[tuple[date, date]] = field(default_factory=list)
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
+        self.calls.append((start_date, end_date))
+        if self.fail:
+            raise RuntimeError("boom")
+        return [
+            Notice(
+                id=None,
+                municipality=self.slug,
+                title="평가위원 모집 공고",
+                url=f"https://{self.slug}/notice",
+                published_date=end_date,
+                fetched_at=datetime(2026, 3, 2, 9, 0, tzinfo=ZoneInfo("Asia/Seoul")),
+                source_type=SourceType.HTML,
+            )
+        ]
+
+
+def _session_factory(tmp_path: Path) -> sessionmaker[Session]:
+    engine = create_sqlite_engine(tmp_path / "judgefinder.db")
+    create_schema(engine)
+    return create_session_factory(engine)
+
+
+def test_a_job_is_leased_by_one_worker_until_its_lease_expires(tmp_path: Path) -> None:
+    clock = FakeClock()
+    queue = SqlAlchemyCollectionJobQueue(_session_factory(tmp_path), clock=clock)
+    assert queue.enqueue(["alpha"], START, END) == 1
+
+    first = queue.lease("worker-1", 60.0)
+    assert first is not None
+    assert queue.lease("worker-2", 60.0) is None
+
+    clock.now += 61.0
+    second = queue.lease("worker-2", 60.0)
+
+    assert second is not None
+    assert second.id == first.id
+    assert second.attempts == 2
+    # The crashed worker's late completion must not overwrite the new lease holder.
+    assert not queue.complete(first)
+    assert queue.complete(second)
+    assert queue.counts()[JobStatus.DONE] == 1
+
+
+def test_failed_jobs_retry_with_backoff_then_fail(tmp_path: Path) -> None:
+    clock = FakeClock()
+    queue = SqlAlchemyCollectionJobQueue(
+        _session_factory(tmp_path),
+        max_attempts=2,
+        retry_delay_seconds=30.0,
+        clock=clock,
+    )
+    queue.enqueue(["alpha"], START, END)
+
+    job = queue.lease("worker", 60.0)
+    assert job is not None
+    assert queue.fail(job, "timeout")
+    assert queue.lease("worker", 60.0) is None
+
+    clock.now += 30.0
+    retry = queue.lease("worker", 60.0)
+    assert retry is not None
+    assert queue.fail(retry, "timeout")
+
+    assert queue.counts()[JobStatus.FAILED] == 1
+    assert queue.enqueue(["alpha"], START, END) == 1
+    assert queue.counts()[JobStatus.PENDING] == 1
+
+
+def test_concurrent_workers_never_share_a_job(tmp_path: Path) -> None:
+    queue = SqlAlchemyCollectionJobQueue(_session_factory(tmp_path))
+    slugs = [f"city{index}" for index in range(20)]
+    queue.enqueue(slugs, START, END)
+    leased: list[str] = []
+    lock = threading.Lock()
+
+    def drain(owner: str) -> None:
+        while (job := queue.lease(owner, 60.0)) is not None:
+            with lock:
+                leased.append(job.source_slug)
+
+    threads = [threading.Thread(target=drain, args=(f"worker-{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(leased) == sorted(slugs)
+
+
+def test_worker_completes_good_jobs_and_requeues_failures(tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+    clock = FakeClock()
+    queue = SqlAlchemyCollectionJobQueue(session_factory, retry_delay_seconds=30.0, clock=clock)
+    good, bad = StaticSource("good"), StaticSource("bad", fail=True)
+    sources: list[NoticeSource] = [good, bad]
+    use_case = CollectNoticesUseCase(
+        repository=SqlAlchemyNoticeRepository(session_factory),
+        sources=sources,
+    )
+    queue.enqueue(["good", "bad"], START, END)
+    worker = CollectionWorker(queue, lambda: use_case, owner="worker", lease_seconds=60.0)
+
+    processed = worker.run(threading.Event(), drain=True)
+
+    assert processed == 2
+    assert good.calls == [(START, END)]
+    assert bad.calls == [(START, END)]
+    assert queue.counts() == {
+        JobStatus.PENDING: 1,
+        JobStatus.LEASED: 0,
+        JobStatus.DONE: 1,
+        JobStatus.FAILED: 0,
+    }
+    saved = SqlAlchemyNoticeRepository(session_factory).list_by_date(END)
+    assert [notice.url for notice in saved] == ["https://good/notice"]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from judgefinder.infrastructure.db import (
+    SqlAlchemyDailyQuotaStore,
+    create_schema,
+    create_session_factory,
+    create_sqlite_engine,
+)
+from judgefinder.infrastructure.http.rate_limit import (
+    DailyQuotaExceededError,
+    HostRateLimit,
+    HostRateLimiter,
+)
+
+TODAY = date(2026, 3, 1)
+
+
+def _session_factory(tmp_path: Path) -> sessionmaker[Session]:
+    engine = create_sqlite_engine(tmp_path / "judgefinder.db")
+    create_schema(engine)
+    return create_session_factory(engine)
+
+
+def test_daily_quota_is_enforced_and_persisted(tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+    limiter = HostRateLimiter(
+        quota_store=SqlAlchemyDailyQuotaStore(session_factory, today=lambda: TODAY)
+    )
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=float("inf"), daily_quota=2))
+
+    limiter.acquire("city.go.kr")
+    limiter.acquire("city.go.kr")
+    with pytest.raises(DailyQuotaExceededError):
+        limiter.acquire("city.go.kr")
+
+    reloaded = SqlAlchemyDailyQuotaStore(session_factory, today=lambda: TODAY)
+    assert reloaded.used("city.go.kr") == 2
+    next_day = SqlAlchemyDailyQuotaStore(session_factory, today=lambda: date(2026, 3, 2))
+    assert next_day.used("city.go.kr") == 0
+    next_day.consume("city.go.kr", 2)
+    assert next_day.used("city.go.kr") == 1
+
+
+def test_processes_sharing_the_database_share_one_count(tmp_path: Path) -> None:
+    first = SqlAlchemyDailyQuotaStore(_session_factory(tmp_path), today=lambda: TODAY)
+    second = SqlAlchemyDailyQuotaStore(_session_factory(tmp_path), today=lambda: TODAY)
+
+    for _ in range(3):
+        first.consume("city.go.kr", 6)
+        second.consume("city.go.kr", 6)
+
+    assert first.used("city.go.kr") == 6
+    with pytest.raises(DailyQuotaExceededError):
+        second.consume("city.go.kr", 6)
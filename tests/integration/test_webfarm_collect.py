@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+
+from benchmarks import pages
+from benchmarks.webfarm import (
+    DEDICATED_BOARDS,
+    GENERIC_KINDS,
+    FarmSettings,
+    LatencyModel,
+    running_farm,
+)
+from judgefinder.bootstrap import create_app
+
+NEWEST = pages.NEWEST_DATE
+
+
+def test_collect_reads_every_engine_of_the_web_farm(tmp_path: Path) -> None:
+    settings = FarmSettings(
+        municipalities=len(DEDICATED_BOARDS) + len(GENERIC_KINDS),
+        hosts=3,
+        list_pages=4,
+        rows_per_page=10,
+        newest=NEWEST,
+    )
+
+    with running_farm(settings) as farm:
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(
+            farm.render_config(
+                db_path=tmp_path / "farm.db",
+                collection={"workers": 4, "http_cache": True, "incremental": True},
+            ),
+            encoding="utf-8",
+        )
+        container = create_app(config_path)
+        try:
+            notices = container.collect_use_case.execute_range(
+                NEWEST - timedelta(days=2),
+                NEWEST,
+            )
+            assert not container.collect_use_case.partial_sources
+        finally:
+            container.close()
+        first_requests = farm.stats.requests
+
+        warm = create_app(config_path)
+        try:
+            warm.collect_use_case.execute_range(NEWEST - timedelta(days=2), NEWEST)
+        finally:
+            warm.close()
+
+    # Three days are 15 rows per board, and every other row is a recruitment notice.
+    per_board = pages.matching_rows(3 * pages.ROWS_PER_DAY)
+    counts: dict[str, int] = {}
+    for notice in notices:
+        counts[notice.municipality] = counts.get(notice.municipality, 0) + 1
+    assert len(counts) == settings.municipalities
+    assert set(counts.values()) == {per_board}
+    # The warm run revalidates page 1 and stops at the stored crawl cursors.
+    assert farm.stats.statuses[304] > 0
+    assert farm.stats.requests - first_requests < first_requests
+
+
+def test_latency_models_parse_and_sample() -> None:
+    import random
+
+    rng = random.Random(1)
+
+    assert LatencyModel.parse("fixed:20").sample(rng) == 0.02
+    assert 0.01 <= LatencyModel.parse("uniform:10,30").sample(rng) <= 0.03
+    assert LatencyModel.parse("lognormal:80,0.5").sample(rng) > 0
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Mapping
+
+import pytest
+import requests
+
+from judgefinder.domain.deadline import Deadline, DeadlineExceededError, deadline_scope
+from judgefinder.infrastructure.http.adaptive import (
+    AdaptiveConcurrencyHttpClient,
+    AimdController,
+    AimdSettings,
+)
+from judgefinder.infrastructure.http.client import HttpResponse
+
+HOST = "city.go.kr"
+URL = f"https://{HOST}/list.do"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedHttpClient:
+    def __init__(self, outcomes: list[int | Exception]) -> None:
+        self.outcomes = outcomes
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return "ok"
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return HttpResponse(status_code=outcome, text="", headers={}, url=url)
+
+
+def test_healthy_responses_raise_limit_additively() -> None:
+    controller = AimdController(AimdSettings(initial_limit=2.0, max_limit=4.0))
+
+    for _ in range(2):
+        controller.acquire(HOST)
+        controller.release(HOST, latency_seconds=0.1, backpressure=False)
+
+    assert controller.limit_for(HOST) == pytest.approx(2.0 + 1 / 2.0 + 1 / 2.5)
+
+    for _ in range(50):
+        controller.acquire(HOST)
+        controller.release(HOST, latency_seconds=0.1, backpressure=False)
+
+    assert controller.limit_for(HOST) == 4.0
+
+
+def test_backpressure_cuts_limit_once_per_cooldown() -> None:
+    clock = FakeClock()
+    controller = AimdController(
+        AimdSettings(initial_limit=8.0, decrease_cooldown_seconds=1.0),
+        clock=clock,
+    )
+
+    controller.acquire(HOST)
+    controller.release(HOST, latency_seconds=None, backpressure=True)
+    controller.acquire(HOST)
+    controller.release(HOST, latency_seconds=None, backpressure=True)
+    assert controller.limit_for(HOST) == 4.0
+
+    clock.now = 2.0
+    controller.acquire(HOST)
+    controller.release(HOST, latency_seconds=None, backpressure=True)
+    assert controller.limit_for(HOST) == 2.0
+
+
+def test_slow_responses_hold_the_limit() -> None:
+    controller = AimdController(AimdSettings(initial_limit=2.0, latency_smoothing=1.0))
+
+    controller.acquire(HOST)
+    controller.release(HOST, latency_seconds=0.1, backpressure=False)
+    limit_after_fast = controller.limit_for(HOST)
+    controller.acquire(HOST)
+    controller.release(HOST, latency_seconds=5.0, backpressure=False)
+
+    assert controller.limit_for(HOST) == limit_after_fast
+
+
+def test_slots_are_bounded_by_current_limit() -> None:
+    controller = AimdController(AimdSettings(initial_limit=2.0))
+
+    assert controller.try_acquire(HOST) is True
+    assert controller.try_acquire(HOST) is True
+    assert controller.try_acquire(HOST) is False
+    assert controller.try_acquire("other.go.kr") is True
+
+
+def test_seeded_hosts_start_from_seed_limit() -> None:
+    controller = AimdController(AimdSettings(initial_limit=4.0))
+    controller.seed(HOST, initial_limit=1.0)
+
+    assert controller.limit_for(HOST) == 1.0
+    assert controller.limit_for("other.go.kr") == 4.0
+
+
+def test_http_client_reports_429_and_connection_resets_as_backpressure() -> None:
+    controller = AimdController(
+        AimdSettings(initial_limit=8.0, decrease_cooldown_seconds=0.0),
+    )
+    client = AdaptiveConcurrencyHttpClient(
+        ScriptedHttpClient([429, requests.ConnectionError("connection reset by peer"), 200]),
+        controller,
+    )
+
+    assert client.get_response(URL).status_code == 429
+    with pytest.raises(requests.ConnectionError):
+        client.get_text(URL)
+    assert controller.limit_for(HOST) == 2.0
+
+    client.get_response(URL)
+    assert controller.limit_for(HOST) == pytest.approx(2.5)
+    assert controller.try_acquire(HOST) is True
+
+
+def test_running_out_of_time_budget_is_not_backpressure() -> None:
+    controller = AimdController(
+        AimdSettings(initial_limit=8.0, decrease_cooldown_seconds=0.0),
+    )
+    client = AdaptiveConcurrencyHttpClient(
+        ScriptedHttpClient([DeadlineExceededError("Time budget exhausted.")]),
+        controller,
+    )
+
+    with pytest.raises(DeadlineExceededError):
+        client.get_text(URL)
+
+    assert controller.limit_for(HOST) == 8.0
+
+
+def test_timeout_cut_short_by_the_deadline_is_not_backpressure() -> None:
+    controller = AimdController(
+        AimdSettings(initial_limit=8.0, decrease_cooldown_seconds=0.0),
+    )
+    client = AdaptiveConcurrencyHttpClient(
+        ScriptedHttpClient([requests.ReadTimeout("read timed out")] * 2),
+        controller,
+    )
+
+    with deadline_scope(Deadline.after(5.0)), pytest.raises(requests.ReadTimeout):
+        client.get_text(URL, timeout_seconds=10.0)
+    assert controller.limit_for(HOST) == 8.0
+
+    # Without the deadline the full timeout elapsed, which does mean the host is slow.
+    with pytest.raises(requests.ReadTimeout):
+        client.get_text(URL, timeout_seconds=10.0)
+    assert controller.limit_for(HOST) == 4.0
+
+
+def test_acquire_gives_up_when_the_deadline_passes() -> None:
+    controller = AimdController(AimdSettings(initial_limit=1.0))
+    controller.acquire(HOST)
+
+    with deadline_scope(Deadline.after(0.05)), pytest.raises(DeadlineExceededError):
+        controller.acquire(HOST)
+
+    async def acquire_async() -> None:
+        with deadline_scope(Deadline.after(0.05)):
+            await controller.acquire_async(HOST)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(acquire_async())
+
+
+def test_acquire_async_wakes_when_another_thread_releases() -> None:
+    controller = AimdController(AimdSettings(initial_limit=1.0, max_limit=1.0))
+    controller.acquire(HOST)
+
+    async def acquire_after_release() -> None:
+        waiting = asyncio.create_task(controller.acquire_async(HOST))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        releaser = threading.Thread(
+            target=controller.release,
+            args=(HOST,),
+            kwargs={"latency_seconds": 0.1, "backpressure": False},
+        )
+        releaser.start()
+        await asyncio.wait_for(waiting, timeout=1.0)
+        releaser.join()
+
+    asyncio.run(acquire_after_release())
+    assert controller.try_acquire(HOST) is False
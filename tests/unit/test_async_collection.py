@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.deadline import Deadline, current_deadline, deadline_scope
+from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.ports import NoticeSource
+from judgefinder.infrastructure.http.client import HttpResponse, ThreadedAsyncHttpClient
+from tests.fakes import StubRepository, board_source
+
+TARGET_DATE = date(2026, 2, 22)
+PAGES: dict[str, str] = {
+    "1": """
+    <table>
+      <tr>
+        <td>2026-02-22</td>
+        <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo=7001">평가위원 모집</a></td>
+      </tr>
+    </table>
+    """,
+    "2": """
+    <table>
+      <tr>
+        <td>2026-02-22</td>
+        <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo=7002">평가위원 추가 모집</a></td>
+      </tr>
+      <tr>
+        <td>2026-02-20</td>
+        <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo=6990">평가위원 지난 공고</a></td>
+      </tr>
+    </table>
+    """,
+}
+
+
+class FakeAsyncHttpClient:
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        self.calls.append(url)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+        finally:
+            self.in_flight -= 1
+        page = url.split("pageIndex=", 1)[1].split("&", 1)[0]
+        return PAGES.get(page, "<html><body>empty</body></html>")
+
+    async def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        text = await self.get_text(url, timeout_seconds, headers, use_session)
+        return HttpResponse(status_code=200, text=text, headers={}, url=url)
+
+
+class UnusedHttpClient:
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        raise AssertionError("sync client must not be used by fetch_async")
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        raise AssertionError("sync client must not be used by fetch_async")
+
+
+class BarrierHttpClient:
+    """Answers only once ``barrier.parties`` requests are blocked inside it at once."""
+
+    def __init__(self, barrier: threading.Barrier) -> None:
+        self.barrier = barrier
+        self.deadlines: list[Deadline | None] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = url
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        self.deadlines.append(current_deadline())
+        self.barrier.wait()
+        return "ok"
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        text = self.get_text(url, timeout_seconds, headers, use_session)
+        return HttpResponse(status_code=200, text=text, headers={}, url=url)
+
+
+@dataclass(slots=True)
+class BlockingSource:
+    slug: str
+    notice_url: str
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        return [
+            Notice(
+                id=None,
+                municipality="Blocking",
+                title="평가위원 모집",
+                url=self.notice_url,
+                published_date=target_date,
+                fetched_at=datetime(2026, 2, 22, tzinfo=ZoneInfo("Asia/Seoul")),
+                source_type=SourceType.HTML,
+            )
+        ]
+
+
+def _build_source(slug: str, async_client: FakeAsyncHttpClient) -> GenericEngineSource:
+    return board_source(
+        UnusedHttpClient(),
+        slug=slug,
+        municipality=slug,
+        async_http_client=async_client,
+    )
+
+
+def test_generic_engine_fetch_async_walks_pages_with_async_client() -> None:
+    async_client = FakeAsyncHttpClient()
+    source = _build_source("city", async_client)
+
+    notices = asyncio.run(source.fetch_async(TARGET_DATE))
+
+    assert [notice.url for notice in notices] == [
+        "https://city.go.kr/www/selectBbsNttView.do?bbsNo=18&nttNo=7001",
+        "https://city.go.kr/www/selectBbsNttView.do?bbsNo=18&nttNo=7002",
+    ]
+    assert len(async_client.calls) == 3
+
+
+def test_execute_async_runs_sources_concurrently_and_keeps_order() -> None:
+    async_client = FakeAsyncHttpClient(delay_seconds=0.01)
+    sources: list[NoticeSource] = [
+        _build_source(f"city{index}", async_client) for index in range(4)
+    ]
+    sources.append(BlockingSource(slug="blocking", notice_url="https://blocking.go.kr/1"))
+    repository = StubRepository()
+    use_case = CollectNoticesUseCase(repository=repository, sources=sources, max_workers=8)
+
+    collected = asyncio.run(use_case.execute_async(TARGET_DATE))
+
+    assert len(collected) == 9
+    assert collected[0].municipality == "city0"
+    assert collected[-1].url == "https://blocking.go.kr/1"
+    assert async_client.peak_in_flight == 4
+    assert repository.saved_notices == collected
+
+
+def test_threaded_async_client_is_not_capped_by_the_default_executor() -> None:
+    # More requests than the default executor's min(32, cpu_count + 4) threads.
+    parties = 40
+    blocking_client = BarrierHttpClient(threading.Barrier(parties, timeout=5.0))
+    client = ThreadedAsyncHttpClient(blocking_client, max_threads=parties)
+    deadline = Deadline.after(60.0)
+
+    async def fetch_all() -> list[str]:
+        with deadline_scope(deadline):
+            return await asyncio.gather(
+                *(client.get_text(f"https://city.go.kr/{index}") for index in range(parties))
+            )
+
+    try:
+        assert asyncio.run(fetch_all()) == ["ok"] * parties
+    finally:
+        client.close()
+    assert blocking_client.deadlines == [deadline] * parties
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+import requests
+
+from judgefinder.infrastructure.http.cassette import (
+    RecordingHttpClient,
+    ReplayHttpClient,
+    load_cassette,
+)
+from judgefinder.infrastructure.http.client import HttpResponse
+
+LIST_URL = "https://www.sb.go.kr/www/selectGosiList.do?pageIndex=1"
+RSS_URL = "https://www.sb.go.kr/www/gosiToRss.do"
+
+
+class ScriptedServer:
+    def __init__(self, responses: Mapping[str, list[HttpResponse | Exception]]) -> None:
+        self._responses = {url: list(items) for url, items in responses.items()}
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        return self.get_response(url, timeout_seconds, headers, use_session).text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        item = self._responses[url].pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _response(url: str, text: str, status_code: int = 200) -> HttpResponse:
+    return HttpResponse(
+        status_code=status_code,
+        text=text,
+        headers={"Content-Type": "text/html; charset=utf-8"},
+        url=url,
+    )
+
+
+def test_recorded_run_replays_in_order(tmp_path: Path) -> None:
+    cassette = tmp_path / "run.json"
+    server = ScriptedServer(
+        {
+            LIST_URL: [
+                requests.Timeout("slow host"),
+                _response(LIST_URL, "<table>첫 응답</table>"),
+            ],
+            RSS_URL: [_response(RSS_URL, "", status_code=503)],
+        }
+    )
+    recorder = RecordingHttpClient(server, cassette)
+
+    with pytest.raises(requests.Timeout):
+        recorder.get_text(LIST_URL, headers={"Referer": "https://www.sb.go.kr/"})
+    assert recorder.get_text(LIST_URL) == "<table>첫 응답</table>"
+    with pytest.raises(requests.HTTPError):
+        recorder.get_text(RSS_URL)
+    recorder.save()
+
+    interactions = load_cassette(cassette)
+    assert [interaction.url for interaction in interactions] == [LIST_URL, LIST_URL, RSS_URL]
+    assert interactions[0].error == "timeout"
+    assert interactions[0].request_headers == {"Referer": "https://www.sb.go.kr/"}
+
+    replay = ReplayHttpClient(interactions)
+    with pytest.raises(requests.Timeout):
+        replay.get_text(LIST_URL)
+    assert replay.get_text(LIST_URL) == "<table>첫 응답</table>"
+    # Once the recordings for a URL run out, the last one keeps being served.
+    assert replay.get_text(LIST_URL) == "<table>첫 응답</table>"
+    with pytest.raises(requests.HTTPError) as exc_info:
+        replay.get_text(RSS_URL)
+    assert exc_info.value.response.status_code == 503
+
+
+def test_replay_misses_fail_without_retryable_errors() -> None:
+    replay = ReplayHttpClient([])
+
+    response = replay.get_response(LIST_URL)
+
+    assert response.status_code == 404
+    assert replay.misses == 1
+
+
+def test_replay_waits_for_scaled_recorded_latency(tmp_path: Path) -> None:
+    cassette = tmp_path / "run.json"
+    cassette.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "interactions": [
+                    {
+                        "url": RSS_URL,
+                        "request_headers": {},
+                        "status_code": 200,
+                        "text": "<rss />",
+                        "latency_seconds": 0.4,
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    waits: list[float] = []
+    replay = ReplayHttpClient(load_cassette(cassette), latency_scale=0.5, sleep=waits.append)
+
+    assert replay.get_text(RSS_URL) == "<rss />"
+    assert waits == [pytest.approx(0.2)]
+
+
+def test_load_cassette_rejects_unknown_versions(tmp_path: Path) -> None:
+    cassette = tmp_path / "run.json"
+    cassette.write_text(json.dumps({"version": 99, "interactions": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported cassette format"):
+        load_cassette(cassette)
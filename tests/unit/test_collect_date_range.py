@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.ports import NoticeSource
+from tests.fakes import PagedHttpClient, StubRepository, board_source
+
+FETCHED_AT = datetime(2026, 3, 1, 18, 0, tzinfo=ZoneInfo("Asia/Seoul"))
+
+LIST_PAGES = {
+    1: [("2026-02-24", "7003"), ("2026-02-23", "7002")],
+    2: [("2026-02-22", "7001"), ("2026-02-20", "7000")],
+    3: [("2026-02-19", "6999")],
+}
+
+
+@dataclass
+class SingleDateSource:
+    slug: str
+    calls: list[date] = field(default_factory=list)
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        self.calls.append(target_date)
+        return [_notice(f"https://single/{target_date.isoformat()}", target_date)]
+
+
+@dataclass
+class RangeSource:
+    slug: str
+    published: list[date]
+    range_calls: list[tuple[date, date]] = field(default_factory=list)
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        return self.fetch_range(target_date, target_date)
+
+    def fetch_range(self, start_date: date, end_date: date) -> list[Notice]:
+        self.range_calls.append((start_date, end_date))
+        return [
+            _notice(f"https://range/{published.isoformat()}", published)
+            for published in self.published
+            if start_date <= published <= end_date
+        ]
+
+
+def _notice(url: str, published_date: date) -> Notice:
+    return Notice(
+        id=None,
+        municipality="테스트시",
+        title="평가위원 모집 공고",
+        url=url,
+        published_date=published_date,
+        fetched_at=FETCHED_AT,
+        source_type=SourceType.HTML,
+    )
+
+
+def _generic_source(http_client: PagedHttpClient) -> GenericEngineSource:
+    return board_source(http_client)
+
+
+def test_generic_engine_fetch_range_walks_pages_once() -> None:
+    http_client = PagedHttpClient(LIST_PAGES)
+    source = _generic_source(http_client)
+
+    notices = source.fetch_range(date(2026, 2, 20), date(2026, 2, 23))
+
+    assert [notice.published_date for notice in notices] == [
+        date(2026, 2, 23),
+        date(2026, 2, 22),
+        date(2026, 2, 20),
+    ]
+    # Page 3 is entirely older than the window, so the walk ends there.
+    assert len(http_client.calls) == 3
+
+
+def test_generic_engine_fetch_matches_single_day_range() -> None:
+    target_date = date(2026, 2, 22)
+
+    single = _generic_source(PagedHttpClient(LIST_PAGES)).fetch(target_date)
+    ranged = _generic_source(PagedHttpClient(LIST_PAGES)).fetch_range(target_date, target_date)
+
+    assert [notice.url for notice in single] == [notice.url for notice in ranged]
+
+
+def test_execute_range_fetches_range_sources_once_and_orders_by_date() -> None:
+    range_source = RangeSource(
+        slug="range",
+        published=[date(2026, 2, 3), date(2026, 2, 1), date(2026, 1, 30)],
+    )
+    single_source = SingleDateSource(slug="single")
+    sources: list[NoticeSource] = [range_source, single_source]
+    repository = StubRepository()
+    use_case = CollectNoticesUseCase(repository=repository, sources=sources)
+
+    collected = use_case.execute_range(date(2026, 2, 1), date(2026, 2, 3))
+
+    assert range_source.range_calls == [(date(2026, 2, 1), date(2026, 2, 3))]
+    assert single_source.calls == [date(2026, 2, 1), date(2026, 2, 2), date(2026, 2, 3)]
+    assert [notice.url for notice in collected] == [
+        "https://range/2026-02-01",
+        "https://single/2026-02-01",
+        "https://single/2026-02-02",
+        "https://range/2026-02-03",
+        "https://single/2026-02-03",
+    ]
+    assert repository.saved_notices == collected
+
+
+def test_execute_range_async_matches_threaded_result() -> None:
+    def build() -> CollectNoticesUseCase:
+        sources: list[NoticeSource] = [
+            RangeSource(slug="range", published=[date(2026, 2, 2), date(2026, 2, 1)]),
+            SingleDateSource(slug="single"),
+        ]
+        return CollectNoticesUseCase(repository=StubRepository(), sources=sources, max_workers=2)
+
+    start_date, end_date = date(2026, 2, 1), date(2026, 2, 2)
+    threaded = build().execute_range(start_date, end_date)
+    awaited = asyncio.run(build().execute_range_async(start_date, end_date))
+
+    assert [notice.url for notice in awaited] == [notice.url for notice in threaded]
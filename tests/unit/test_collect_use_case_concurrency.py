@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.ports import NoticeSource
+from tests.fakes import StubRepository
+
+TARGET_DATE = date(2026, 2, 2)
+FETCHED_AT = datetime(2026, 3, 1, 18, 0, tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+@dataclass
+class HostTracker:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    active: dict[str, int] = field(default_factory=dict)
+    peak: dict[str, int] = field(default_factory=dict)
+    peak_total: int = 0
+
+    def enter(self, host: str) -> None:
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+
+    def leave(self, host: str) -> None:
+        with self.lock:
+            self.active[host] -= 1
+
+
+@dataclass
+class SlowSource:
+    slug: str
+    list_url: str
+    urls: list[str]
+    delay_seconds: float
+    tracker: HostTracker
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        host = self.list_url.split("/")[2]
+        self.tracker.enter(host)
+        try:
+            time.sleep(self.delay_seconds)
+        finally:
+            self.tracker.leave(host)
+        return [_notice(url, target_date) for url in self.urls]
+
+
+@dataclass(slots=True)
+class FailingSource:
+    slug: str
+    list_url: str
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        _ = target_date
+        raise RuntimeError("temporary network failure")
+
+
+def _notice(url: str, target_date: date) -> Notice:
+    return Notice(
+        id=None,
+        municipality="테스트시",
+        title="평가위원 모집 공고",
+        url=url,
+        published_date=target_date,
+        fetched_at=FETCHED_AT,
+        source_type=SourceType.HTML,
+    )
+
+
+def test_concurrent_collect_keeps_source_order_for_dedupe() -> None:
+    tracker = HostTracker()
+    sources: list[NoticeSource] = [
+        SlowSource("slow", "https://a.go.kr/list", ["https://x/1", "https://x/2"], 0.05, tracker),
+        FailingSource("failing", "https://b.go.kr/list"),
+        SlowSource("fast", "https://c.go.kr/list", ["https://x/2", "https://x/3"], 0.0, tracker),
+    ]
+    repository = StubRepository()
+    use_case = CollectNoticesUseCase(repository=repository, sources=sources, max_workers=4)
+
+    collected = use_case.execute(TARGET_DATE)
+
+    assert [notice.url for notice in collected] == ["https://x/1", "https://x/2", "https://x/3"]
+    assert [notice.url for notice in repository.saved_notices] == [
+        "https://x/1",
+        "https://x/2",
+        "https://x/3",
+    ]
+
+
+def test_concurrent_collect_respects_worker_and_per_host_limits() -> None:
+    tracker = HostTracker()
+    sources: list[NoticeSource] = [
+        SlowSource(
+            f"same-{index}",
+            "https://same.go.kr/list",
+            [f"https://s/{index}"],
+            0.02,
+            tracker,
+        )
+        for index in range(6)
+    ]
+    sources += [
+        SlowSource(f"other-{index}", f"https://o{index}.go.kr/list", [], 0.02, tracker)
+        for index in range(4)
+    ]
+    use_case = CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=sources,
+        max_workers=4,
+        per_host_limit=2,
+    )
+
+    collected = use_case.execute(TARGET_DATE)
+
+    assert [notice.url for notice in collected] == [f"https://s/{index}" for index in range(6)]
+    assert tracker.peak["same.go.kr"] <= 2
+    assert tracker.peak_total <= 4
+
+
+@dataclass
+class FixedHostLimits:
+    limits: dict[str, float]
+
+    def limit_for(self, host: str) -> float:
+        return self.limits.get(host, 1.0)
+
+
+def test_adaptive_host_limits_replace_the_fixed_per_host_limit() -> None:
+    tracker = HostTracker()
+    sources: list[NoticeSource] = [
+        SlowSource(f"wide-{index}", "https://wide.go.kr/list", [], 0.05, tracker)
+        for index in range(4)
+    ]
+    sources += [
+        SlowSource(f"narrow-{index}", "https://narrow.go.kr/list", [], 0.02, tracker)
+        for index in range(2)
+    ]
+    use_case = CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=sources,
+        max_workers=8,
+        per_host_limit=2,
+        host_limits=FixedHostLimits({"wide.go.kr": 4.5, "narrow.go.kr": 1.0}),
+    )
+
+    use_case.execute(TARGET_DATE)
+
+    assert tracker.peak["wide.go.kr"] == 4
+    assert tracker.peak["narrow.go.kr"] == 1
+
+
+def test_execute_worker_override_falls_back_to_sequential_run() -> None:
+    tracker = HostTracker()
+    sources = [
+        SlowSource(f"city-{index}", f"https://c{index}.go.kr/list", [], 0.01, tracker)
+        for index in range(3)
+    ]
+    use_case = CollectNoticesUseCase(repository=StubRepository(), sources=sources, max_workers=3)
+
+    use_case.execute(TARGET_DATE, max_workers=1)
+
+    assert tracker.peak_total == 1
@@ -6,14 +6,7 @@ from zoneinfo import ZoneInfo
 
 from judgefinder.application.use_cases import CollectNoticesUseCase
 from judgefinder.domain.entities import Notice, SourceType
-
-
-@dataclass(slots=True)
-class StubRepository:
-    saved_notices: list[Notice]
-
-    def save_many(self, notices: list[Notice]) -> None:
-        self.saved_notices = list(notices)
+from tests.fakes import StubRepository
 
 
 @dataclass(slots=True)
@@ -48,7 +41,7 @@ def test_collect_use_case_skips_failed_source_and_continues() -> None:
         source_type=SourceType.HTML,
     )
 
-    repository = StubRepository(saved_notices=[])
+    repository = StubRepository()
     use_case = CollectNoticesUseCase(
         repository=repository,
         sources=[
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+import requests
+
+from judgefinder.infrastructure.http.client import HttpResponse, ThreadedAsyncHttpClient
+from judgefinder.infrastructure.http.conditional_cache import (
+    ConditionalGetAsyncHttpClient,
+    ConditionalGetHttpClient,
+    HttpCacheStore,
+)
+
+FEED_URL = "https://www.sb.go.kr/www/gosiToRss.do"
+FEED_BODY = "<rss><channel><item><title>평가위원</title></item></channel></rss>"
+
+
+class ValidatingServer:
+    def __init__(self, *, etag: str = '"v1"', last_modified: str = "") -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = FEED_BODY
+        self.status_override: int | None = None
+        self.request_headers: list[dict[str, str]] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        return self.get_response(url, timeout_seconds, headers, use_session).text
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        _ = timeout_seconds
+        _ = use_session
+        sent = dict(headers or {})
+        self.request_headers.append(sent)
+        if self.status_override is not None:
+            return HttpResponse(status_code=self.status_override, text="", headers={}, url=url)
+        response_headers = {}
+        if self.etag:
+            response_headers["etag"] = self.etag
+        if self.last_modified:
+            response_headers["last-modified"] = self.last_modified
+        if self.etag and sent.get("If-None-Match") == self.etag:
+            return HttpResponse(status_code=304, text="", headers=response_headers, url=url)
+        if self.last_modified and sent.get("If-Modified-Since") == self.last_modified:
+            return HttpResponse(status_code=304, text="", headers=response_headers, url=url)
+        return HttpResponse(status_code=200, text=self.body, headers=response_headers, url=url)
+
+
+def test_conditional_get_serves_not_modified_from_disk(tmp_path: Path) -> None:
+    server = ValidatingServer()
+    store = HttpCacheStore(tmp_path / "http_cache")
+    client = ConditionalGetHttpClient(server, store)
+
+    assert client.get_text(FEED_URL, headers={"Referer": "https://www.sb.go.kr/"}) == FEED_BODY
+    # A new store instance simulates the next hourly run reading the same directory.
+    next_run_store = HttpCacheStore(tmp_path / "http_cache")
+    next_run = ConditionalGetHttpClient(server, next_run_store)
+    assert next_run.get_text(FEED_URL, headers={"Referer": "https://www.sb.go.kr/"}) == FEED_BODY
+
+    assert "If-None-Match" not in server.request_headers[0]
+    assert server.request_headers[1]["If-None-Match"] == '"v1"'
+    assert server.request_headers[1]["Referer"] == "https://www.sb.go.kr/"
+    stats = next_run_store.stats()
+    assert stats.requests == 1
+    assert stats.revalidated == 1
+    assert stats.bytes_saved == len(FEED_BODY.encode("utf-8"))
+
+
+def test_conditional_get_uses_last_modified_and_refreshes_changed_body(tmp_path: Path) -> None:
+    server = ValidatingServer(etag="", last_modified="Mon, 02 Feb 2026 00:00:00 GMT")
+    client = ConditionalGetHttpClient(server, HttpCacheStore(tmp_path))
+    client.get_text(FEED_URL)
+
+    server.last_modified = "Tue, 03 Feb 2026 00:00:00 GMT"
+    server.body = "<rss><channel></channel></rss>"
+
+    assert client.get_text(FEED_URL) == server.body
+    assert client.get_text(FEED_URL) == server.body
+    assert server.request_headers[2]["If-Modified-Since"] == server.last_modified
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_entries_past_their_max_age(tmp_path: Path) -> None:
+    clock = FakeClock()
+    server = ValidatingServer()
+    store = HttpCacheStore(tmp_path / "http_cache", max_age_seconds=3600, clock=clock)
+    client = ConditionalGetHttpClient(server, store)
+    client.get_text(FEED_URL)
+    client.get_text("https://www.sb.go.kr/other")
+
+    clock.now += 1800
+    # A 304 restarts the age of the entry it confirmed.
+    client.get_text(FEED_URL)
+    clock.now += 2400
+
+    assert store.load("https://www.sb.go.kr/other") is None
+    assert store.load(FEED_URL) is not None
+    clock.now += 7200
+    assert store.prune() == 2
+    assert list((tmp_path / "http_cache").glob("*/*.json")) == []
+
+
+def test_conditional_get_skips_responses_without_validators(tmp_path: Path) -> None:
+    server = ValidatingServer(etag="")
+    store = HttpCacheStore(tmp_path)
+    client = ConditionalGetHttpClient(server, store)
+
+    client.get_text(FEED_URL)
+    client.get_text(FEED_URL)
+
+    assert server.request_headers == [{}, {}]
+    assert store.stats().stored == 0
+
+
+def test_conditional_get_text_raises_for_error_status(tmp_path: Path) -> None:
+    server = ValidatingServer()
+    server.status_override = 503
+    client = ConditionalGetHttpClient(server, HttpCacheStore(tmp_path))
+
+    with pytest.raises(requests.HTTPError) as exc_info:
+        client.get_text(FEED_URL)
+
+    assert exc_info.value.response is not None
+    assert exc_info.value.response.status_code == 503
+
+
+def test_async_conditional_get_shares_store(tmp_path: Path) -> None:
+    server = ValidatingServer()
+    store = HttpCacheStore(tmp_path)
+    ConditionalGetHttpClient(server, store).get_text(FEED_URL)
+    client = ConditionalGetAsyncHttpClient(ThreadedAsyncHttpClient(server), store)
+
+    assert asyncio.run(client.get_text(FEED_URL)) == FEED_BODY
+    assert store.stats().revalidated == 1
+
+
+def test_loading_an_expired_entry_leaves_the_file_for_save(tmp_path: Path) -> None:
+    clock = FakeClock()
+    store = HttpCacheStore(tmp_path / "http_cache", max_age_seconds=3600, clock=clock)
+    response = HttpResponse(status_code=200, text=FEED_BODY, headers={"ETag": '"v1"'}, url=FEED_URL)
+    store.save(response, url=FEED_URL)
+    clock.now += 7200
+
+    # Deleting here could remove an entry another process saved after the age check.
+    assert store.load(FEED_URL) is None
+    assert len(list((tmp_path / "http_cache").glob("*/*.json"))) == 1
+
+    store.save(response, url=FEED_URL)
+    assert store.load(FEED_URL) is not None
+    assert list((tmp_path / "http_cache").glob("*/*.tmp")) == []
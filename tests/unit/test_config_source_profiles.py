@@ -103,3 +103,31 @@ def test_load_config_raises_for_invalid_engine_type(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Invalid value for 'engine_type'"):
         load_config(config_path, base_dir=tmp_path)
+
+
+def test_load_config_parses_collection_table(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        "\n".join(
+            [
+                'timezone = "Asia/Seoul"',
+                'db_path = "data/judgefinder.db"',
+                'enabled_sources = ["demo"]',
+                "",
+                "[collection]",
+                "workers = 16",
+                "per_host_limit = 1",
+                "",
+                "[sources.demo]",
+                'municipality = "demo-city"',
+                'source_type = "html"',
+                'list_url = "https://example.com/list"',
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    app_config = load_config(config_path, base_dir=tmp_path)
+
+    assert app_config.collection.workers == 16
+    assert app_config.collection.per_host_limit == 1
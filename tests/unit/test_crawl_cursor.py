@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.crawl_cursor import CrawlCursor, CrawlProgress
+from judgefinder.domain.entities import Notice
+from tests.fakes import PagedHttpClient, StubRepository, board_source
+
+LIST_PAGES = {
+    1: [("2026-03-02", "8004"), ("2026-03-02", "8003"), ("2026-03-01", "8002")],
+    2: [("2026-02-28", "8001"), ("2026-02-27", "8000")],
+    3: [("2026-02-26", "7999")],
+}
+
+
+@dataclass(slots=True)
+class InMemoryCursorRepository:
+    cursors: dict[str, CrawlCursor] = field(default_factory=dict)
+
+    def load(self, source_slug: str) -> CrawlCursor | None:
+        return self.cursors.get(source_slug)
+
+    def save(self, cursor: CrawlCursor) -> None:
+        self.cursors[cursor.source_slug] = cursor
+
+
+def _source(http_client: PagedHttpClient) -> GenericEngineSource:
+    return board_source(http_client)
+
+
+def _url(ntt_no: str) -> str:
+    return f"https://city.go.kr/www/selectBbsNttView.do?bbsNo=18&nttNo={ntt_no}"
+
+
+def test_progress_stops_when_the_cursor_row_is_reached() -> None:
+    cursor = CrawlCursor("city", _url("8003"), date(2026, 3, 2), covered_since=date(2026, 2, 1))
+    progress = CrawlProgress(cursor, date(2026, 2, 20), date(2026, 3, 2))
+
+    assert progress.observe_page(
+        [(_url("8004"), date(2026, 3, 2)), (_url("8003"), date(2026, 3, 2))]
+    )
+    assert progress.advanced_cursor("city") == CrawlCursor(
+        "city",
+        _url("8004"),
+        date(2026, 3, 2),
+        covered_since=date(2026, 2, 1),
+    )
+
+
+def test_progress_keeps_walking_rows_that_share_the_cursor_date() -> None:
+    cursor = CrawlCursor("city", _url("8002"), date(2026, 3, 1), covered_since=date(2026, 2, 1))
+    progress = CrawlProgress(cursor, date(2026, 2, 20), date(2026, 3, 2))
+
+    assert not progress.observe_page(
+        [(_url("8009"), date(2026, 3, 2)), (_url("8008"), date(2026, 3, 1))]
+    )
+    assert progress.observe_page([(_url("8007"), date(2026, 2, 28))])
+
+
+def test_progress_ignores_the_cursor_for_windows_older_than_its_coverage() -> None:
+    cursor = CrawlCursor("city", _url("8003"), date(2026, 3, 2), covered_since=date(2026, 3, 1))
+    progress = CrawlProgress(cursor, date(2026, 2, 1), date(2026, 3, 2))
+
+    assert not progress.observe_page([(_url("8003"), date(2026, 3, 2))])
+    assert progress.advanced_cursor("city") == CrawlCursor(
+        "city",
+        _url("8003"),
+        date(2026, 3, 2),
+        covered_since=date(2026, 2, 1),
+    )
+
+
+def test_second_run_fetches_only_the_first_page() -> None:
+    cursors = InMemoryCursorRepository()
+    window = (date(2026, 2, 27), date(2026, 3, 2))
+
+    first_client = PagedHttpClient(LIST_PAGES)
+    first = CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=[_source(first_client)],
+        cursor_repository=cursors,
+    ).execute_range(*window)
+    second_client = PagedHttpClient(LIST_PAGES)
+    second = CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=[_source(second_client)],
+        cursor_repository=cursors,
+    ).execute_range(*window)
+
+    assert len(first_client.calls) == 3
+    assert len(first) == 5
+    assert cursors.cursors["city"] == CrawlCursor(
+        "city",
+        _url("8004"),
+        date(2026, 3, 2),
+        covered_since=date(2026, 2, 27),
+    )
+    assert len(second_client.calls) == 1
+    assert [notice.url for notice in second] == [_url("8002"), _url("8004"), _url("8003")]
+
+
+class FailingRepository(StubRepository):
+    def save_many(self, notices: list[Notice]) -> None:
+        _ = notices
+        raise RuntimeError("database is locked")
+
+
+def test_cursor_is_not_advanced_when_notices_fail_to_save() -> None:
+    cursors = InMemoryCursorRepository()
+    window = (date(2026, 2, 27), date(2026, 3, 2))
+    use_case = CollectNoticesUseCase(
+        repository=FailingRepository(),
+        sources=[_source(PagedHttpClient(LIST_PAGES))],
+        cursor_repository=cursors,
+    )
+
+    with pytest.raises(RuntimeError, match="database is locked"):
+        use_case.execute_range(*window)
+
+    assert cursors.cursors == {}
+    retry_client = PagedHttpClient(LIST_PAGES)
+    CollectNoticesUseCase(
+        repository=StubRepository(),
+        sources=[_source(retry_client)],
+        cursor_repository=cursors,
+    ).execute_range(*window)
+    assert len(retry_client.calls) == 3
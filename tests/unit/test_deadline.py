@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    PartialFetchError,
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+)
+from judgefinder.domain.entities import Notice, SourceType
+from judgefinder.domain.ports import NoticeSource
+from judgefinder.domain.source_profiles import RequestStrategy
+from judgefinder.infrastructure.http.client import HttpResponse
+from tests.fakes import StubRepository, board_source
+
+TARGET_DATE = date(2026, 2, 22)
+FETCHED_AT = datetime(2026, 3, 1, 18, 0, tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+class SlowListClient:
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+        self.timeouts: list[float] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = headers
+        _ = use_session
+        self.timeouts.append(timeout_seconds)
+        time.sleep(self.delay_seconds)
+        page_index = url.split("pageIndex=")[1].split("&")[0]
+        return f"""
+        <html><table><tr>
+          <td>2026-02-22</td>
+          <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo={page_index}">평가위원 모집</a></td>
+        </tr></table></html>
+        """
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        text = self.get_text(url, timeout_seconds, headers, use_session)
+        return HttpResponse(status_code=200, text=text, headers={}, url=url)
+
+
+@dataclass(slots=True)
+class PartialSource:
+    slug: str
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        raise PartialFetchError([_notice("https://partial/1", target_date)], "budget exceeded")
+
+
+@dataclass(slots=True)
+class SleepySource:
+    slug: str
+    delay_seconds: float
+
+    def fetch(self, target_date: date) -> list[Notice]:
+        time.sleep(self.delay_seconds)
+        return [_notice(f"https://{self.slug}/1", target_date)]
+
+
+def _notice(url: str, published_date: date) -> Notice:
+    return Notice(
+        id=None,
+        municipality="테스트시",
+        title="평가위원 모집 공고",
+        url=url,
+        published_date=published_date,
+        fetched_at=FETCHED_AT,
+        source_type=SourceType.HTML,
+    )
+
+
+def test_deadline_scope_never_extends_outer_deadline() -> None:
+    outer = Deadline.after(1.0)
+    with deadline_scope(outer):
+        with deadline_scope(Deadline.after(60.0)):
+            assert current_deadline() == outer
+        with deadline_scope(None):
+            assert current_deadline() == outer
+    assert current_deadline() is None
+
+
+def test_clamp_timeout_shrinks_to_remaining_time_and_raises_when_spent() -> None:
+    assert clamp_timeout(10.0) == 10.0
+    with deadline_scope(Deadline.after(0.5)):
+        assert clamp_timeout(10.0) <= 0.5
+    with deadline_scope(Deadline.after(-1.0)), pytest.raises(DeadlineExceededError):
+        clamp_timeout(10.0)
+
+
+def test_request_strategy_derives_source_budget() -> None:
+    assert RequestStrategy(timeout_seconds=2.0, retries=3).effective_budget_seconds() == 60.0
+    assert RequestStrategy(budget_seconds=5.0).effective_budget_seconds() == 5.0
+
+
+def test_source_budget_keeps_notices_collected_before_it_ran_out() -> None:
+    http_client = SlowListClient(delay_seconds=0.05)
+    source = board_source(http_client, max_pages=20, budget_seconds=0.18)
+
+    with pytest.raises(PartialFetchError) as exc_info:
+        source.fetch(TARGET_DATE)
+
+    assert 1 <= len(exc_info.value.notices) < 20
+    assert all(timeout <= 0.18 for timeout in http_client.timeouts)
+
+
+def test_collect_reports_partial_sources_and_keeps_their_notices() -> None:
+    sources: list[NoticeSource] = [
+        PartialSource(slug="partial"),
+        SleepySource(slug="slow", delay_seconds=0.1),
+        SleepySource(slug="late", delay_seconds=0.0),
+    ]
+    repository = StubRepository()
+    use_case = CollectNoticesUseCase(
+        repository=repository,
+        sources=sources,
+        run_budget_seconds=0.05,
+    )
+
+    collected = use_case.execute(TARGET_DATE)
+
+    assert [notice.url for notice in collected] == ["https://partial/1", "https://slow/1"]
+    assert use_case.partial_sources == ("partial", "late")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from judgefinder.adapters.sources.generic_engine.parse_pool import GenericEngineParsePool
+from judgefinder.adapters.sources.generic_engine.parser import parse_generic_engine_candidates
+from judgefinder.domain.source_profiles import EngineType
+
+LIST_URL = "https://city.go.kr/www/selectBbsNttList.do?bbsNo=18&key=100"
+PAYLOAD = """
+<table>
+  <tr>
+    <td>2026-02-22</td>
+    <td><a href="/www/selectBbsNttView.do?bbsNo=18&nttNo=7001">평가위원 모집</a></td>
+  </tr>
+  <tr>
+    <td>2026.02.21</td>
+    <td><a href="javascript:fn_view('18','7000')" onclick="nttNo=7000;bbsNo=18">심사위원</a></td>
+  </tr>
+</table>
+"""
+
+
+@pytest.fixture()
+def parse_pool() -> Iterator[GenericEngineParsePool]:
+    pool = GenericEngineParsePool(max_workers=1)
+    yield pool
+    pool.close()
+
+
+def test_parse_pool_matches_in_process_parsing(parse_pool: GenericEngineParsePool) -> None:
+    expected = parse_generic_engine_candidates(
+        PAYLOAD,
+        list_url=LIST_URL,
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+    )
+
+    parsed = parse_pool.parse(PAYLOAD, list_url=LIST_URL, engine_type=EngineType.GENERIC_EGOV_BBS)
+
+    assert len(expected) == 2
+    assert parsed == expected
+
+
+def test_parse_pool_async_matches_in_process_parsing(parse_pool: GenericEngineParsePool) -> None:
+    expected = parse_generic_engine_candidates(
+        PAYLOAD,
+        list_url=LIST_URL,
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+    )
+
+    parsed = asyncio.run(
+        parse_pool.parse_async(
+            PAYLOAD,
+            list_url=LIST_URL,
+            engine_type=EngineType.GENERIC_EGOV_BBS,
+        )
+    )
+
+    assert parsed == expected
+
+
+def test_parse_pool_never_forks_the_threaded_collector(parse_pool: GenericEngineParsePool) -> None:
+    context = parse_pool._executor._mp_context
+    assert context is not None
+    assert context.get_start_method() in {"forkserver", "spawn"}
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from datetime import date
 
-from judgefinder.adapters.sources.generic_engine.parser import parse_generic_engine_candidates
+import pytest
+
+from judgefinder.adapters.sources.generic_engine.parser import (
+    _parse_html_candidates,
+    _parse_html_candidates_with_soup,
+    _split_list_url,
+    parse_generic_engine_candidates,
+)
 from judgefinder.domain.source_profiles import EngineType
 
 
@@ -123,3 +130,48 @@ def test_parse_generic_engine_saeol_fn_search_detail_candidates() -> None:
         candidates[0].url
         == "https://www.djjunggu.go.kr/prog/saeolGosi/GOSI/sub03_06/view.do?notAncmtMgtNo=46819"
     )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # Row text after the anchor, nested inline tags and entities.
+        """<div>2026-01-02 <a href="view.do?nttNo=1">평가<b>위원</b>&amp;모집</a>
+        2026.02.03</div><div><a href="view.do?nttNo=2">no date</a></div>""",
+        # Unclosed list items nest, so the first row's text includes the second.
+        """<ul><li>2026-01-02 <a href="view.do?nttNo=1">첫째<li>2026-01-03
+        <a href="view.do?nttNo=2">둘째</a></ul>""",
+        # Script, style and comment text never counts as context.
+        """<table><tr><td><script>var d = "2026-01-01";</script>
+        <a href="view.do?nttNo=3">공고</a></td><!-- 2026-05-05 --><td>20260506</td></tr>
+        </table>""",
+        # Anchors outside any row use their own text; stray end tags are ignored.
+        """</tr></span><a href="view.do?nttNo=4">2026-03-04 공고</a>
+        <div><a href="#" onclick="boardView(1, 55)">새올</a><br>2026년 3월 4일</div>""",
+    ],
+)
+def test_streaming_html_candidates_match_beautifulsoup(payload: str) -> None:
+    list_url = "https://city.go.kr/www/selectBbsNttList.do?bbsNo=18&key=7"
+
+    streamed = _parse_html_candidates(
+        payload,
+        list_url=list_url,
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+    )
+
+    assert streamed
+    assert streamed == _parse_html_candidates_with_soup(
+        payload,
+        list_url=list_url,
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+    )
+
+
+def test_cached_list_url_query_is_read_only() -> None:
+    list_url = "https://city.go.kr/www/selectBbsNttList.do?key=1234&bbsNo=18"
+    _, query = _split_list_url(list_url)
+
+    with pytest.raises(TypeError):
+        query["key"] = ("9999",)  # type: ignore[index]
+
+    assert _split_list_url(list_url)[1]["key"] == ("1234",)
@@ -178,3 +178,34 @@ def test_generic_engine_source_keeps_default_saeol_query_shape() -> None:
     assert first_query.get("pageIndex") == ["1"]
     assert first_query.get("searchKeyword") == [keyword]
     assert first_query.get("searchCondition") == ["sj"]
+
+
+def test_generic_engine_source_prefetch_returns_same_notices() -> None:
+    keyword = "평가위원"
+    sequential_client = FakeHttpClient()
+    prefetch_client = FakeHttpClient()
+    sources = [
+        GenericEngineSource(
+            slug="city",
+            municipality="City",
+            source_type=SourceType.HTML,
+            list_url="https://city.go.kr/www/selectBbsNttList.do?bbsNo=18",
+            engine_type=EngineType.GENERIC_EGOV_BBS,
+            timezone=ZoneInfo("Asia/Seoul"),
+            http_client=client,
+            keywords=(keyword,),
+            max_pages=4,
+            prefetch_pages=prefetch,
+        )
+        for client, prefetch in ((sequential_client, False), (prefetch_client, True))
+    ]
+
+    sequential_notices = sources[0].fetch(date(2026, 2, 22))
+    prefetch_notices = sources[1].fetch(date(2026, 2, 22))
+
+    assert [notice.url for notice in prefetch_notices] == [
+        notice.url for notice in sequential_notices
+    ]
+    assert len(sequential_client.calls) == 2
+    # At most one speculative page is requested past the point where the walk stopped.
+    assert len(prefetch_client.calls) <= len(sequential_client.calls) + 1
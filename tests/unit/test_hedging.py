@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+
+from judgefinder.infrastructure.http.client import HttpResponse, ThreadedAsyncHttpClient
+from judgefinder.infrastructure.http.hedging import (
+    HedgePolicy,
+    HedgeSettings,
+    HedgingAsyncHttpClient,
+    HedgingHttpClient,
+)
+
+HOST = "slow.go.kr"
+URL = f"https://{HOST}/list"
+
+
+class TailLatencyClient:
+    """First request stalls, later ones answer immediately."""
+
+    def __init__(self, stall_seconds: float) -> None:
+        self.stall_seconds = stall_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = url
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+        if call_number == 1:
+            time.sleep(self.stall_seconds)
+            return "stalled"
+        return "fast"
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        text = self.get_text(url, timeout_seconds, headers, use_session)
+        return HttpResponse(status_code=200, text=text, headers={}, url=url)
+
+
+def _warm_policy() -> HedgePolicy:
+    policy = HedgePolicy(HedgeSettings(min_samples=5, max_hedge_ratio=1.0))
+    for _ in range(5):
+        policy.record_latency(HOST, 0.01)
+    return policy
+
+
+def test_hedge_policy_waits_for_samples_and_uses_percentile() -> None:
+    policy = HedgePolicy(HedgeSettings(percentile=0.9, min_samples=10, min_delay_seconds=0.0))
+    for latency in range(1, 10):
+        policy.record_latency(HOST, float(latency))
+    assert policy.hedge_delay(HOST) is None
+
+    policy.record_latency(HOST, 10.0)
+
+    assert policy.hedge_delay(HOST) == 9.0
+
+
+def test_hedge_policy_caps_hedge_volume() -> None:
+    policy = HedgePolicy(HedgeSettings(min_samples=1, max_hedge_ratio=0.1))
+    policy.record_latency(HOST, 0.01)
+    for _ in range(10):
+        policy.hedge_delay(HOST)
+
+    assert policy.try_start_hedge()
+    assert not policy.try_start_hedge()
+
+
+def test_hedge_ratio_counts_only_requests_that_could_be_hedged() -> None:
+    policy = HedgePolicy(
+        HedgeSettings(min_samples=1, max_hedge_ratio=0.5),
+        eligible=lambda host: host != "throttled.go.kr",
+    )
+    policy.record_latency(HOST, 0.01)
+    policy.record_latency("throttled.go.kr", 0.01)
+    for _ in range(10):
+        policy.hedge_delay("cold.go.kr")
+        policy.hedge_delay("throttled.go.kr")
+    policy.hedge_delay(HOST)
+    policy.hedge_delay(HOST)
+
+    assert policy.stats().requests == 2
+    assert policy.try_start_hedge()
+    assert not policy.try_start_hedge()
+
+
+def test_hedged_request_returns_first_response() -> None:
+    inner = TailLatencyClient(stall_seconds=0.5)
+    policy = _warm_policy()
+    client = HedgingHttpClient(inner, policy)
+
+    started = time.perf_counter()
+    try:
+        assert client.get_text(URL) == "fast"
+    finally:
+        client.close()
+
+    assert time.perf_counter() - started < 0.4
+    assert policy.stats().hedged == 1
+    assert policy.stats().hedge_wins == 1
+
+
+def test_time_queued_for_the_pool_does_not_trigger_a_hedge() -> None:
+    inner = TailLatencyClient(stall_seconds=0.0)
+    policy = _warm_policy()
+    client = HedgingHttpClient(inner, policy, max_workers=1)
+    client._executor.submit(time.sleep, 0.2)
+
+    try:
+        assert client.get_text(URL) == "stalled"
+    finally:
+        client.close()
+
+    assert inner.calls == 1
+    assert policy.stats().hedged == 0
+
+
+def test_ineligible_hosts_are_never_hedged() -> None:
+    inner = TailLatencyClient(stall_seconds=0.1)
+    policy = HedgePolicy(
+        HedgeSettings(min_samples=1, max_hedge_ratio=1.0),
+        eligible=lambda host: host != HOST,
+    )
+    policy.record_latency(HOST, 0.01)
+    client = HedgingHttpClient(inner, policy)
+
+    try:
+        assert client.get_text(URL) == "stalled"
+    finally:
+        client.close()
+
+    assert inner.calls == 1
+
+
+def test_async_hedged_request_returns_first_response() -> None:
+    inner = TailLatencyClient(stall_seconds=0.5)
+    policy = _warm_policy()
+    client = HedgingAsyncHttpClient(ThreadedAsyncHttpClient(inner), policy)
+
+    async def timed_get() -> tuple[str, float]:
+        # Timed inside the loop: asyncio.run also waits for the stalled worker thread.
+        started = time.perf_counter()
+        text = await client.get_text(URL)
+        return text, time.perf_counter() - started
+
+    text, elapsed = asyncio.run(timed_get())
+
+    assert text == "fast"
+    assert elapsed < 0.4
+    assert policy.stats().hedge_wins == 1
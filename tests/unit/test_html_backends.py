@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from benchmarks import pages
+from judgefinder.adapters.sources.generic_engine.parser import (
+    _parse_html_candidates,
+    _parse_html_candidates_with_soup,
+    parse_generic_engine_candidates,
+)
+from judgefinder.adapters.sources.html_backend import (
+    AUTO_HTML_BACKEND,
+    HTML_BACKENDS,
+    STDLIB_BACKEND,
+    available_html_backends,
+    resolve_html_backend,
+)
+from judgefinder.adapters.sources.sample_city.parser import parse_sample_city_notices_between
+from judgefinder.domain.entities import SourceType
+from judgefinder.domain.source_profiles import EngineType
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures"
+EMINWON_LIST_URL = "https://www.pocheon.go.kr/www/selectEminwonList.do?key=12563"
+# Every HTML fixture runs through every backend: the eminwon list here, the sample city
+# page in test_sample_city_backends_agree_on_fixture.
+HTML_PAGES: dict[str, tuple[str, EngineType, str]] = {
+    "pocheon_eminwon_list.html": (
+        (FIXTURES_DIR / "pocheon_eminwon_list.html").read_text(encoding="utf-8"),
+        EngineType.GENERIC_EGOV_BBS,
+        EMINWON_LIST_URL,
+    ),
+    "egov_bbs": (
+        pages.egov_bbs_html(40),
+        EngineType.GENERIC_EGOV_BBS,
+        "https://www.city.go.kr/www/selectBbsNttList.do?bbsNo=18&key=1",
+    ),
+    "saeol_gosi": (
+        pages.saeol_gosi_html(40),
+        EngineType.SAEOL_GOSI,
+        "https://www.city.go.kr/portal/saeol/gosiList.do?mId=0301",
+    ),
+    "citynet_sapgosi": (
+        pages.citynet_sapgosi_html(40),
+        EngineType.CITYNET_SAPGOSI,
+        "https://www.city.go.kr/sapgosiBizProcess.do?command=searchList",
+    ),
+    "eminwon": (pages.eminwon_html(40), EngineType.GENERIC_EGOV_BBS, EMINWON_LIST_URL),
+}
+
+
+def _require(backend: str) -> None:
+    if backend not in available_html_backends():
+        pytest.skip(f"{backend} is not installed")
+
+
+@pytest.mark.parametrize("backend", HTML_BACKENDS)
+@pytest.mark.parametrize("page_name", sorted(HTML_PAGES))
+def test_generic_engine_backends_agree_on_every_page(backend: str, page_name: str) -> None:
+    _require(backend)
+    payload, engine_type, list_url = HTML_PAGES[page_name]
+
+    reference = parse_generic_engine_candidates(
+        payload,
+        list_url=list_url,
+        engine_type=engine_type,
+        html_backend=STDLIB_BACKEND,
+    )
+    streamed = _parse_html_candidates(
+        payload,
+        list_url=list_url,
+        engine_type=engine_type,
+        html_backend=backend,
+    )
+
+    assert reference
+    assert (
+        parse_generic_engine_candidates(
+            payload,
+            list_url=list_url,
+            engine_type=engine_type,
+            html_backend=backend,
+        )
+        == reference
+    )
+    assert streamed == _parse_html_candidates_with_soup(
+        payload,
+        list_url=list_url,
+        engine_type=engine_type,
+        html_backend=backend,
+    )
+
+
+@pytest.mark.parametrize("backend", HTML_BACKENDS)
+def test_sample_city_backends_agree_on_fixture(backend: str) -> None:
+    _require(backend)
+    html = (FIXTURES_DIR / "sample_city_list.html").read_text(encoding="utf-8")
+
+    def parse(html_backend: str) -> list[tuple[str, str, date]]:
+        notices = parse_sample_city_notices_between(
+            html,
+            municipality="샘플시",
+            list_url="https://example.com/sample_city/notices",
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+            fetched_at=datetime(2026, 2, 16, 10, 0, tzinfo=ZoneInfo("Asia/Seoul")),
+            source_type=SourceType.HTML,
+            html_backend=html_backend,
+        )
+        return [(notice.title, notice.url, notice.published_date) for notice in notices]
+
+    reference = parse(STDLIB_BACKEND)
+    assert reference
+    assert parse(backend) == reference
+
+
+def test_resolve_html_backend_prefers_installed_fast_backend() -> None:
+    assert resolve_html_backend(AUTO_HTML_BACKEND) == available_html_backends()[0]
+    assert resolve_html_backend(STDLIB_BACKEND) == STDLIB_BACKEND
+    with pytest.raises(ValueError, match="Unknown HTML backend"):
+        resolve_html_backend("html5lib")
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from judgefinder.adapters.sources.page_cache import PageCache
+from judgefinder.adapters.sources.seongbuk.source import SeongbukSource
+from judgefinder.domain.entities import SourceType
+from judgefinder.infrastructure.http.client import HttpResponse
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingHttpClient:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        self.calls.append(url)
+        return "<rss><channel></channel></rss>"
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        return HttpResponse(status_code=200, text="", headers={}, url=url)
+
+
+def test_page_cache_evicts_least_recently_used_within_byte_budget() -> None:
+    cache = PageCache(max_bytes=10)
+    cache.put("a", "aaaa", ttl_seconds=60)
+    cache.put("b", "bbbb", ttl_seconds=60)
+    assert cache.get("a") == "aaaa"
+
+    cache.put("c", "cccc", ttl_seconds=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.size_bytes == 8
+
+
+def test_page_cache_counts_payload_size_in_encoded_bytes() -> None:
+    cache = PageCache(max_bytes=8)
+
+    cache.put("korean", "평가위원", ttl_seconds=60)
+
+    assert cache.get("korean") is None
+    assert cache.stats().entries == 0
+
+
+def test_page_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = PageCache(max_bytes=1024, clock=clock)
+    cache.put("page", "payload", ttl_seconds=5)
+
+    clock.now = 4.9
+    assert cache.get("page") == "payload"
+    clock.now = 5.0
+    assert cache.get("page") is None
+
+    stats = cache.stats()
+    assert stats.expirations == 1
+    assert stats.entries == 0
+
+
+def test_page_cache_skips_storage_when_ttl_is_zero() -> None:
+    cache = PageCache()
+
+    cache.put("page", "payload", ttl_seconds=0)
+
+    assert cache.get("page") is None
+
+
+def test_sources_share_cache_by_request_url() -> None:
+    http_client = CountingHttpClient()
+    cache = PageCache()
+
+    def build(slug: str) -> SeongbukSource:
+        return SeongbukSource(
+            slug=slug,
+            municipality="성북구",
+            source_type=SourceType.API,
+            list_url="https://www.sb.go.kr/rss.do?bbsNo=1",
+            timezone=ZoneInfo("Asia/Seoul"),
+            http_client=http_client,
+            max_pages=1,
+            page_cache=cache,
+        )
+
+    build("first").fetch(date(2026, 2, 22))
+    build("second").fetch(date(2026, 2, 22))
+
+    assert len(http_client.calls) == 1
+    assert cache.stats().hits == 1
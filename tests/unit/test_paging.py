@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import aclosing
+
+from judgefinder.adapters.sources.paging import aiter_pages, iter_pages
+
+
+def test_iter_pages_without_prefetch_loads_only_consumed_pages() -> None:
+    loaded: list[int] = []
+
+    def load_page(page_index: int) -> str:
+        loaded.append(page_index)
+        return f"page-{page_index}"
+
+    consumed: list[str] = []
+    for payload in iter_pages(load_page, max_pages=5):
+        consumed.append(payload)
+        if payload == "page-2":
+            break
+
+    assert consumed == ["page-1", "page-2"]
+    assert loaded == [1, 2]
+
+
+def test_iter_pages_prefetch_overlaps_next_page_with_processing() -> None:
+    started: dict[int, float] = {}
+    lock = threading.Lock()
+
+    def load_page(page_index: int) -> str:
+        with lock:
+            started[page_index] = time.perf_counter()
+        time.sleep(0.05)
+        return f"page-{page_index}"
+
+    consumed: list[tuple[str, float]] = []
+    for payload in iter_pages(load_page, max_pages=3, prefetch=True):
+        consumed.append((payload, time.perf_counter()))
+        time.sleep(0.05)
+
+    assert [payload for payload, _ in consumed] == ["page-1", "page-2", "page-3"]
+    # Page 2 is requested as soon as page 1 is handed over, not after it is processed.
+    assert started[2] < consumed[0][1] + 0.04
+
+
+def test_iter_pages_prefetch_discards_speculative_page_on_early_stop() -> None:
+    def load_page(page_index: int) -> str:
+        if page_index == 2:
+            raise RuntimeError("speculative page failed")
+        return f"page-{page_index}"
+
+    consumed: list[str] = []
+    for payload in iter_pages(load_page, max_pages=5, prefetch=True):
+        consumed.append(payload)
+        break
+
+    assert consumed == ["page-1"]
+
+
+def test_aiter_pages_prefetch_yields_pages_in_order_and_cancels_leftover() -> None:
+    completed: list[int] = []
+
+    async def load_page(page_index: int) -> str:
+        await asyncio.sleep(0.01 * page_index)
+        completed.append(page_index)
+        return f"page-{page_index}"
+
+    async def consume() -> list[str]:
+        consumed: list[str] = []
+        pages = aiter_pages(load_page, max_pages=5, prefetch=True)
+        async with aclosing(pages):
+            async for payload in pages:
+                consumed.append(payload)
+                if payload == "page-2":
+                    break
+        await asyncio.sleep(0.05)
+        return consumed
+
+    assert asyncio.run(consume()) == ["page-1", "page-2"]
+    assert completed == [1, 2]
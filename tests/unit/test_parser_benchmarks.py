@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks import pages
+from benchmarks.parsers import (
+    CASES,
+    Measurement,
+    ParserCase,
+    compare,
+    load_baseline,
+    save_baseline,
+)
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_every_synthetic_row_is_parsed(case: ParserCase) -> None:
+    # A page the parser only half understands would make the benchmark measure too little.
+    expected = pages.matching_rows(25) if case.keyword_filtered else 25
+    assert case.parse(case.build_page(25), 25) == expected
+
+
+def test_compare_flags_slower_and_heavier_runs(tmp_path: Path) -> None:
+    baseline_path = tmp_path / "parsers.json"
+    save_baseline(
+        baseline_path,
+        [Measurement("seongbuk", 100, 100, seconds_per_page=0.01, peak_bytes=1_000)],
+    )
+    baseline = load_baseline(baseline_path)
+
+    steady = Measurement("seongbuk", 100, 100, seconds_per_page=0.011, peak_bytes=1_100)
+    slower = Measurement("seongbuk", 100, 100, seconds_per_page=0.02, peak_bytes=1_000)
+    heavier = Measurement("seongbuk", 100, 90, seconds_per_page=0.01, peak_bytes=2_000)
+    unknown = Measurement("municipal_rss", 100, 100, seconds_per_page=1.0, peak_bytes=1)
+
+    assert compare([steady, unknown], baseline, tolerance=0.25) == []
+    assert len(compare([slower], baseline, tolerance=0.25)) == 1
+    assert len(compare([heavier], baseline, tolerance=0.25)) == 2
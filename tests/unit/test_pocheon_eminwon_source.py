@@ -1,15 +1,52 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import date
+from zoneinfo import ZoneInfo
+
 from judgefinder.adapters.sources.pocheon_eminwon.source import (
     DEFAULT_POCHEON_EMINWON_LIST_URL,
+    PocheonEminwonSource,
     _resolve_pocheon_list_url,
 )
+from judgefinder.domain.entities import SourceType
+from tests.fakes import BoardRow, PagedHttpClient
 
+LIST_PAGES = {
+    1: [("2026-02-24", "9003"), ("2026-02-23", "9002")],
+    2: [("2026-02-19", "9001")],
+    3: [("2026-02-18", "9000")],
+}
 
-def test_resolve_pocheon_list_url_rewrites_legacy_rss_url() -> None:
-    resolved = _resolve_pocheon_list_url(
-        "https://www.pocheon.go.kr/rssBbsNtt.do?bbsNo=19"
+
+def _eminwon_list_html(rows: Sequence[BoardRow]) -> str:
+    cells = "".join(
+        f"""
+        <tr>
+          <td>{ntt_no}</td>
+          <td><a href="./selectEminwonView.do?notAncmtMgtNo={ntt_no}">평가위원 모집</a></td>
+          <td>{published}</td>
+        </tr>
+        """
+        for published, ntt_no in rows
+    )
+    return f"<html><table>{cells}</table></html>"
+
+
+def _source(http_client: PagedHttpClient) -> PocheonEminwonSource:
+    return PocheonEminwonSource(
+        slug="pocheon",
+        municipality="포천시",
+        source_type=SourceType.HTML,
+        list_url=DEFAULT_POCHEON_EMINWON_LIST_URL,
+        timezone=ZoneInfo("Asia/Seoul"),
+        http_client=http_client,
+        keywords=("평가위원",),
     )
+
+
+def test_resolve_pocheon_list_url_rewrites_legacy_rss_url() -> None:
+    resolved = _resolve_pocheon_list_url("https://www.pocheon.go.kr/rssBbsNtt.do?bbsNo=19")
     assert resolved == DEFAULT_POCHEON_EMINWON_LIST_URL
 
 
@@ -17,3 +54,19 @@ def test_resolve_pocheon_list_url_keeps_eminwon_url() -> None:
     list_url = "https://www.pocheon.go.kr/www/selectEminwonList.do?key=12563&notAncmtSeCode=01"
     resolved = _resolve_pocheon_list_url(list_url)
     assert resolved == list_url
+
+
+def test_walk_stops_at_the_first_page_older_than_the_range() -> None:
+    http_client = PagedHttpClient(LIST_PAGES, render=_eminwon_list_html)
+
+    notices = _source(http_client).fetch_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    assert [notice.published_date for notice in notices] == [date(2026, 2, 24), date(2026, 2, 23)]
+    assert len(http_client.calls) == 2
+
+
+def test_walk_stops_on_page_one_when_nothing_is_new_enough() -> None:
+    http_client = PagedHttpClient(LIST_PAGES, render=_eminwon_list_html)
+
+    assert _source(http_client).fetch(date(2026, 3, 2)) == []
+    assert len(http_client.calls) == 1
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+
+from judgefinder.application.polling import PollingCollector
+from judgefinder.domain.entities import Notice
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingCollect:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, slugs: Sequence[str]) -> list[Notice]:
+        self.calls.append(list(slugs))
+        return []
+
+
+def test_sources_are_polled_on_their_own_intervals() -> None:
+    clock = FakeClock()
+    collect = RecordingCollect()
+    collector = PollingCollector(collect, {"fast": 60.0, "slow": 300.0}, clock=clock)
+
+    collector.run_due()
+    clock.now = 60.0
+    collector.run_due()
+    clock.now = 120.0
+    collector.run_due()
+    clock.now = 300.0
+    collector.run_due()
+
+    assert collect.calls == [["fast", "slow"], ["fast"], ["fast"], ["fast", "slow"]]
+
+
+def test_seconds_until_due_tracks_the_nearest_source() -> None:
+    clock = FakeClock()
+    collector = PollingCollector(RecordingCollect(), {"a": 60.0, "b": 30.0}, clock=clock)
+
+    assert collector.seconds_until_due() == 0.0
+    collector.run_due()
+    clock.now = 10.0
+
+    assert collector.seconds_until_due() == 20.0
+
+
+def test_reschedule_keeps_last_poll_and_polls_new_sources_at_once() -> None:
+    clock = FakeClock()
+    collect = RecordingCollect()
+    collector = PollingCollector(collect, {"kept": 600.0, "dropped": 60.0}, clock=clock)
+    collector.run_due()
+
+    clock.now = 100.0
+    collector.reschedule({"kept": 120.0, "added": 60.0})
+
+    assert collector.due_slugs() == ["added"]
+    clock.now = 120.0
+    assert collector.due_slugs() == ["kept", "added"]
+
+
+def test_run_forever_stops_when_event_is_set() -> None:
+    stop = threading.Event()
+    polled: list[list[str]] = []
+
+    def collect(slugs: Sequence[str]) -> list[Notice]:
+        polled.append(list(slugs))
+        stop.set()
+        return []
+
+    PollingCollector(collect, {"only": 3600.0}).run_forever(stop, idle_seconds=0.01)
+
+    assert polled == [["only"]]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pstats
+import time
+from pathlib import Path
+
+from judgefinder.domain.tracing import TraceRecorder, trace_scope, trace_span
+from judgefinder.infrastructure.profiling import StageProfiler
+
+
+def _parse_rows() -> list[str]:
+    return [f"row {index}" for index in range(2_000)]
+
+
+def _fetch_page() -> str:
+    time.sleep(0.02)
+    with trace_span("parse", category="parse"):
+        rows = _parse_rows()
+    return "\n".join(rows)
+
+
+def _functions(path: Path) -> set[str]:
+    stats = pstats.Stats(str(path))
+    return {function for _, _, function in stats.stats}  # type: ignore[attr-defined]
+
+
+def test_stage_profiler_bills_nested_spans_to_their_own_stage(tmp_path: Path) -> None:
+    profiler = StageProfiler(tmp_path / "profile")
+    recorder = TraceRecorder()
+    try:
+        profiler.checkpoint("start")
+        with trace_scope(recorder), trace_scope(profiler):
+            with trace_span("load config", category="config"):
+                pass
+            with trace_span("fetch", category="source"):
+                _fetch_page()
+            with trace_span("save notices", category="db"):
+                pass
+        profiler.checkpoint("command")
+        written = profiler.write()
+    finally:
+        profiler.close()
+
+    totals = profiler.totals()
+    assert list(totals) == ["config_load", "fetch", "parse", "persist"]
+    assert [totals[stage].spans for stage in totals] == [1, 1, 1, 1]
+    # The sleep belongs to fetch alone; the nested parse span is billed separately.
+    assert totals["fetch"].seconds >= 0.02
+    # Both sinks saw every span.
+    assert [span.name for span in recorder.spans] == [
+        "load config",
+        "parse",
+        "fetch",
+        "save notices",
+    ]
+
+    names = {path.name for path in written}
+    assert {"fetch.pstats", "parse.pstats", "summary.txt", "allocations.txt"} <= names
+    assert "_parse_rows" in _functions(tmp_path / "profile" / "parse.pstats")
+    fetch_functions = _functions(tmp_path / "profile" / "fetch.pstats")
+    assert "_fetch_page" in fetch_functions
+    assert "_parse_rows" not in fetch_functions
+    summary = (tmp_path / "profile" / "summary.txt").read_text(encoding="utf-8")
+    assert "== parse: top" in summary
+    assert "== command: top" in (tmp_path / "profile" / "allocations.txt").read_text(
+        encoding="utf-8"
+    )
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+
+from judgefinder.adapters.sources import paging
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.entities import SourceRunStatus
+from judgefinder.infrastructure.http.rate_limit import (
+    DailyQuotaExceededError,
+    HostRateLimit,
+    HostRateLimiter,
+    RateLimitedHttpClient,
+)
+from judgefinder.infrastructure.http.retry import RetryPolicy
+from tests.fakes import PagedHttpClient, StubRepository, board_source
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass(slots=True)
+class InMemoryQuotaStore:
+    counts: dict[str, int] = field(default_factory=dict)
+    threads: list[int] = field(default_factory=list)
+
+    def consume(self, host: str, quota: int) -> None:
+        self.threads.append(threading.get_ident())
+        if self.counts.get(host, 0) >= quota:
+            raise DailyQuotaExceededError(host, quota)
+        self.counts[host] = self.counts.get(host, 0) + 1
+
+    def used(self, host: str) -> int:
+        return self.counts.get(host, 0)
+
+
+@dataclass(slots=True)
+class RecordingCircuitBreaker:
+    failures: list[str] = field(default_factory=list)
+
+    def allow(self, source_slug: str) -> bool:
+        _ = source_slug
+        return True
+
+    def record_success(self, source_slug: str) -> None:
+        _ = source_slug
+
+    def record_failure(self, source_slug: str) -> None:
+        self.failures.append(source_slug)
+
+
+def test_host_rate_limit_is_derived_from_throttle_seconds() -> None:
+    assert HostRateLimit.from_throttle(0.0) is None
+
+    limit = HostRateLimit.from_throttle(0.5, burst=2)
+
+    assert limit == HostRateLimit(rate_per_second=2.0, burst=2, daily_quota=0)
+
+
+def test_token_bucket_allows_burst_then_spaces_requests() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(clock=clock)
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=2.0, burst=2))
+
+    assert limiter.reserve("city.go.kr") == 0.0
+    assert limiter.reserve("city.go.kr") == 0.0
+    assert limiter.reserve("city.go.kr") == pytest.approx(0.5)
+    assert limiter.reserve("city.go.kr") == pytest.approx(1.0)
+
+    clock.now += 5.0
+    assert limiter.reserve("city.go.kr") == 0.0
+
+
+def test_unconfigured_hosts_are_not_delayed_by_a_throttled_host() -> None:
+    limiter = HostRateLimiter()
+    limiter.configure("slow.go.kr", HostRateLimit(rate_per_second=5.0, burst=1))
+    limiter.acquire("slow.go.kr")
+
+    started = time.perf_counter()
+    for _ in range(20):
+        limiter.acquire("fast.go.kr")
+
+    assert time.perf_counter() - started < 0.05
+
+
+def test_configuring_a_host_again_replaces_its_limit() -> None:
+    limiter = HostRateLimiter()
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=2.0, burst=3))
+    limiter.configure("CITY.go.kr", HostRateLimit(rate_per_second=10.0, burst=5, daily_quota=50))
+
+    assert limiter.limit_for("city.go.kr") == HostRateLimit(
+        rate_per_second=10.0,
+        burst=5,
+        daily_quota=50,
+    )
+
+
+def test_replace_all_loosens_limits_and_drops_hosts_left_out() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(clock=clock)
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=1.0, burst=2))
+    limiter.configure("gone.go.kr", HostRateLimit(rate_per_second=1.0))
+    limiter.reserve("city.go.kr")
+    limiter.reserve("city.go.kr")
+
+    limiter.replace_all({"City.go.kr": HostRateLimit(rate_per_second=4.0, burst=4)})
+
+    assert limiter.limit_for("city.go.kr") == HostRateLimit(rate_per_second=4.0, burst=4)
+    assert limiter.limit_for("gone.go.kr") is None
+    # The reload does not refill the bucket that was already spent.
+    assert limiter.reserve("city.go.kr") == pytest.approx(0.25)
+
+
+def test_source_over_its_daily_quota_is_skipped_without_retries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(paging.time, "sleep", sleeps.append)
+    limiter = HostRateLimiter(quota_store=InMemoryQuotaStore())
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=float("inf"), daily_quota=1))
+    transport = PagedHttpClient(
+        {
+            1: [("2026-02-24", "7003")],
+            2: [("2026-02-23", "7002")],
+        }
+    )
+    breaker = RecordingCircuitBreaker()
+    use_case = CollectNoticesUseCase(
+        StubRepository(),
+        [
+            board_source(
+                RateLimitedHttpClient(transport, limiter),
+                retry_policy=RetryPolicy(random_fraction=lambda: 0.0),
+            )
+        ],
+        circuit_breaker=breaker,
+    )
+
+    use_case.execute_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    # Page 1 spends the quota; page 2 is refused before it reaches the network.
+    assert len(transport.calls) == 1
+    assert sleeps == []
+    assert use_case.source_statuses["city"] == SourceRunStatus.SKIPPED
+    assert breaker.failures == []
+
+
+def test_acquire_async_counts_the_quota_off_the_event_loop() -> None:
+    store = InMemoryQuotaStore()
+    limiter = HostRateLimiter(quota_store=store)
+    limiter.configure("city.go.kr", HostRateLimit(rate_per_second=float("inf"), daily_quota=5))
+
+    async def acquire() -> int:
+        await limiter.acquire_async("city.go.kr")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(acquire())
+
+    assert store.used("city.go.kr") == 1
+    assert store.threads and store.threads[0] != loop_thread
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from judgefinder.infrastructure.http.client import RequestsHttpClient
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+    cookies: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        type(self).client_ports.append(self.client_address[1])
+        type(self).cookies.append(self.headers.get("Cookie", ""))
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "JSESSIONID=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        _ = format
+        _ = args
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _RecordingHandler.client_ports = []
+    _RecordingHandler.cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_without_session_reuse_connection_and_drop_cookies(server_url: str) -> None:
+    client = RequestsHttpClient()
+    try:
+        for page in range(3):
+            assert client.get_text(f"{server_url}/list?page={page}") == "ok"
+    finally:
+        client.close()
+
+    assert len(set(_RecordingHandler.client_ports)) == 1
+    assert _RecordingHandler.cookies == ["", "", ""]
+
+
+def test_requests_with_session_keep_cookies(server_url: str) -> None:
+    client = RequestsHttpClient()
+    try:
+        client.get_text(f"{server_url}/list", use_session=True)
+        client.get_text(f"{server_url}/list", use_session=True)
+        client.get_text(f"{server_url}/list")
+    finally:
+        client.close()
+
+    assert _RecordingHandler.cookies == ["", "JSESSIONID=abc", ""]
+
+
+def test_requests_http_client_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError):
+        RequestsHttpClient(pool_maxsize=0)
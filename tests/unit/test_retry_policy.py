@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import pytest
+import requests
+
+from judgefinder.adapters.sources.paging import load_text_with_retries
+from judgefinder.infrastructure.http.client import HttpResponse
+from judgefinder.infrastructure.http.retry import RetryBudget, RetryPolicy
+
+
+class FlakyHttpClient:
+    def __init__(self, failures: list[Exception]) -> None:
+        self.failures = list(failures)
+        self.calls = 0
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        _ = url
+        _ = timeout_seconds
+        _ = headers
+        _ = use_session
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return "ok"
+
+    def get_response(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> HttpResponse:
+        return HttpResponse(
+            status_code=200,
+            text=self.get_text(url, timeout_seconds, headers, use_session),
+            headers={},
+            url=url,
+        )
+
+
+def _http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+def _load(http_client: FlakyHttpClient, policy: RetryPolicy) -> str:
+    return load_text_with_retries(
+        http_client,
+        "https://city.go.kr/list",
+        description="city",
+        max_retries=3,
+        timeout_seconds=1.0,
+        headers=None,
+        use_session=False,
+        retry_policy=policy,
+    )
+
+
+def test_retry_policy_backs_off_exponentially_up_to_the_cap() -> None:
+    policy = RetryPolicy(base_delay_seconds=0.5, max_delay_seconds=1.5, random_fraction=lambda: 1.0)
+    error = _http_error(503)
+
+    delays = [policy.next_delay(error, attempt=attempt, max_attempts=10) for attempt in (1, 2, 3)]
+
+    assert delays == [0.5, 1.0, 1.5]
+    assert policy.next_delay(error, attempt=10, max_attempts=10) is None
+
+
+def test_retry_policy_applies_full_jitter() -> None:
+    policy = RetryPolicy(base_delay_seconds=2.0, random_fraction=lambda: 0.25)
+
+    assert policy.next_delay(ConnectionError(), attempt=2, max_attempts=3) == 1.0
+
+
+def test_client_errors_are_not_retried_except_transient_ones() -> None:
+    policy = RetryPolicy(base_delay_seconds=0.0)
+    not_found = FlakyHttpClient([_http_error(404)])
+
+    with pytest.raises(requests.HTTPError):
+        _load(not_found, policy)
+
+    throttled = FlakyHttpClient([_http_error(429), _http_error(503)])
+    assert _load(throttled, policy) == "ok"
+    assert not_found.calls == 1
+    assert throttled.calls == 3
+
+
+def test_retry_budget_is_shared_across_requests() -> None:
+    policy = RetryPolicy(base_delay_seconds=0.0, budget=RetryBudget(1))
+
+    assert _load(FlakyHttpClient([ConnectionError("reset")]), policy) == "ok"
+    exhausted = FlakyHttpClient([ConnectionError("reset")])
+    with pytest.raises(ConnectionError):
+        _load(exhausted, policy)
+
+    assert exhausted.calls == 1
+    assert policy.budget is not None
+    assert policy.budget.remaining == 0
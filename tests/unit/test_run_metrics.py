@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date
+
+import pytest
+import requests
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.adapters.sources.page_cache import PageCache
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.run_metrics import RunMetrics
+from judgefinder.infrastructure.http.retry import RetryPolicy
+from judgefinder.interfaces.cli.main import _format_metrics_table
+from tests.fakes import PagedHttpClient, StubRepository, board_source, page_index_of
+
+LIST_PAGES = {
+    1: [("2026-02-24", "7003", "평가위원 모집"), ("2026-02-23", "7002", "평가위원 모집")],
+    2: [("2026-02-22", "7001", "평가위원 모집"), ("2026-02-21", "7000", "도로명주소 고시")],
+    3: [("2026-02-19", "6999", "평가위원 모집")],
+}
+
+
+class FlakyPagedHttpClient(PagedHttpClient):
+    """Serves LIST_PAGES, failing the first request for page 1 once."""
+
+    def __init__(self) -> None:
+        super().__init__(LIST_PAGES)
+        self._failed = False
+
+    def get_text(
+        self,
+        url: str,
+        timeout_seconds: float = 10.0,
+        headers: Mapping[str, str] | None = None,
+        use_session: bool = False,
+    ) -> str:
+        if page_index_of(url) == 1 and not self._failed:
+            self._failed = True
+            raise requests.ConnectionError("connection reset")
+        return super().get_text(url, timeout_seconds, headers, use_session)
+
+
+def _generic_source(
+    http_client: FlakyPagedHttpClient, page_cache: PageCache
+) -> GenericEngineSource:
+    return board_source(
+        http_client,
+        retry_policy=RetryPolicy(random_fraction=lambda: 0.0),
+        page_cache=page_cache,
+    )
+
+
+def test_collect_records_fetch_parse_and_persist_metrics_per_source_and_date() -> None:
+    http_client = FlakyPagedHttpClient()
+    page_cache = PageCache()
+    use_case = CollectNoticesUseCase(
+        StubRepository(),
+        [_generic_source(http_client, page_cache)],
+    )
+
+    use_case.execute_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    metrics = use_case.metrics.for_source("city")
+    assert metrics.pages_fetched == 3
+    assert metrics.retries == 1
+    assert metrics.cache_hits == 0
+    assert metrics.bytes_downloaded == sum(
+        len(payload.encode("utf-8")) for payload in http_client.payloads
+    )
+    assert metrics.candidates_seen == 5
+    assert metrics.candidates_kept == 3
+    assert sorted(metrics.dates) == [date(2026, 2, 22), date(2026, 2, 23), date(2026, 2, 24)]
+    assert metrics.fetch_seconds > 0
+    assert metrics.persist_seconds == pytest.approx(
+        sum(day.persist_seconds for day in metrics.dates.values())
+    )
+
+    # A second run starts from fresh metrics and is served by the page cache.
+    use_case.execute_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    metrics = use_case.metrics.for_source("city")
+    assert metrics.pages_fetched == 0
+    assert metrics.cache_hits == 3
+    assert metrics.bytes_downloaded == 0
+    assert metrics.candidates_kept == 3
+
+
+def test_run_metrics_share_persist_time_and_sort_by_cost() -> None:
+    metrics = RunMetrics()
+    metrics.for_source("cheap").record_page(size_bytes=100, seconds=0.1, retries=0)
+    metrics.for_source("slow").record_page(size_bytes=4096, seconds=2.0, retries=2)
+
+    metrics.record_persist(
+        0.4,
+        {
+            ("cheap", date(2026, 2, 23)): 1,
+            ("slow", date(2026, 2, 23)): 1,
+            ("slow", date(2026, 2, 24)): 2,
+        },
+    )
+
+    slow = metrics.for_source("slow")
+    assert slow.persist_seconds == pytest.approx(0.3)
+    assert slow.dates[date(2026, 2, 24)].persist_seconds == pytest.approx(0.2)
+    assert [source.source_slug for source in metrics.by_cost()] == ["slow", "cheap"]
+
+    summary = metrics.to_dict()
+    assert summary["totals"]["bytes_downloaded"] == 4196
+    assert summary["totals"]["retries"] == 2
+    assert summary["totals"]["persist_seconds"] == pytest.approx(0.4)
+    assert summary["sources"][0]["dates"]["2026-02-24"]["persist_seconds"] == pytest.approx(0.2)
+
+    table = _format_metrics_table(metrics)
+    assert [line.split()[0] for line in table[1:]] == ["slow", "cheap"]
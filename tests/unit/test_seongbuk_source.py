@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from judgefinder.adapters.sources.seongbuk.source import SeongbukSource
+from judgefinder.domain.entities import SourceType
+from tests.fakes import BoardRow, PagedHttpClient
+
+FEED_PAGES = {
+    1: [("2026-02-24", "1003"), ("2026-02-23", "1002")],
+    2: [("2026-02-19", "1001")],
+    3: [("2026-02-18", "1000")],
+}
+
+
+def _rss(rows: Sequence[BoardRow]) -> str:
+    items = "".join(
+        f"""
+        <item>
+          <title>제안서 평가위원(후보자) 공개모집 공고</title>
+          <regdate>{published}</regdate>
+          <link>/www/notice/{notice_no}</link>
+        </item>
+        """
+        for published, notice_no in rows
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss><channel>{items}</channel></rss>'
+
+
+def _source(http_client: PagedHttpClient) -> SeongbukSource:
+    return SeongbukSource(
+        slug="seongbuk",
+        municipality="성북구",
+        source_type=SourceType.HTML,
+        list_url="https://www.sb.go.kr/www/rss.do?key=6",
+        timezone=ZoneInfo("Asia/Seoul"),
+        http_client=http_client,
+    )
+
+
+def test_walk_stops_at_the_first_page_older_than_the_range() -> None:
+    http_client = PagedHttpClient(FEED_PAGES, render=_rss, page_param="pageNo")
+
+    notices = _source(http_client).fetch_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    assert [notice.published_date for notice in notices] == [date(2026, 2, 24), date(2026, 2, 23)]
+    assert len(http_client.calls) == 2
+
+
+def test_walk_stops_on_page_one_when_nothing_is_new_enough() -> None:
+    http_client = PagedHttpClient(FEED_PAGES, render=_rss, page_param="pageNo")
+
+    assert _source(http_client).fetch(date(2026, 3, 2)) == []
+    assert len(http_client.calls) == 1
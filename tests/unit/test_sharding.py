@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+import pytest
+
+from judgefinder.application.use_cases import CoverageIssue, VerifyShardCoverageUseCase
+from judgefinder.domain.entities import SourceRun, SourceRunStatus
+from judgefinder.domain.sharding import ShardSpec, assign_shards
+
+SLUGS = [f"city{index:02d}" for index in range(40)]
+
+
+@dataclass(slots=True)
+class InMemoryRunLog:
+    runs: list[SourceRun] = field(default_factory=list)
+
+    def save_runs(self, runs: list[SourceRun]) -> None:
+        self.runs.extend(runs)
+
+    def list_runs(self, start_date: date, end_date: date) -> list[SourceRun]:
+        return [run for run in self.runs if start_date <= run.target_date <= end_date]
+
+    def average_costs(self) -> dict[str, float]:
+        return {}
+
+
+def _run(slug: str, shard: str, status: SourceRunStatus = SourceRunStatus.OK) -> SourceRun:
+    return SourceRun(
+        source_slug=slug,
+        target_date=date(2026, 3, 1),
+        shard=shard,
+        status=status,
+        duration_seconds=1.0,
+        notice_count=0,
+        finished_at=datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc),
+    )
+
+
+def test_parse_rejects_out_of_range_shards() -> None:
+    assert ShardSpec.parse("2/4") == ShardSpec(index=2, count=4)
+    for raw in ("0/4", "5/4", "2", "a/b"):
+        with pytest.raises(ValueError):
+            ShardSpec.parse(raw)
+
+
+def test_every_slug_lands_on_exactly_one_shard() -> None:
+    slices = [ShardSpec(index, 3).select(SLUGS) for index in range(1, 4)]
+
+    assert sorted(slug for shard_slice in slices for slug in shard_slice) == SLUGS
+    assert all(shard_slice for shard_slice in slices)
+
+
+def test_assignment_is_deterministic_and_keeps_configured_order() -> None:
+    first = ShardSpec(2, 3).select(SLUGS)
+
+    assert first == ShardSpec(2, 3).select(list(SLUGS))
+    assert first == [slug for slug in SLUGS if slug in set(first)]
+
+
+def test_growing_the_shard_count_only_moves_slugs_to_the_new_shard() -> None:
+    before = assign_shards(SLUGS, 3)
+    after = assign_shards(SLUGS, 4)
+
+    moved = [slug for slug in SLUGS if before[slug] != after[slug]]
+    assert moved
+    assert all(after[slug] == 4 for slug in moved)
+
+
+def test_costs_balance_the_load_across_shards() -> None:
+    costs = {"heavy": 30.0, "medium": 20.0, "light1": 10.0, "light2": 10.0, "light3": 10.0}
+
+    assignment = assign_shards(list(costs), 2, costs=costs)
+
+    loads = dict.fromkeys((1, 2), 0.0)
+    for slug, shard in assignment.items():
+        loads[shard] += costs[slug]
+    assert loads == {1: 40.0, 2: 40.0}
+
+
+def test_verify_reports_missing_and_duplicated_sources() -> None:
+    run_log = InMemoryRunLog(
+        [
+            _run("once", "1/2"),
+            _run("once", "1/2"),
+            _run("twice", "1/2"),
+            _run("twice", "2/2"),
+            _run("failed", "2/2", SourceRunStatus.FAILED),
+        ]
+    )
+    target_date = date(2026, 3, 1)
+
+    issues = VerifyShardCoverageUseCase(run_log).execute(
+        ["once", "twice", "failed"],
+        target_date,
+        target_date,
+    )
+
+    assert issues == [
+        CoverageIssue("twice", target_date, ("1/2", "2/2")),
+        CoverageIssue("failed", target_date, ()),
+    ]
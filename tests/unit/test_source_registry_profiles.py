@@ -17,6 +17,7 @@ from judgefinder.domain.source_profiles import (
     RequestStrategy,
 )
 from judgefinder.infrastructure.http.client import HttpResponse
+from judgefinder.infrastructure.http.rate_limit import HostRateLimit, HostRateLimiter
 
 
 class DummyHttpClient:
@@ -138,3 +139,36 @@ def test_source_registry_skips_blocked_waf_sources() -> None:
 
     assert len(sources) == 1
     assert isinstance(sources[0], NoopSource)
+
+
+def test_source_registry_configures_host_rate_limit_for_throttled_sources() -> None:
+    source_config = SourceConfig(
+        slug="throttled-city",
+        municipality="Throttled City",
+        source_type=SourceType.HTML,
+        list_url="https://www.throttled.go.kr/www/selectBbsNttList.do?bbsNo=1",
+        fixture_path=None,
+        engine_type=EngineType.GENERIC_EGOV_BBS,
+        access_profile=AccessProfile.THROTTLED,
+        request_strategy=RequestStrategy.from_access_profile(AccessProfile.THROTTLED),
+        fallback_strategy=FallbackStrategy.NONE,
+    )
+    config = AppConfig(
+        timezone="Asia/Seoul",
+        db_path=Path("data/judgefinder.db"),
+        enabled_sources=["throttled-city"],
+        sources={"throttled-city": source_config},
+    )
+    rate_limiter = HostRateLimiter()
+
+    registry = SourceRegistry(
+        config=config,
+        http_client=DummyHttpClient(),
+        timezone=ZoneInfo("Asia/Seoul"),
+        rate_limiter=rate_limiter,
+    )
+    registry.build_enabled_sources()
+
+    limit = rate_limiter.limit_for("www.throttled.go.kr")
+    assert limit is not None
+    assert limit == HostRateLimit(rate_per_second=1 / 0.3, burst=1, daily_quota=0)
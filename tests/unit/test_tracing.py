@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import Any
+
+import pytest
+
+from judgefinder.adapters.sources.generic_engine.source import GenericEngineSource
+from judgefinder.application.use_cases import CollectNoticesUseCase
+from judgefinder.domain.tracing import TraceRecorder, trace_lane, trace_scope, trace_span
+from tests.fakes import PagedHttpClient, StubRepository, board_source
+
+LIST_PAGES = {
+    1: [("2026-02-24", "7003"), ("2026-02-23", "7002")],
+    2: [("2026-02-22", "7001")],
+    3: [("2026-02-19", "6999")],
+}
+
+
+def _generic_source(slug: str) -> GenericEngineSource:
+    return board_source(PagedHttpClient(LIST_PAGES), slug=slug, prefetch_pages=True)
+
+
+def _lanes(trace: dict[str, Any]) -> dict[tuple[int, int], tuple[str, str]]:
+    events = trace["traceEvents"]
+    groups = {
+        event["pid"]: event["args"]["name"] for event in events if event["name"] == "process_name"
+    }
+    return {
+        (event["pid"], event["tid"]): (groups[event["pid"]], event["args"]["name"])
+        for event in events
+        if event["name"] == "thread_name"
+    }
+
+
+def _spans_by_lane(trace: dict[str, Any]) -> dict[tuple[str, str], list[str]]:
+    lanes = _lanes(trace)
+    spans: dict[tuple[str, str], list[str]] = {}
+    for event in trace["traceEvents"]:
+        if event["ph"] == "X":
+            spans.setdefault(lanes[(event["pid"], event["tid"])], []).append(event["name"])
+    return spans
+
+
+@pytest.mark.parametrize("runner", ["threads", "asyncio"])
+def test_collect_trace_puts_each_source_and_page_on_its_own_lane(runner: str) -> None:
+    use_case = CollectNoticesUseCase(
+        StubRepository(),
+        [_generic_source("alpha"), _generic_source("beta")],
+        max_workers=2,
+    )
+    recorder = TraceRecorder()
+
+    with trace_scope(recorder):
+        if runner == "asyncio":
+            asyncio.run(use_case.execute_range_async(date(2026, 2, 20), date(2026, 2, 24)))
+        else:
+            use_case.execute_range(date(2026, 2, 20), date(2026, 2, 24))
+
+    spans = _spans_by_lane(recorder.to_chrome_trace())
+    for slug in ("alpha", "beta"):
+        assert spans[(slug, "source")] == ["fetch"] + ["parse", "filter"] * 3
+        for page_index in (1, 2, 3):
+            assert spans[(slug, f"page {page_index}")] == ["GET"]
+    assert spans[("collect", "run")] == ["fetch sources"]
+    assert spans[("collect", "db")] == ["save notices"]
+
+
+def test_trace_spans_record_errors_and_nothing_without_recorder() -> None:
+    with trace_span("GET", category="http"):
+        pass
+
+    recorder = TraceRecorder()
+    with (
+        trace_scope(recorder),
+        trace_lane("page 1", group="alpha"),
+        pytest.raises(TimeoutError),
+        trace_span("GET", category="http", url="https://a"),
+    ):
+        raise TimeoutError("slow host")
+
+    (span,) = recorder.spans
+    assert (span.group, span.lane, span.name) == ("alpha", "page 1", "GET")
+    assert span.args == {"url": "https://a", "error": "TimeoutError"}
+    event = next(event for event in recorder.to_chrome_trace()["traceEvents"] if event["ph"] == "X")
+    assert event["cat"] == "http"
+    assert event["dur"] >= 0